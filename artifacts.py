@@ -0,0 +1,149 @@
+"""
+Pipeline artifact (screenshot dan page source) yang ditulis di background.
+
+Test cukup memanggil screenshot()/page_source(); pengambilan data dari browser
+tetap terjadi di thread test, tetapi decode base64, kompresi gzip untuk HTML,
+dan penulisan ke disk dilakukan thread writer secara batch.
+
+Kebijakan pengambilan diatur dengan environment variable ARTIFACT_POLICY:
+- "always"     : setiap capture langsung diantrekan untuk ditulis
+- "on_failure" : capture selama test diabaikan; satu screenshot dan page source
+                 diambil hanya ketika test gagal (default)
+- "ring"       : N capture terakhir (ARTIFACT_RING_SIZE, default 5) disimpan di
+                 memori dan baru ditulis ketika test gagal
+"""
+import atexit
+import base64
+import gzip
+import os
+import queue
+import threading
+from collections import deque
+
+POLICIES = ("always", "on_failure", "ring")
+BATCH_SIZE = 16
+
+class ArtifactCollector:
+    """Mengumpulkan screenshot dan page source lalu menulisnya di background"""
+
+    def __init__(self, folder, policy=None, ring_size=None):
+        self.folder = folder
+        self.policy = (policy or os.environ.get("ARTIFACT_POLICY", "on_failure")).lower()
+        if self.policy not in POLICIES:
+            raise ValueError(f"ARTIFACT_POLICY tidak dikenal: {self.policy} (pilihan: {', '.join(POLICIES)})")
+        ring_size = ring_size or int(os.environ.get("ARTIFACT_RING_SIZE", "5"))
+        self.ring = deque(maxlen=ring_size)
+        # Path artifact milik test yang sedang berjalan (untuk laporan hasil)
+        self.test_refs = []
+        self.written = 0
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="artifact-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    # --- Capture ------------------------------------------------------------
+
+    def _path(self, filename):
+        return filename if os.path.isabs(filename) else os.path.join(self.folder, filename)
+
+    @staticmethod
+    def _grab_screenshot(driver):
+        """Mengambil screenshot sebagai base64 (tanpa decode di thread test)"""
+        grab = getattr(driver, "get_screenshot_as_base64", None)
+        if grab is None:
+            return None
+        try:
+            return grab()
+        except Exception as e:
+            print(f"❌ Gagal mengambil screenshot: {e}")
+            return None
+
+    def _capture(self, kind, path, grab):
+        if self.policy == "on_failure":
+            return None
+        data = grab()
+        if data is None:
+            return None
+        if self.policy == "ring":
+            self.ring.append((kind, path, data))
+        else:
+            self._enqueue(kind, path, data)
+        return path
+
+    def _enqueue(self, kind, path, data):
+        self.test_refs.append(path)
+        self._queue.put((kind, path, data))
+
+    def screenshot(self, driver, filename):
+        """Mencatat screenshot halaman saat ini sesuai kebijakan, mengembalikan path tujuan"""
+        return self._capture("png", self._path(filename), lambda: self._grab_screenshot(driver))
+
+    def page_source(self, driver, filename):
+        """Mencatat source HTML halaman saat ini (disimpan sebagai .gz), mengembalikan path tujuan"""
+        return self._capture("html", self._path(filename) + ".gz", lambda: driver.page_source)
+
+    def finish_test(self, driver, test_name, failed):
+        """Dipanggil di tearDown: simpan artifact kegagalan, kosongkan ring buffer,
+        dan kembalikan path artifact yang ditulis untuk test ini"""
+        if failed:
+            if self.policy == "on_failure":
+                screenshot = self._grab_screenshot(driver)
+                if screenshot is not None:
+                    self._enqueue("png", self._path(f"{test_name}_failure.png"), screenshot)
+                try:
+                    self._enqueue("html", self._path(f"{test_name}_failure.html.gz"), driver.page_source)
+                except Exception as e:
+                    print(f"❌ Gagal mengambil page source: {e}")
+            elif self.policy == "ring":
+                for frame in self.ring:
+                    self._enqueue(*frame)
+                print(f"📸 {len(self.ring)} capture terakhir {test_name} disimpan karena test gagal")
+        self.ring.clear()
+        refs, self.test_refs = self.test_refs, []
+        return refs
+
+    # --- Writer -------------------------------------------------------------
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Ambil item lain yang sudah mengantre agar ditulis dalam satu batch
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for kind, path, data in batch:
+                try:
+                    self._write(kind, path, data)
+                except Exception as e:
+                    print(f"❌ Gagal menyimpan artifact {path}: {e}")
+                finally:
+                    self._queue.task_done()
+
+    def _write(self, kind, path, data):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if kind == "png":
+            with open(path, "wb") as f:
+                f.write(base64.b64decode(data))
+        else:
+            with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(data)
+        self.written += 1
+
+    def flush(self):
+        """Menunggu semua artifact yang mengantre selesai ditulis"""
+        self._queue.join()
+
+def test_failed(test_case):
+    """True jika test yang sedang berjalan gagal/error (dipanggil dari tearDown)"""
+    outcome = getattr(test_case, "_outcome", None)
+    if outcome is None:
+        return False
+    if hasattr(outcome, "errors"):
+        # Python <= 3.10: error dikumpulkan di outcome sampai test selesai
+        return any(exc_info is not None for _, exc_info in outcome.errors)
+    # Python >= 3.11: error langsung dicatat ke TestResult
+    result = outcome.result
+    problems = getattr(result, "failures", []) + getattr(result, "errors", [])
+    return any(test is test_case for test, _ in problems)
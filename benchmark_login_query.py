@@ -0,0 +1,157 @@
+"""
+Benchmark query login sebelum dan sesudah migrasi index username.
+
+Membuat database terpisah (default quiz_pengupil_bench) dengan skema users
+lama dari db/quiz_pengupil.sql, mengisinya dengan 1 juta user, lalu mengukur
+latency query lama (SELECT * tanpa index) dan query baru (kolom seperlunya
+dengan index unik hasil migrate.php) untuk username yang ada dan tidak ada.
+
+Contoh:
+    python benchmark_login_query.py --users 1000000 --lookups 200
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+import db_fixtures
+from load_test import percentile
+
+try:
+    import pymysql
+except ImportError:
+    pymysql = None
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED_BATCH = 10000
+
+# Skema lama dari db/quiz_pengupil.sql (hanya PRIMARY KEY pada id)
+LEGACY_USERS_TABLE_SQL = """CREATE TABLE users (
+    id INT(11) NOT NULL AUTO_INCREMENT,
+    name VARCHAR(70) NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    email VARCHAR(50) NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci"""
+
+# Query login.php dan cek_nama register.php sebelum dan sesudah migrasi
+QUERIES = {
+    "before": {
+        "login": "SELECT * FROM users WHERE username = %s",
+        "cek_nama": "SELECT * FROM users WHERE username = %s",
+    },
+    "after": {
+        "login": "SELECT id, username, password FROM users WHERE username = %s LIMIT 1",
+        "cek_nama": "SELECT EXISTS(SELECT 1 FROM users WHERE username = %s)",
+    },
+}
+
+def bench_username(i):
+    return f"bench_user_{i:07d}"
+
+def seed_users(connection, count):
+    """Mengisi tabel users dengan sejumlah user memakai insert multi-row per batch"""
+    password = db_fixtures.password_hash("password123")
+    start = time.perf_counter()
+    with connection.cursor() as cursor:
+        for offset in range(0, count, SEED_BATCH):
+            rows = [
+                (f"Bench User {i}", bench_username(i), f"{bench_username(i)}@example.com", password)
+                for i in range(offset, min(offset + SEED_BATCH, count))
+            ]
+            cursor.executemany(
+                "INSERT INTO users (name, username, email, password) VALUES (%s, %s, %s, %s)", rows)
+            connection.commit()
+            print(f"\r🌱 {offset + len(rows):,} / {count:,} user", end="", flush=True)
+    print(f"\n✅ Seed selesai dalam {time.perf_counter() - start:.1f} detik")
+
+def measure(connection, query, usernames):
+    """Latency (detik) setiap eksekusi query untuk daftar username"""
+    latencies = []
+    with connection.cursor() as cursor:
+        for username in usernames:
+            start = time.perf_counter()
+            cursor.execute(query, (username,))
+            cursor.fetchall()
+            latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+def run_migration(config):
+    """Menjalankan migrate.php ke database benchmark"""
+    env = dict(os.environ, DB_HOST=config["host"], DB_USER=config["user"],
+               DB_PASSWORD=config["password"], DB_NAME=config["database"])
+    try:
+        subprocess.run(["php", os.path.join(PROJECT_DIR, "migrate.php")], env=env, check=True)
+    except FileNotFoundError:
+        print("❌ PHP tidak ditemukan; migrate.php dibutuhkan untuk membuat index")
+        return False
+    except subprocess.CalledProcessError:
+        print("❌ migrate.php gagal")
+        return False
+    return True
+
+def print_row(phase, name, latencies):
+    mean = sum(latencies) / len(latencies) * 1000
+    print(f"{phase:<8}{name:<28}{mean:>10.2f}{percentile(latencies, 50) * 1000:>10.2f}"
+          f"{percentile(latencies, 95) * 1000:>10.2f}{percentile(latencies, 99) * 1000:>10.2f}")
+    return mean
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark query login sebelum/sesudah index username")
+    parser.add_argument("--users", type=int, default=1000000, help="Jumlah user yang di-seed")
+    parser.add_argument("--lookups", type=int, default=200, help="Jumlah query per skenario")
+    parser.add_argument("--database", default="quiz_pengupil_bench", help="Nama database benchmark")
+    parser.add_argument("--keep", action="store_true", help="Jangan hapus database benchmark setelah selesai")
+    args = parser.parse_args(argv)
+
+    if pymysql is None:
+        print("❌ PyMySQL tidak terinstal (pip install -r requirements.txt)")
+        return 1
+
+    config = dict(db_fixtures.db_config(), database=args.database)
+    server = {key: value for key, value in config.items() if key != "database"}
+    connection = pymysql.connect(charset="utf8mb4", **server)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+        cursor.execute(f"CREATE DATABASE `{args.database}`")
+    connection.select_db(args.database)
+    with connection.cursor() as cursor:
+        cursor.execute(LEGACY_USERS_TABLE_SQL)
+
+    try:
+        seed_users(connection, args.users)
+        rng = random.Random(42)
+        lookups = {
+            "user ada": [bench_username(rng.randrange(args.users)) for _ in range(args.lookups)],
+            "user tidak ada": [f"nouser_{i}" for i in range(args.lookups)],
+        }
+
+        print(f"\n{'Fase':<8}{'Query':<28}{'rata2 ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        means = {}
+        for phase in ("before", "after"):
+            if phase == "after":
+                connection.commit()
+                if not run_migration(config):
+                    return 1
+            for query_name, query in QUERIES[phase].items():
+                for label, usernames in lookups.items():
+                    name = f"{query_name} ({label})"
+                    means[(phase, name)] = print_row(phase, name, measure(connection, query, usernames))
+
+        print("\nPercepatan rata-rata:")
+        for (phase, name), before in means.items():
+            if phase == "before":
+                after = means[("after", name)]
+                print(f"   {name:<26} {before / after:8.1f}x")
+    finally:
+        if not args.keep:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+        connection.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
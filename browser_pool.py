@@ -0,0 +1,157 @@
+"""
+Pool browser Chrome yang dipakai bersama oleh kelas-kelas test dalam satu proses.
+
+Menjalankan Chrome dan mencari ChromeDriver (ChromeDriverManager().install())
+adalah biaya tetap yang besar. Pool ini membuat driver sekali per proses,
+menyerahkannya ke setUpClass yang membutuhkan, lalu saat dikembalikan
+membersihkan cookie dan storage alih-alih menutup browser.
+"""
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Lokasi ChromeDriver lokal yang dicoba sebelum WebDriver Manager
+LOCAL_CHROMEDRIVERS = [
+    os.path.join(PROJECT_DIR, "chromedriver-win64", "chromedriver.exe"),
+    os.path.join(PROJECT_DIR, "chromedriver-linux64", "chromedriver"),
+]
+
+def chrome_options():
+    """Opsi Chrome yang sama untuk semua kelas test"""
+    options = Options()
+    options.add_argument("--headless")  # Jalankan dalam mode headless
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")  # Atur ukuran window
+    options.add_argument("--incognito")  # Gunakan mode incognito untuk menghindari cache dan cookie
+    return options
+
+@lru_cache(maxsize=None)
+def chromedriver_path():
+    """Mencari path ChromeDriver sekali per proses; None berarti pakai Selenium Manager"""
+    for path in LOCAL_CHROMEDRIVERS:
+        if os.path.exists(path):
+            print(f"✅ Menggunakan ChromeDriver lokal dari: {path}")
+            return path
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        print("✅ Menggunakan ChromeDriver dari WebDriver Manager")
+        return path
+    except ImportError:
+        print("⚠️ WebDriver Manager tidak tersedia, menggunakan cara default")
+        return None
+
+def start_driver():
+    """Menjalankan satu instance Chrome baru"""
+    path = chromedriver_path()
+    if path:
+        return webdriver.Chrome(service=Service(executable_path=path), options=chrome_options())
+    return webdriver.Chrome(options=chrome_options())
+
+def reset_driver(driver):
+    """Membersihkan cookie, localStorage, dan sessionStorage tanpa menutup browser"""
+    try:
+        driver.delete_all_cookies()
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.get("about:blank")
+        return True
+    except WebDriverException as e:
+        print(f"⚠️ Gagal membersihkan state browser: {e}")
+        return False
+
+class BrowserPool:
+    """Kumpulan driver Chrome yang sudah berjalan dan siap dipakai ulang"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = []
+        self._starting = []
+        self._all = []
+        self._executor = None
+
+    def warm(self, count=1):
+        """Mulai menjalankan sejumlah browser di background sebelum dibutuhkan"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(count, 1),
+                                                    thread_name_prefix="browser-pool")
+            missing = count - len(self._idle) - len(self._starting)
+            for _ in range(max(missing, 0)):
+                self._starting.append(self._executor.submit(start_driver))
+
+    def acquire(self, implicit_wait=0):
+        """Mengambil driver siap pakai dari pool, membuat baru jika kosong"""
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            future = self._starting.pop(0) if driver is None and self._starting else None
+
+        if driver is None:
+            driver = future.result() if future is not None else start_driver()
+            with self._lock:
+                self._all.append(driver)
+
+        driver.implicitly_wait(implicit_wait)
+        return driver
+
+    def release(self, driver):
+        """Mengembalikan driver ke pool setelah state-nya dibersihkan"""
+        if driver not in self._all:
+            driver.quit()
+            return
+        if reset_driver(driver):
+            with self._lock:
+                self._idle.append(driver)
+        else:
+            # Browser bermasalah, jangan dipakai ulang
+            self.discard(driver)
+
+    def discard(self, driver):
+        """Menutup driver dan mengeluarkannya dari pool"""
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+            if driver in self._idle:
+                self._idle.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def shutdown(self):
+        """Menutup semua browser di pool (dipanggil otomatis saat proses selesai)"""
+        with self._lock:
+            starting, self._starting = self._starting, []
+        for future in starting:
+            try:
+                driver = future.result()
+            except Exception:
+                continue
+            with self._lock:
+                self._all.append(driver)
+        for driver in list(self._all):
+            self.discard(driver)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+_pool = None
+
+def get_pool():
+    """Pool browser milik proses ini"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+        atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,52 @@
+<?php
+/**
+ * Kalibrasi cost bcrypt untuk server ini
+ * Mengukur waktu password_verify untuk setiap cost dan memilih cost tertinggi
+ * yang median waktunya masih di bawah target.
+ *
+ * Penggunaan: php calibrate_password_cost.php [--target-ms=100] [--samples=5] [--min-cost=8] [--max-cost=16]
+ */
+
+$settings = array('target-ms' => 100, 'samples' => 5, 'min-cost' => 8, 'max-cost' => 16);
+foreach (array_slice($argv, 1) as $arg) {
+    if (preg_match('/^--([a-z-]+)=(\d+(?:\.\d+)?)$/', $arg, $match) && isset($settings[$match[1]])) {
+        $settings[$match[1]] = $match[2] + 0;
+    } else {
+        fwrite(STDERR, "Argumen tidak dikenal: $arg\n");
+        exit(1);
+    }
+}
+
+$password = 'CalibrationPassword123';
+$chosen = null;
+
+echo "Target waktu verifikasi: {$settings['target-ms']} ms\n";
+for ($cost = $settings['min-cost']; $cost <= $settings['max-cost']; $cost++) {
+    $hash = password_hash($password, PASSWORD_DEFAULT, array('cost' => $cost));
+
+    $timings = array();
+    for ($i = 0; $i < $settings['samples']; $i++) {
+        $start = microtime(true);
+        password_verify($password, $hash);
+        $timings[] = (microtime(true) - $start) * 1000;
+    }
+    sort($timings);
+    $median = $timings[intdiv(count($timings), 2)];
+
+    $within = $median <= $settings['target-ms'];
+    printf("cost %2d: median %8.1f ms %s\n", $cost, $median, $within ? 'OK' : '(melebihi target)');
+    if (!$within) {
+        // Waktu bcrypt naik dua kali lipat per cost, cost berikutnya pasti lebih lambat
+        break;
+    }
+    $chosen = $cost;
+}
+
+if ($chosen === null) {
+    echo "Tidak ada cost >= {$settings['min-cost']} yang memenuhi target.\n";
+    exit(1);
+}
+
+echo "\nCost yang disarankan: $chosen\n";
+echo "Set environment variable PASSWORD_COST=$chosen untuk server PHP.\n";
+echo "Hash lama akan di-upgrade otomatis saat user berhasil login.\n";
@@ -0,0 +1,46 @@
+<?php
+/**
+ * Migrasi 001: index UNIQUE pada users.username
+ *
+ * Query login dan pengecekan username mencari berdasarkan kolom username.
+ * Dump db/quiz_pengupil.sql lama hanya memiliki PRIMARY KEY pada id sehingga
+ * kedua query tersebut melakukan full table scan, sedangkan setup_test_db.php
+ * sudah membuat username UNIQUE. Migrasi ini menyamakan keduanya.
+ *
+ * Jika tabel sudah berisi username ganda (register.php lama mengecek nama,
+ * bukan username), migrasi berhenti dan menampilkan daftarnya. Jalankan
+ * dengan --dedupe untuk menyisakan baris dengan id terkecil per username.
+ */
+return function (mysqli $conn, array $options) {
+    $result = $conn->query("SHOW INDEX FROM users WHERE Column_name = 'username' AND Non_unique = 0");
+    if ($result && $result->num_rows > 0) {
+        echo "  Index unik pada username sudah ada.\n";
+        return true;
+    }
+
+    $duplicates = $conn->query(
+        "SELECT username, COUNT(*) AS jumlah FROM users GROUP BY username HAVING COUNT(*) > 1"
+    );
+    if ($duplicates && $duplicates->num_rows > 0) {
+        if (!in_array('--dedupe', $options)) {
+            echo "  Username ganda ditemukan:\n";
+            while ($row = $duplicates->fetch_assoc()) {
+                echo "    - {$row['username']} ({$row['jumlah']} baris)\n";
+            }
+            echo "  Hapus duplikat secara manual atau jalankan ulang dengan --dedupe.\n";
+            return false;
+        }
+        $conn->query(
+            "DELETE duplicate FROM users duplicate
+             JOIN users keep ON keep.username = duplicate.username AND keep.id < duplicate.id"
+        );
+        echo "  {$conn->affected_rows} baris duplikat dihapus.\n";
+    }
+
+    if (!$conn->query("ALTER TABLE users ADD UNIQUE KEY username (username)")) {
+        echo "  Gagal membuat index: " . $conn->error . "\n";
+        return false;
+    }
+    echo "  Index unik pada username dibuat.\n";
+    return true;
+};
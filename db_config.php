@@ -0,0 +1,39 @@
+<?php
+/**
+ * Konfigurasi database bersama untuk koneksi.php dan migrate.php
+ * Semua nilai bisa diubah lewat environment variable:
+ * DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PERSISTENT (1/0),
+ * DB_POOL_SIZE (koneksi persistent per proses PHP) dan
+ * DB_IDLE_TIMEOUT (detik sebelum koneksi idle diputus MySQL)
+ *
+ * DB_DRIVER=sqlite memakai file SQLite <DB_SQLITE_DIR>/<DB_NAME>.sqlite
+ * (default folder temp sistem) sebagai pengganti MySQL, lihat db_sqlite.php
+ *
+ * Dengan DB_NAMESPACES=1 request yang membawa header X-DB-Namespace memakai
+ * database DB_NAME__<namespace> milik satu worker test (lihat db_fixtures.py).
+ * Header hanya dipakai pada server development `php -S` (PHP_SAPI cli-server)
+ * untuk request dari localhost; di Apache/FPM header tersebut diabaikan
+ */
+
+// Nilai default CI sama dengan setup_test_db.php
+$ci = getenv('CI') === 'true';
+
+$db_name = getenv('DB_NAME') !== false ? getenv('DB_NAME') : 'quiz_pengupil';
+$namespace = isset($_SERVER['HTTP_X_DB_NAMESPACE']) ? $_SERVER['HTTP_X_DB_NAMESPACE'] : '';
+$local = PHP_SAPI === 'cli-server'
+    && isset($_SERVER['REMOTE_ADDR']) && in_array($_SERVER['REMOTE_ADDR'], array('127.0.0.1', '::1'), true);
+if (getenv('DB_NAMESPACES') === '1' && $local && preg_match('/^[a-z0-9_]{1,32}$/', $namespace)) {
+    $db_name .= '__' . $namespace;
+}
+
+return array(
+    'host'         => getenv('DB_HOST') !== false ? getenv('DB_HOST') : ($ci ? '127.0.0.1' : 'localhost'),
+    'user'         => getenv('DB_USER') !== false ? getenv('DB_USER') : 'root',
+    'password'     => getenv('DB_PASSWORD') !== false ? getenv('DB_PASSWORD') : ($ci ? 'root' : ''),
+    'db'           => $db_name,
+    'driver'       => getenv('DB_DRIVER') ?: 'mysql',
+    'sqlite_path'  => (getenv('DB_SQLITE_DIR') ?: sys_get_temp_dir()) . '/' . $db_name . '.sqlite',
+    'persistent'   => getenv('DB_PERSISTENT') !== '0',
+    'pool_size'    => getenv('DB_POOL_SIZE') !== false ? (int) getenv('DB_POOL_SIZE') : 10,
+    'idle_timeout' => getenv('DB_IDLE_TIMEOUT') !== false ? (int) getenv('DB_IDLE_TIMEOUT') : 60,
+);
@@ -0,0 +1,511 @@
+"""
+Fixture database untuk menyiapkan user test langsung di tabel users.
+
+Membuat user lewat form register.php lambat (banyak round trip browser) dan
+ikut gagal jika register.php bermasalah. Fixture ini menulis user langsung
+ke database dengan hash bcrypt yang kompatibel dengan password_verify PHP,
+lalu menghapus semua user yang dibuat dengan satu query saat proses selesai.
+
+Konfigurasi koneksi mengikuti setup_test_db.php dan dapat diubah dengan
+environment variable DB_HOST, DB_USER, DB_PASSWORD, dan DB_NAME.
+
+Dengan DB_NAMESPACES=1 (di suite dan di server PHP) setiap proses test
+mendapat database sendiri, <DB_NAME>__<namespace>, yang disalin dari database
+template hasil import db/quiz_pengupil.sql. Template dibuat sekali per isi
+file SQL, lalu setiap namespace cukup menyalin tabelnya (CREATE TABLE LIKE +
+INSERT SELECT). Driver mengirim nama namespace lewat header X-DB-Namespace
+yang dibaca db_config.php, dan seluruh namespace dihapus dengan satu
+DROP DATABASE saat proses selesai.
+
+DatabaseSnapshot menyalin tabel users sekali di awal proses lalu
+mengembalikannya setelah setiap kelas test dengan menukar tabel (RENAME
+TABLE atomik), sehingga baris hasil register tidak menumpuk antar run.
+Aktif otomatis bersama namespace, atau dengan DB_RESET=1 pada database
+yang tidak dipakai run lain secara bersamaan.
+
+Dengan DB_DRIVER=sqlite semua fixture memakai file SQLite yang sama dengan
+server PHP (<DB_SQLITE_DIR>/<DB_NAME>.sqlite, lihat db_sqlite.php) sehingga
+suite tidak membutuhkan MySQL sama sekali.
+"""
+import atexit
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import pymysql
+except ImportError:
+    pymysql = None
+
+DB_ERRORS = (sqlite3.Error,) + ((pymysql.MySQLError,) if pymysql is not None else ())
+
+# Hash bcrypt (cost 10, format $2y$ seperti password_hash PHP) untuk password test
+PASSWORD_HASHES = {
+    "TestPassword123": "$2y$10$mDoHP1dTgENOBXgYXIECUOkHgimgXDXQZBy6dxKfPh7aLEFQEzGW2",
+    "password123": "$2y$10$kdZG/5qcsMusqkbx/1wNH.D217hJqiiVBd98mjKsAnjSKNcbXfjlG",
+    "test123": "$2y$10$otnHbVnb56zZfBH.dnrrsuRPxtBrd/QZTMyydI2gAcMzoWcceqxJC",
+}
+
+# Skema yang sama dengan setup_test_db.php
+USERS_TABLE_SQL = """CREATE TABLE IF NOT EXISTS users (
+    id INT(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    username VARCHAR(255) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)"""
+
+def db_config():
+    """Konfigurasi koneksi database, sama dengan setup_test_db.php"""
+    ci = os.environ.get("CI") == "true"
+    return {
+        "host": os.environ.get("DB_HOST", "127.0.0.1" if ci else "localhost"),
+        "user": os.environ.get("DB_USER", "root"),
+        "password": os.environ.get("DB_PASSWORD", "root" if ci else ""),
+        "database": os.environ.get("DB_NAME", "quiz_pengupil"),
+    }
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db", "quiz_pengupil.sql")
+
+# Header yang dibaca db_config.php untuk memilih database namespace
+NAMESPACE_HEADER = "X-DB-Namespace"
+
+def db_driver():
+    """Driver database yang dipakai server PHP: mysql (default) atau sqlite"""
+    return os.environ.get("DB_DRIVER") or "mysql"
+
+def sqlite_path(database):
+    """File SQLite untuk database, sama dengan sqlite_path di db_config.php"""
+    return os.path.join(os.environ.get("DB_SQLITE_DIR") or tempfile.gettempdir(), f"{database}.sqlite")
+
+def password_hash(password):
+    """Mengembalikan hash bcrypt yang bisa diverifikasi oleh password_verify PHP"""
+    if password in PASSWORD_HASHES:
+        return PASSWORD_HASHES[password]
+    try:
+        import bcrypt
+    except ImportError:
+        raise ValueError(f"Tidak ada hash siap pakai untuk password '{password}' dan modul bcrypt tidak terinstal")
+    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=10)).decode()
+    # PHP memakai prefix $2y$, isinya identik dengan $2b$
+    return "$2y$" + hashed[4:]
+
+def schema_statements(path=SCHEMA_FILE):
+    """Statement SQL dari file dump, tanpa baris komentar"""
+    with open(path, encoding="utf-8") as f:
+        lines = [line for line in f if not line.lstrip().startswith("--")]
+    statements = "".join(lines).replace("\r\n", "\n").split(";\n")
+    return [statement.strip().rstrip(";") for statement in statements if statement.strip()]
+
+def sqlite_schema_statements(path=SCHEMA_FILE):
+    """Statement dump MySQL yang diterjemahkan ke SQLite, sama dengan db_sqlite.php"""
+    statements = []
+    for statement in schema_statements(path):
+        # Baris /*!40101 SET ... */ khusus MySQL
+        if statement.startswith("/*!"):
+            continue
+        if statement.upper().startswith("CREATE TABLE"):
+            statement = re.sub(r"\bint\(\d+\) NOT NULL AUTO_INCREMENT", "INTEGER PRIMARY KEY AUTOINCREMENT",
+                               statement, flags=re.I)
+            statement = re.sub(r",\s*PRIMARY KEY \(`\w+`\)", "", statement, flags=re.I)
+            statement = re.sub(r"UNIQUE KEY `\w+` \(", "UNIQUE (", statement, flags=re.I)
+            statement = re.sub(r"\)[^)]*$", ")", statement)
+        statements.append(statement)
+    return statements
+
+class SqliteConnection:
+    """Koneksi sqlite3 dengan antarmuka yang dipakai fixture (cursor() sebagai context manager, %s)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=2, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        exists = self._db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'")
+        if exists.fetchone() is None:
+            # Sama dengan sqlite_connect() di db_sqlite.php: satu proses mengimpor skema
+            with self.transaction():
+                exists = self._db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'")
+                if exists.fetchone() is None:
+                    for statement in sqlite_schema_statements():
+                        self._db.execute(statement)
+
+    @contextmanager
+    def transaction(self):
+        """Transaksi BEGIN IMMEDIATE; ROLLBACK lalu exception diteruskan jika gagal"""
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def cursor(self):
+        return _SqliteCursor(self._db.cursor())
+
+    def close(self):
+        self._db.close()
+
+class _SqliteCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(sql.replace("%s", "?"), params)
+        return self._cursor.rowcount
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+def connect_database(config):
+    """Koneksi autocommit ke database config["database"] sesuai DB_DRIVER"""
+    if db_driver() == "sqlite":
+        return SqliteConnection(sqlite_path(config["database"]))
+    return pymysql.connect(autocommit=True, charset="utf8mb4", **config)
+
+def namespaces_enabled():
+    """Cek apakah database per worker diaktifkan (DB_NAMESPACES=1)"""
+    return os.environ.get("DB_NAMESPACES") == "1"
+
+class DatabaseNamespace:
+    """Database milik satu proses test, disalin dari template db/quiz_pengupil.sql"""
+
+    def __init__(self, config=None, name=None):
+        self.config = config or db_config()
+        worker = os.environ.get("TEST_WORKER_ID", "0")
+        # Nama harus cocok dengan pola yang diterima db_config.php: [a-z0-9_]{1,32}
+        self.name = name or f"w{worker}_{uuid.uuid4().hex[:8]}"
+        self.base = self.config["database"]
+        self.database = f"{self.base}__{self.name}"
+        self.created = False
+
+    def _connect(self):
+        config = {key: value for key, value in self.config.items() if key != "database"}
+        return pymysql.connect(autocommit=True, charset="utf8mb4", **config)
+
+    def template_name(self):
+        """Nama database template; berubah jika isi file SQL berubah"""
+        with open(SCHEMA_FILE, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:8]
+        return f"{self.base}__tpl_{digest}"
+
+    def _ensure_template(self, cursor, template):
+        """Mengimpor db/quiz_pengupil.sql ke database template jika belum ada"""
+        # Lock agar worker yang mulai bersamaan tidak mengimpor template dua kali
+        cursor.execute("SELECT GET_LOCK(%s, 60)", (template,))
+        try:
+            if cursor.execute("SHOW DATABASES LIKE %s", (template,)):
+                return
+            cursor.execute(f"CREATE DATABASE `{template}`")
+            try:
+                cursor.execute(f"USE `{template}`")
+                for statement in schema_statements():
+                    cursor.execute(statement)
+            except pymysql.MySQLError:
+                cursor.execute(f"DROP DATABASE `{template}`")
+                raise
+            print(f"✅ Template database {template} dibuat dari {os.path.basename(SCHEMA_FILE)}")
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (template,))
+
+    def create(self):
+        """Membuat database namespace dari template, True jika berhasil"""
+        if self.created:
+            return True
+        if db_driver() == "sqlite":
+            # File SQLite baru langsung berisi skema dan data db/quiz_pengupil.sql
+            try:
+                connect_database({"database": self.database}).close()
+            except sqlite3.Error as e:
+                print(f"⚠️ Gagal membuat namespace database {self.database}: {e}")
+                return False
+            self.created = True
+            print(f"✅ Namespace database {self.database} dibuat")
+            return True
+        if pymysql is None:
+            print("⚠️ PyMySQL tidak terinstal, namespace database tidak tersedia")
+            return False
+        template = self.template_name()
+        try:
+            connection = self._connect()
+            try:
+                with connection.cursor() as cursor:
+                    self._ensure_template(cursor, template)
+                    cursor.execute(f"CREATE DATABASE `{self.database}`")
+                    cursor.execute(f"SHOW TABLES FROM `{template}`")
+                    for (table,) in cursor.fetchall():
+                        cursor.execute(f"CREATE TABLE `{self.database}`.`{table}` LIKE `{template}`.`{table}`")
+                        cursor.execute(f"INSERT INTO `{self.database}`.`{table}` SELECT * FROM `{template}`.`{table}`")
+            finally:
+                connection.close()
+        except (*DB_ERRORS, OSError) as e:
+            print(f"⚠️ Gagal membuat namespace database {self.database}: {e}")
+            return False
+        self.created = True
+        print(f"✅ Namespace database {self.database} dibuat")
+        return True
+
+    def drop(self):
+        """Menghapus seluruh namespace dengan satu DROP DATABASE"""
+        if not self.created:
+            return
+        if db_driver() == "sqlite":
+            path = sqlite_path(self.database)
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            self.created = False
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP DATABASE IF EXISTS `{self.database}`")
+            finally:
+                connection.close()
+        except DB_ERRORS as e:
+            print(f"⚠️ Gagal menghapus namespace database {self.database}: {e}")
+            return
+        self.created = False
+
+    def headers(self):
+        """Header HTTP yang membuat server PHP memakai database namespace ini"""
+        return {NAMESPACE_HEADER: self.name} if self.created else {}
+
+def reset_enabled():
+    """Cek apakah tabel dikembalikan ke snapshot setelah setiap kelas test
+
+    DB_RESET=1/0 memaksa aktif/nonaktif; defaultnya aktif hanya di namespace
+    database, karena restore juga menghapus baris milik run lain yang
+    berbagi database yang sama.
+    """
+    value = os.environ.get("DB_RESET")
+    if value is not None:
+        return value == "1"
+    return get_namespace() is not None
+
+class DatabaseSnapshot:
+    """Salinan isi tabel saat snapshot diambil, dikembalikan dengan menukar tabel"""
+
+    SUFFIX = "__snapshot"
+
+    def __init__(self, fixtures, tables=("users",)):
+        self.fixtures = fixtures
+        self.tables = tables
+        self.taken = False
+
+    def _execute(self, statements, transaction=False):
+        connection = self.fixtures.connect()
+        if connection is None:
+            return False
+        try:
+            if transaction:
+                # Statement yang gagal di tengah transaksi di-ROLLBACK, bukan dibiarkan
+                # terbuka dan terus memegang kunci tulis file SQLite
+                with connection.transaction(), connection.cursor() as cursor:
+                    for statement in statements:
+                        cursor.execute(statement)
+            else:
+                with connection.cursor() as cursor:
+                    for statement in statements:
+                        cursor.execute(statement)
+        except DB_ERRORS as e:
+            print(f"⚠️ Snapshot database gagal: {e}")
+            return False
+        return True
+
+    def take(self):
+        """Menyalin isi tabel saat ini ke tabel <nama>__snapshot"""
+        statements = []
+        for table in self.tables:
+            snapshot = table + self.SUFFIX
+            statements.append(f"DROP TABLE IF EXISTS `{snapshot}`")
+            if db_driver() == "sqlite":
+                statements.append(f"CREATE TABLE `{snapshot}` AS SELECT * FROM `{table}`")
+            else:
+                statements += [
+                    f"CREATE TABLE `{snapshot}` LIKE `{table}`",
+                    f"INSERT INTO `{snapshot}` SELECT * FROM `{table}`",
+                ]
+        self.taken = self._execute(statements)
+        return self.taken
+
+    def restore(self):
+        """Mengganti tabel dengan salinan snapshot; RENAME TABLE menukar semuanya sekaligus"""
+        if not self.taken:
+            return False
+        started = time.perf_counter()
+        if db_driver() == "sqlite":
+            # SQLite: isi ulang tabel dalam satu transaksi (file kecil, tanpa RENAME)
+            statements = []
+            for table in self.tables:
+                statements += [f"DELETE FROM `{table}`",
+                               f"INSERT INTO `{table}` SELECT * FROM `{table}{self.SUFFIX}`"]
+            return self._finish_restore(statements, started, transaction=True)
+        statements = []
+        renames = []
+        for table in self.tables:
+            snapshot, fresh, old = table + self.SUFFIX, table + "__restore", table + "__old"
+            statements += [
+                f"DROP TABLE IF EXISTS `{fresh}`, `{old}`",
+                f"CREATE TABLE `{fresh}` LIKE `{snapshot}`",
+                f"INSERT INTO `{fresh}` SELECT * FROM `{snapshot}`",
+            ]
+            renames += [f"`{table}` TO `{old}`", f"`{fresh}` TO `{table}`"]
+        statements.append("RENAME TABLE " + ", ".join(renames))
+        statements.append("DROP TABLE " + ", ".join(f"`{table}__old`" for table in self.tables))
+        return self._finish_restore(statements, started)
+
+    def _finish_restore(self, statements, started, transaction=False):
+        if not self._execute(statements, transaction):
+            return False
+        print(f"🧹 Tabel {', '.join(self.tables)} dikembalikan ke snapshot "
+              f"({(time.perf_counter() - started) * 1000:.0f} ms)")
+        return True
+
+    def discard(self):
+        """Menghapus tabel snapshot (tidak perlu di namespace, ikut terhapus bersama database)"""
+        if self.taken and self.fixtures.namespace is None:
+            self._execute([f"DROP TABLE IF EXISTS `{table}{self.SUFFIX}`" for table in self.tables])
+        self.taken = False
+
+class UserFixtures:
+    """Membuat user test langsung di database dan menghapusnya sekaligus di akhir"""
+
+    def __init__(self, config=None, namespace=None):
+        self.config = config or db_config()
+        self.namespace = namespace
+        if namespace is not None:
+            self.config = dict(self.config, database=namespace.database)
+        self.connection = None
+        self.created_usernames = set()
+
+    def connect(self):
+        """Membuka koneksi database (sekali), mengembalikan None jika tidak tersedia"""
+        if self.connection is not None:
+            return self.connection
+        if pymysql is None and db_driver() != "sqlite":
+            print("⚠️ PyMySQL tidak terinstal, fixture database tidak tersedia")
+            return None
+        try:
+            self.connection = connect_database(self.config)
+        except DB_ERRORS as e:
+            print(f"⚠️ Tidak dapat terhubung ke database: {e}")
+            return None
+        return self.connection
+
+    def create_user(self, username, password, name="Test User", email=None):
+        """Memasukkan user ke tabel users, menggantikan user lama dengan username sama"""
+        connection = self.connect()
+        if connection is None:
+            return False
+        email = email or f"{username}@example.com"
+        try:
+            with connection.cursor() as cursor:
+                if db_driver() != "sqlite":
+                    # SQLite: tabel sudah dibuat dari db/quiz_pengupil.sql saat koneksi dibuka
+                    cursor.execute(USERS_TABLE_SQL)
+                cursor.execute("DELETE FROM users WHERE username = %s", (username,))
+                cursor.execute(
+                    "INSERT INTO users (username, name, email, password) VALUES (%s, %s, %s, %s)",
+                    (username, name, email, password_hash(password)),
+                )
+        except (*DB_ERRORS, ValueError) as e:
+            print(f"⚠️ Gagal membuat user {username} di database: {e}")
+            return False
+        self.created_usernames.add(username)
+        return True
+
+    def cleanup(self):
+        """Menghapus semua user yang dibuat fixture dengan satu query"""
+        if not self.created_usernames or self.connection is None:
+            return 0
+        if self.namespace is not None:
+            # Namespace dihapus utuh oleh DatabaseNamespace.drop()
+            self.created_usernames.clear()
+            return 0
+        usernames = sorted(self.created_usernames)
+        placeholders = ", ".join(["%s"] * len(usernames))
+        try:
+            with self.connection.cursor() as cursor:
+                deleted = cursor.execute(f"DELETE FROM users WHERE username IN ({placeholders})", usernames)
+        except DB_ERRORS as e:
+            print(f"⚠️ Gagal menghapus user fixture: {e}")
+            return 0
+        self.created_usernames.clear()
+        return deleted
+
+    def close(self):
+        """Membersihkan user fixture lalu menutup koneksi"""
+        self.cleanup()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+_fixtures = None
+_namespace = None
+_snapshot = None
+
+def get_namespace():
+    """Namespace database milik proses ini, atau None jika DB_NAMESPACES tidak aktif/gagal"""
+    global _namespace
+    if not namespaces_enabled():
+        return None
+    if _namespace is None:
+        _namespace = DatabaseNamespace()
+        if _namespace.create():
+            atexit.register(_namespace.drop)
+    return _namespace if _namespace.created else None
+
+def attach_namespace(driver):
+    """Membuat driver mengirim header namespace database di setiap request"""
+    namespace = get_namespace()
+    if namespace is None:
+        return
+    headers = namespace.headers()
+    if hasattr(driver, "extra_headers"):
+        # HttpDriver
+        driver.extra_headers.update(headers)
+        return
+    try:
+        # Chrome: header ikut di setiap request halaman, tidak terhapus delete_all_cookies()
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": headers})
+    except Exception as e:
+        print(f"⚠️ Driver tidak dapat mengirim header namespace database: {e}")
+
+def take_snapshot():
+    """Mengambil snapshot tabel sekali per proses jika reset database aktif"""
+    global _snapshot
+    if _snapshot is None and reset_enabled():
+        _snapshot = DatabaseSnapshot(get_fixtures())
+        if _snapshot.take():
+            atexit.register(_snapshot.discard)
+    return _snapshot
+
+def restore_snapshot():
+    """Mengembalikan tabel ke snapshot proses ini, False jika reset tidak aktif"""
+    if _snapshot is None:
+        return False
+    return _snapshot.restore()
+
+def get_fixtures():
+    """Fixture user milik proses ini; dibersihkan otomatis saat proses selesai"""
+    global _fixtures
+    if _fixtures is None:
+        # Namespace didaftarkan ke atexit lebih dulu sehingga dihapus setelah fixture ditutup
+        _fixtures = UserFixtures(namespace=get_namespace())
+        atexit.register(_fixtures.close)
+    return _fixtures
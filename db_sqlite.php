@@ -0,0 +1,74 @@
+<?php
+/**
+ * Pengganti MySQL berbasis file SQLite untuk pengujian lokal (DB_DRIVER=sqlite)
+ *
+ * Tabel users dibuat dari db/quiz_pengupil.sql saat file SQLite pertama kali
+ * dibuka: dump MySQL diterjemahkan seperlunya (AUTO_INCREMENT, UNIQUE KEY,
+ * opsi tabel) lalu dijalankan apa adanya, termasuk data awalnya. Tidak ada
+ * daemon database; file dibuka langsung oleh proses PHP.
+ *
+ * Penggunaan CLI untuk menyiapkan file lebih awal: php db_sqlite.php [path]
+ */
+
+/**
+ * Statement SQLite dari dump MySQL db/quiz_pengupil.sql
+ */
+function sqlite_schema_statements($dump_file)
+{
+    $lines = array_filter(file($dump_file), function ($line) {
+        return strpos(ltrim($line), '--') !== 0;
+    });
+    $statements = array();
+    foreach (preg_split('/;\r?\n/', implode('', $lines)) as $statement) {
+        $statement = rtrim(trim($statement), ';');
+        // Baris /*!40101 SET ... */ khusus MySQL
+        if ($statement === '' || strpos($statement, '/*!') === 0) {
+            continue;
+        }
+        if (stripos($statement, 'CREATE TABLE') === 0) {
+            $statement = preg_replace('/\bint\(\d+\) NOT NULL AUTO_INCREMENT/i', 'INTEGER PRIMARY KEY AUTOINCREMENT', $statement);
+            $statement = preg_replace('/,\s*PRIMARY KEY \(`\w+`\)/i', '', $statement);
+            $statement = preg_replace('/UNIQUE KEY `\w+` \(/i', 'UNIQUE (', $statement);
+            $statement = preg_replace('/\)[^)]*$/', ')', $statement);
+        }
+        $statements[] = $statement;
+    }
+    return $statements;
+}
+
+/**
+ * Membuka file SQLite dan membuat tabel users jika belum ada
+ */
+function sqlite_connect($path)
+{
+    $con = new PDO('sqlite:' . $path);
+    $con->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+    $con->exec('PRAGMA journal_mode = WAL');
+    $con->exec('PRAGMA busy_timeout = 2000');
+
+    $exists = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'";
+    if ($con->query($exists)->fetchColumn() === false) {
+        // IMMEDIATE: hanya satu proses PHP yang mengimpor skema
+        $con->exec('BEGIN IMMEDIATE');
+        try {
+            if ($con->query($exists)->fetchColumn() === false) {
+                foreach (sqlite_schema_statements(__DIR__ . '/db/quiz_pengupil.sql') as $statement) {
+                    $con->exec($statement);
+                }
+            }
+            $con->exec('COMMIT');
+        } catch (PDOException $e) {
+            $con->exec('ROLLBACK');
+            throw $e;
+        }
+    }
+    return $con;
+}
+
+if (PHP_SAPI === 'cli' && realpath($_SERVER['SCRIPT_FILENAME']) === __FILE__) {
+    $db_config = require __DIR__ . '/db_config.php';
+    $path = isset($argv[1]) ? $argv[1] : $db_config['sqlite_path'];
+    $con = sqlite_connect($path);
+    $count = $con->query('SELECT COUNT(*) FROM users')->fetchColumn();
+    echo "Database SQLite siap: $path ($count user)\n";
+}
@@ -0,0 +1,129 @@
+"""
+Database durasi test untuk membagi suite ke beberapa shard.
+
+Durasi setiap method test (modul.Kelas.method) disimpan di file SQLite lokal
+dan diperbarui setelah setiap run sebagai rata-rata bergerak, sehingga satu
+run yang lambat tidak langsung mengubah pembagian. partition() membagi test
+ke N kelompok dengan total durasi historis yang kira-kira sama (test terlama
+lebih dulu ke kelompok yang paling ringan). Test yang belum pernah tercatat
+diberi durasi rata-rata test yang sudah tercatat.
+
+Semua shard harus membaca file database yang sama agar pembagiannya identik;
+lokasi file diatur dengan TEST_DURATIONS_DB. Setelah shard selesai, database
+milik setiap shard digabung dengan merge() (CLI: python duration_db.py merge
+TARGET SUMBER...) menjadi satu database untuk run berikutnya.
+"""
+import argparse
+import os
+import sqlite3
+import time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_durations.sqlite")
+
+# Bobot run terbaru pada rata-rata bergerak
+SMOOTHING = 0.3
+
+# Durasi untuk test baru jika database masih kosong
+DEFAULT_DURATION = 1.0
+
+def db_path():
+    return os.environ.get("TEST_DURATIONS_DB") or DEFAULT_PATH
+
+def _connect(path):
+    db = sqlite3.connect(path)
+    db.execute("""CREATE TABLE IF NOT EXISTS test_durations (
+        test_id TEXT PRIMARY KEY,
+        duration REAL NOT NULL,
+        runs INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    )""")
+    return db
+
+def load(path=None):
+    """Durasi historis per id test, dict kosong jika database belum ada"""
+    path = path or db_path()
+    if not os.path.exists(path):
+        return {}
+    db = _connect(path)
+    try:
+        return dict(db.execute("SELECT test_id, duration FROM test_durations"))
+    finally:
+        db.close()
+
+def update(records, path=None):
+    """Memperbarui durasi dari TestRecord run ini; test yang dilewati tidak dihitung"""
+    measured = [(record.test_id, record.duration) for record in records
+                if record.status in ("success", "failure") and record.duration > 0]
+    if not measured:
+        return 0
+    db = _connect(path or db_path())
+    try:
+        with db:
+            now = time.time()
+            for test_id, duration in measured:
+                db.execute("""INSERT INTO test_durations (test_id, duration, runs, updated_at)
+                    VALUES (?, ?, 1, ?)
+                    ON CONFLICT(test_id) DO UPDATE SET
+                        duration = duration * ? + excluded.duration * ?,
+                        runs = runs + 1,
+                        updated_at = excluded.updated_at""",
+                    (test_id, duration, now, 1 - SMOOTHING, SMOOTHING))
+    finally:
+        db.close()
+    return len(measured)
+
+def merge(sources, path=None):
+    """Menggabungkan database durasi beberapa shard; per test dipakai catatan terbaru"""
+    db = _connect(path or db_path())
+    try:
+        with db:
+            for source in sources:
+                if not os.path.exists(source):
+                    continue
+                other = _connect(source)
+                try:
+                    rows = other.execute("SELECT test_id, duration, runs, updated_at FROM test_durations").fetchall()
+                finally:
+                    other.close()
+                db.executemany("""INSERT INTO test_durations (test_id, duration, runs, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(test_id) DO UPDATE SET
+                        duration = excluded.duration,
+                        runs = excluded.runs,
+                        updated_at = excluded.updated_at
+                    WHERE excluded.updated_at > test_durations.updated_at""", rows)
+        return db.execute("SELECT COUNT(*) FROM test_durations").fetchone()[0]
+    finally:
+        db.close()
+
+def estimate(test_ids, durations):
+    """Durasi perkiraan untuk setiap test; test baru memakai rata-rata yang tercatat"""
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    default = sum(known) / len(known) if known else DEFAULT_DURATION
+    return {test_id: durations.get(test_id, default) for test_id in test_ids}
+
+def partition(test_ids, groups, durations):
+    """Membagi test ke sejumlah kelompok dengan total durasi yang kira-kira sama
+
+    Urutan test di dalam setiap kelompok mengikuti urutan test_ids. Hasilnya
+    deterministik untuk test_ids dan durasi yang sama.
+    """
+    estimated = estimate(test_ids, durations)
+    order = {test_id: i for i, test_id in enumerate(test_ids)}
+    buckets = [[] for _ in range(groups)]
+    totals = [0.0] * groups
+    for test_id in sorted(test_ids, key=lambda t: (-estimated[t], order[t])):
+        lightest = min(range(groups), key=lambda i: (totals[i], i))
+        buckets[lightest].append(test_id)
+        totals[lightest] += estimated[test_id]
+    return [sorted(bucket, key=order.get) for bucket in buckets]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Database durasi test")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_parser = commands.add_parser("merge", help="gabungkan database durasi beberapa shard")
+    merge_parser.add_argument("target", help="database hasil gabungan")
+    merge_parser.add_argument("sources", nargs="+", help="database durasi milik setiap shard")
+    args = parser.parse_args()
+    count = merge(args.sources, args.target)
+    print(f"✅ {count} durasi test tersimpan di {args.target}")
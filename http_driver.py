@@ -0,0 +1,420 @@
+"""
+Backend driver berbasis HTTP untuk menjalankan skenario login/register tanpa browser.
+
+HttpDriver meniru sebagian API Selenium WebDriver yang dipakai modul test
+(get, find_element(s), send_keys, click, current_url, page_source, cookie)
+di atas koneksi HTTP keep-alive dari urllib3 dan parser HTML ringan dari
+html.parser. Form disubmit dengan POST biasa sehingga tidak ada JavaScript
+maupun validasi HTML5 yang dijalankan; test yang membutuhkan perilaku browser
+ditandai dengan @requires_browser dan tetap dijalankan lewat Selenium.
+
+Aktifkan dengan environment variable TEST_BACKEND=http.
+"""
+import os
+import re
+import time
+from html.parser import HTMLParser
+from http.cookies import SimpleCookie
+from http.cookiejar import http2time
+from urllib.parse import urljoin, urlencode, urlsplit, urlunsplit
+
+import urllib3
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    InvalidSelectorException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+MAX_REDIRECTS = 5
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "source", "track", "wbr"}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Pool koneksi keep-alive dipakai bersama oleh semua HttpDriver dalam satu proses
+_POOL = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False)
+
+def use_http_backend():
+    """Cek apakah test dijalankan dengan backend HTTP (TEST_BACKEND=http)"""
+    return os.environ.get("TEST_BACKEND", "selenium").lower() == "http"
+
+def requires_browser(test_method):
+    """Dekorator untuk test yang tetap harus dijalankan di browser asli"""
+    test_method.requires_browser = True
+    return test_method
+
+class _Node:
+    """Node DOM sederhana hasil parsing HTML"""
+    __slots__ = ("tag", "attrs", "children", "parent", "value")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = parent
+        # Nilai input saat ini (berubah lewat clear/send_keys)
+        self.value = self.attrs.get("value", "") or ""
+
+    def iter_descendants(self):
+        """Iterasi seluruh elemen turunan dalam urutan dokumen"""
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield child
+                yield from child.iter_descendants()
+
+    def text_content(self):
+        """Seluruh teks di dalam elemen, tanpa isi script/style"""
+        if self.tag in ("script", "style"):
+            return ""
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.text_content())
+        return "".join(parts)
+
+class _DocumentParser(HTMLParser):
+    """Parser HTML toleran yang membangun pohon _Node"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, [(name, value if value is not None else "") for name, value in attrs], self.current)
+        self.current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = _Node(tag, [(name, value if value is not None else "") for name, value in attrs], self.current)
+        self.current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Tutup sampai tag yang cocok; abaikan end tag yatim
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+def parse_html(source):
+    """Parsing HTML menjadi pohon _Node, selalu dengan elemen <html> di puncak"""
+    parser = _DocumentParser()
+    parser.feed(source)
+    parser.close()
+    root = parser.root
+    if not any(isinstance(c, _Node) and c.tag == "html" for c in root.children):
+        html = _Node("html", parent=root)
+        html.children = root.children
+        for child in html.children:
+            if isinstance(child, _Node):
+                child.parent = html
+        root.children = [html]
+    return root
+
+# --- Selector ---------------------------------------------------------------
+
+_CSS_SIMPLE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)$")
+_CSS_PART = re.compile(r"([.#])([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*['\"]?([^'\"\]]*)['\"]?)?\s*\]")
+
+def _attribute(node, name):
+    """Nilai atribut mengikuti perilaku property DOM untuk atribut yang umum dipakai"""
+    if name == "value":
+        return node.value
+    if name == "type" and node.tag in ("input", "button") and "type" not in node.attrs:
+        return "text" if node.tag == "input" else "submit"
+    return node.attrs.get(name)
+
+def _compile_css(selector):
+    """Mengubah selector CSS sederhana (tanpa combinator) menjadi predicate"""
+    groups = []
+    for part in selector.split(","):
+        part = part.strip()
+        match = _CSS_SIMPLE.match(part)
+        if not part or not match:
+            raise InvalidSelectorException(f"Selector CSS tidak didukung backend HTTP: {selector}")
+        tag = match.group("tag")
+        checks = []
+        for kind, name, attr, value in _CSS_PART.findall(match.group("rest")):
+            if kind == ".":
+                checks.append(lambda n, c=name: c in (n.attrs.get("class") or "").split())
+            elif kind == "#":
+                checks.append(lambda n, i=name: n.attrs.get("id") == i)
+            elif value:
+                checks.append(lambda n, a=attr, v=value: _attribute(n, a) == v)
+            else:
+                checks.append(lambda n, a=attr: a in n.attrs)
+        groups.append((tag, checks))
+
+    def predicate(node):
+        for tag, checks in groups:
+            if tag not in (None, "*") and node.tag != tag:
+                continue
+            if all(check(node) for check in checks):
+                return True
+        return False
+    return predicate
+
+class HttpElement:
+    """Elemen hasil pencarian pada HttpDriver, meniru WebElement Selenium"""
+
+    def __init__(self, driver, node, generation):
+        self._driver = driver
+        self._node = node
+        self._generation = generation
+
+    def _check_stale(self):
+        if self._generation != self._driver._generation:
+            raise StaleElementReferenceException("Halaman sudah berganti sejak elemen ditemukan")
+        return self._node
+
+    @property
+    def tag_name(self):
+        return self._check_stale().tag
+
+    @property
+    def text(self):
+        return " ".join(self._check_stale().text_content().split())
+
+    def get_attribute(self, name):
+        node = self._check_stale()
+        value = _attribute(node, name)
+        if name in ("href", "action", "src") and value is not None:
+            return urljoin(self._driver.current_url, value)
+        return value
+
+    def is_displayed(self):
+        self._check_stale()
+        return True
+
+    def is_enabled(self):
+        return "disabled" not in self._check_stale().attrs
+
+    def clear(self):
+        self._check_stale().value = ""
+
+    def send_keys(self, *values):
+        node = self._check_stale()
+        node.value += "".join(str(value) for value in values)
+
+    def click(self):
+        node = self._check_stale()
+        if node.tag == "a" and node.attrs.get("href"):
+            self._driver.get(urljoin(self._driver.current_url, node.attrs["href"]))
+            return
+        is_submit = (node.tag == "button" and _attribute(node, "type") == "submit") or \
+                    (node.tag == "input" and _attribute(node, "type") in ("submit", "image"))
+        if is_submit:
+            form = node.parent
+            while form is not None and form.tag != "form":
+                form = form.parent
+            if form is not None:
+                self._driver._submit_form(form, node)
+
+    def submit(self):
+        node = self._check_stale()
+        form = node if node.tag == "form" else node.parent
+        while form is not None and form.tag != "form":
+            form = form.parent
+        if form is not None:
+            self._driver._submit_form(form, None)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find(by, value, self._check_stale(), first=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find(by, value, self._check_stale(), first=False)
+
+class HttpDriver:
+    """Driver tanpa browser yang berbicara HTTP langsung ke server PHP"""
+
+    # Setiap request selesai sebelum method kembali, jadi tidak ada yang perlu ditunggu
+    synchronous = True
+
+    def __init__(self, pool=None):
+        self._pool = pool or _POOL
+        self._cookies = {}
+        # Header tambahan untuk setiap request (misalnya namespace database)
+        self.extra_headers = {}
+        self._generation = 0
+        self._root = parse_html("")
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self.status_code = None
+        self.request_count = 0
+
+    # --- Navigasi -----------------------------------------------------------
+
+    def get(self, url):
+        """Membuka URL dengan GET dan mengikuti redirect"""
+        if url == "about:blank":
+            self._load(url, 200, "")
+            return
+        self._request("GET", url)
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def _request(self, method, url, fields=None):
+        body = urlencode(fields) if fields is not None else None
+        for _ in range(MAX_REDIRECTS + 1):
+            headers = {"Connection": "keep-alive", "User-Agent": "quiz-pengupil-http-driver", **self.extra_headers}
+            if body is not None:
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+            cookie_header = self._cookie_header()
+            if cookie_header:
+                headers["Cookie"] = cookie_header
+            try:
+                response = self._pool.request(method, url, body=body, headers=headers, redirect=False)
+            except urllib3.exceptions.HTTPError as e:
+                raise WebDriverException(f"Request HTTP ke {url} gagal: {e}")
+            self.request_count += 1
+            self._store_cookies(response)
+            location = response.headers.get("Location")
+            if response.status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                if response.status in (301, 302, 303):
+                    method, body = "GET", None
+                continue
+            break
+        self._load(url, response.status, self._decode(response))
+
+    def _submit_form(self, form, submitter):
+        """Mengirim form seperti browser: kumpulkan control yang punya name"""
+        fields = []
+        for node in form.iter_descendants():
+            name = node.attrs.get("name")
+            if not name or "disabled" in node.attrs:
+                continue
+            if node.tag == "input":
+                input_type = _attribute(node, "type").lower()
+                if input_type in ("submit", "button", "image", "reset"):
+                    if node is submitter:
+                        fields.append((name, node.value))
+                    continue
+                if input_type in ("checkbox", "radio") and "checked" not in node.attrs:
+                    continue
+                fields.append((name, node.value))
+            elif node.tag == "button":
+                if node is submitter:
+                    fields.append((name, node.attrs.get("value", "")))
+            elif node.tag == "textarea":
+                fields.append((name, node.value or node.text_content()))
+
+        action = urljoin(self.current_url, form.attrs.get("action") or self.current_url)
+        method = (form.attrs.get("method") or "GET").upper()
+        if method == "POST":
+            self._request("POST", action, fields)
+        else:
+            parts = urlsplit(action)
+            self._request("GET", urlunsplit(parts._replace(query=urlencode(fields))))
+
+    def _decode(self, response):
+        content_type = response.headers.get("Content-Type", "")
+        match = re.search(r"charset=([\w-]+)", content_type)
+        return response.data.decode(match.group(1) if match else "utf-8", errors="replace")
+
+    def _load(self, url, status, source):
+        self.current_url = url
+        self.status_code = status
+        self.page_source = source
+        self._root = parse_html(source)
+        self._generation += 1
+
+    # --- Cookie -------------------------------------------------------------
+
+    def _store_cookies(self, response):
+        for header in response.headers.getlist("Set-Cookie"):
+            cookie = SimpleCookie()
+            try:
+                cookie.load(header)
+            except Exception:
+                continue
+            for name, morsel in cookie.items():
+                expires = http2time(morsel["expires"]) if morsel["expires"] else None
+                expired = morsel["max-age"] == "0" or (expires is not None and expires < time.time())
+                if expired or morsel.value == "deleted":
+                    self._cookies.pop(name, None)
+                else:
+                    self._cookies[name] = {"name": name, "value": morsel.value, "path": morsel["path"] or "/"}
+
+    def _cookie_header(self):
+        return "; ".join(f"{c['name']}={c['value']}" for c in self._cookies.values())
+
+    def get_cookie(self, name):
+        return self._cookies.get(name)
+
+    def get_cookies(self):
+        return list(self._cookies.values())
+
+    def add_cookie(self, cookie):
+        self._cookies[cookie["name"]] = {"name": cookie["name"], "value": cookie["value"],
+                                         "path": cookie.get("path", "/")}
+
+    def delete_cookie(self, name):
+        self._cookies.pop(name, None)
+
+    def delete_all_cookies(self):
+        self._cookies.clear()
+
+    # --- Pencarian elemen ---------------------------------------------------
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find(by, value, self._root, first=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find(by, value, self._root, first=False)
+
+    def _find(self, by, value, context, first):
+        predicate = self._compile(by, value)
+        nodes = [node for node in context.iter_descendants() if predicate(node)]
+        elements = [HttpElement(self, node, self._generation) for node in nodes]
+        if first:
+            if not elements:
+                raise NoSuchElementException(f"Elemen tidak ditemukan: {by}={value}")
+            return elements[0]
+        return elements
+
+    def _compile(self, by, value):
+        if by == By.ID:
+            return lambda n: n.attrs.get("id") == value
+        if by == By.NAME:
+            return lambda n: n.attrs.get("name") == value
+        if by == By.CLASS_NAME:
+            return lambda n: value in (n.attrs.get("class") or "").split()
+        if by == By.TAG_NAME:
+            return lambda n: n.tag == value.lower()
+        if by == By.LINK_TEXT:
+            return lambda n: n.tag == "a" and " ".join(n.text_content().split()) == value
+        if by == By.PARTIAL_LINK_TEXT:
+            return lambda n: n.tag == "a" and value in n.text_content()
+        if by == By.CSS_SELECTOR:
+            return _compile_css(value)
+        raise InvalidSelectorException(f"Strategi pencarian tidak didukung backend HTTP: {by}")
+
+    # --- API WebDriver lain yang dipakai test -------------------------------
+
+    @property
+    def title(self):
+        titles = self.find_elements(By.TAG_NAME, "title")
+        return titles[0].text if titles else ""
+
+    def save_screenshot(self, filename):
+        """Tidak ada tampilan yang bisa di-screenshot pada backend HTTP"""
+        return False
+
+    def execute_script(self, script, *args):
+        raise WebDriverException("Backend HTTP tidak menjalankan JavaScript")
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        self._cookies.clear()
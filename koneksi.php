@@ -1,11 +1,53 @@
 <?php
-    $host     = 'localhost';
-    $user     = 'root'; 
-    $password = '';                  
-    $db       = 'quiz_pengupil';
-
-    $con = mysqli_connect($host, $user, $password, $db);
-    if (!$con) { 
-        die("Connection failed: " . mysqli_connect_error());    
+    $db_config = require __DIR__ . '/db_config.php';
+
+    if ($db_config['driver'] === 'sqlite') {
+        // Pengganti MySQL tanpa daemon: $con adalah PDO ke file SQLite
+        require_once __DIR__ . '/db_sqlite.php';
+        try {
+            $con = sqlite_connect($db_config['sqlite_path']);
+        } catch (PDOException $e) {
+            die("Connection failed: " . $e->getMessage());
+        }
+    } else {
+        // Koneksi persistent ("p:" di depan host) dipakai ulang oleh request berikutnya
+        // pada proses PHP yang sama sehingga handshake MySQL tidak diulang setiap request.
+        // Jumlahnya dibatasi pool_size: koneksi idle dipakai ulang, koneksi baru hanya
+        // dibuat persistent selama pool belum penuh.
+        // Error mysqli dilaporkan lewat nilai kembalian, bukan mysqli_sql_exception
+        // (default PHP 8.1+), sehingga semua pemanggil cukup memeriksa hasilnya
+        mysqli_report(MYSQLI_REPORT_OFF);
+
+        $links      = mysqli_get_links_stats();
+        $persistent = $db_config['persistent']
+            && ($links['cached_plinks'] > 0 || $links['active_plinks'] < $db_config['pool_size']);
+        $host       = $persistent ? 'p:' . $db_config['host'] : $db_config['host'];
+
+        $con = @mysqli_connect($host, $db_config['user'], $db_config['password'], $db_config['db']);
+
+        if ($con && $persistent) {
+            // Koneksi diambil dari pool jika jumlah koneksi persistent idle berkurang
+            $reused = mysqli_get_links_stats()['cached_plinks'] < $links['cached_plinks'];
+            if ($reused) {
+                // Health check hanya untuk koneksi lama: bisa sudah diputus server
+                // (restart, wait_timeout) sejak dipakai request sebelumnya
+                $healthy = @mysqli_query($con, "SELECT 1") !== false;
+            } else {
+                // Koneksi persistent baru: idle timeout cukup diatur sekali, ikut terbawa
+                // saat koneksi dipakai ulang
+                $idle_timeout = (int) $db_config['idle_timeout'];
+                $healthy = @mysqli_query($con, "SET SESSION wait_timeout = $idle_timeout") !== false;
+            }
+            if (!$healthy) {
+                // Koneksi rusak: catat, buang, dan ganti dengan koneksi baru untuk request ini
+                error_log("koneksi.php: koneksi persistent tidak sehat, membuat koneksi baru: " . mysqli_error($con));
+                @mysqli_close($con);
+                $con = @mysqli_connect($db_config['host'], $db_config['user'], $db_config['password'], $db_config['db']);
+            }
+        }
+
+        if (!$con) {
+            die("Connection failed: " . mysqli_connect_error());
+        }
     }
-?>
\ No newline at end of file
+?>
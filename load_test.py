@@ -0,0 +1,376 @@
+"""
+Load test untuk login.php dan register.php dengan banyak virtual user.
+
+Setiap virtual user adalah klien HTTP asyncio dengan koneksi keep-alive dan
+cookie session sendiri, lalu menjalankan skenario yang sama dengan suite
+fungsional secara bergiliran: login valid, password salah, username tidak
+terdaftar, dan registrasi dengan username yang sudah ada. Di akhir ditampilkan
+throughput serta latency p50/p95/p99 untuk setiap endpoint.
+
+Contoh (server seperti di workflow CI):
+    LOGIN_THROTTLE_BACKEND=off php -S localhost:8000 &
+    python load_test.py --base-url http://localhost:8000 --users 50 --duration 30
+
+Semua virtual user berasal dari satu IP, jadi jalankan server dengan
+LOGIN_THROTTLE_BACKEND=off untuk mengukur jalur login penuh; jika pembatas
+login aktif, sebagian besar percobaan login akan dijawab 429.
+
+Dengan --compare-pooling, skrip menjalankan php -S sendiri dua kali
+(DB_PERSISTENT=0 lalu 1, pembatas login dimatikan) dan membandingkan
+throughput kedua mode.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import ssl
+import string
+import sys
+import time
+from collections import defaultdict
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+import db_fixtures
+import php_server
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+VALID_PASSWORD = "TestPassword123"
+
+def generate_random_string(length=8):
+    """Membuat string acak untuk username unik"""
+    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+
+class AsyncHttpClient:
+    """Klien HTTP/1.1 asyncio minimal dengan satu koneksi keep-alive dan cookie jar sendiri"""
+
+    def __init__(self, base_url, timeout=10):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.cookies = {}
+        self.reader = None
+        self.writer = None
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def close(self):
+        """Menutup koneksi (cookie tetap disimpan)"""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+    def _build_request(self, method, path, fields):
+        body = urlencode(fields).encode() if fields is not None else b""
+        lines = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "User-Agent: quiz-pengupil-load-test",
+        ]
+        if self.cookies:
+            lines.append("Cookie: " + "; ".join(f"{k}={v}" for k, v in self.cookies.items()))
+        if fields is not None:
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+            lines.append(f"Content-Length: {len(body)}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+    async def _read_response(self, method):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Koneksi ditutup server")
+        status = int(status_line.split()[1])
+        headers = defaultdict(list)
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()].append(value.strip())
+
+        keep_alive = "close" not in ",".join(headers.get("connection", [])).lower()
+        if method == "HEAD" or status in (204, 304):
+            body = b""
+        elif "chunked" in ",".join(headers.get("transfer-encoding", [])).lower():
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"][0]))
+        else:
+            # Tanpa panjang konten: body berakhir saat koneksi ditutup
+            body = await self.reader.read()
+            keep_alive = False
+        return status, headers, body, keep_alive
+
+    def _store_cookies(self, headers):
+        for header in headers.get("set-cookie", []):
+            cookie = SimpleCookie()
+            try:
+                cookie.load(header)
+            except Exception:
+                continue
+            for name, morsel in cookie.items():
+                if morsel["max-age"] == "0" or not morsel.value or morsel.value == "deleted":
+                    self.cookies.pop(name, None)
+                else:
+                    self.cookies[name] = morsel.value
+
+    async def request(self, method, path, fields=None):
+        """Mengirim request tanpa mengikuti redirect, mengembalikan (status, headers, body)"""
+        data = self._build_request(method, path, fields)
+        for attempt in range(2):
+            reused = self.writer is not None
+            if not reused:
+                await self._connect()
+            try:
+                self.writer.write(data)
+                await self.writer.drain()
+                status, headers, body, keep_alive = await asyncio.wait_for(
+                    self._read_response(method), self.timeout)
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                # Koneksi keep-alive lama bisa sudah ditutup server, coba sekali lagi
+                if not reused or attempt:
+                    raise
+        if not keep_alive:
+            await self.close()
+        self._store_cookies(headers)
+        return status, headers, body.decode("utf-8", errors="replace")
+
+class LoadStats:
+    """Mengumpulkan latency per endpoint dan hasil per skenario"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.scenarios = defaultdict(lambda: {"ok": 0, "unexpected": 0, "error": 0})
+
+    async def timed(self, client, method, path, fields=None):
+        endpoint = f"{method} {path}"
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, fields)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            self.errors[endpoint] += 1
+            raise
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        return response
+
+def percentile(sorted_values, pct):
+    """Persentil dengan metode nearest-rank dari list yang sudah diurutkan"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+# --- Skenario ---------------------------------------------------------------
+# Setiap skenario mengembalikan True jika respons sesuai harapan suite fungsional
+
+def _is_redirect_to(status, headers, page):
+    return status in REDIRECT_STATUSES and page in ",".join(headers.get("location", []))
+
+async def scenario_valid_login(client, stats, ctx):
+    await stats.timed(client, "GET", "/login.php")
+    status, headers, _ = await stats.timed(client, "POST", "/login.php", {
+        "username": ctx["username"], "password": VALID_PASSWORD, "submit": ""})
+    ok = _is_redirect_to(status, headers, "index.php")
+    # Logout agar iterasi berikutnya kembali tanpa session login
+    await stats.timed(client, "GET", "/logout.php")
+    return ok
+
+async def scenario_wrong_password(client, stats, ctx):
+    await stats.timed(client, "GET", "/login.php")
+    status, _, _ = await stats.timed(client, "POST", "/login.php", {
+        "username": ctx["username"], "password": "wrongpassword", "submit": ""})
+    return status == 200
+
+async def scenario_unknown_user(client, stats, ctx):
+    await stats.timed(client, "GET", "/login.php")
+    status, _, body = await stats.timed(client, "POST", "/login.php", {
+        "username": f"nouser_{generate_random_string()}", "password": "password123", "submit": ""})
+    return status == 200 and "Register User Gagal" in body
+
+async def scenario_duplicate_register(client, stats, ctx):
+    await stats.timed(client, "GET", "/register.php")
+    status, _, _ = await stats.timed(client, "POST", "/register.php", {
+        "name": "Load Test", "email": f"{ctx['username']}@example.com", "username": ctx["username"],
+        "password": VALID_PASSWORD, "repassword": VALID_PASSWORD, "submit": ""})
+    return status == 200
+
+SCENARIOS = {
+    "valid_login": scenario_valid_login,
+    "wrong_password": scenario_wrong_password,
+    "unknown_user": scenario_unknown_user,
+    "duplicate_register": scenario_duplicate_register,
+}
+
+# --- Runner -----------------------------------------------------------------
+
+async def prepare_user(base_url, username):
+    """Membuat user untuk skenario login valid (fixture database, fallback form register)"""
+    if db_fixtures.get_fixtures().create_user(username, VALID_PASSWORD, name="Load Test"):
+        print(f"✅ User {username} dibuat langsung di database")
+        return True
+    client = AsyncHttpClient(base_url)
+    try:
+        await client.request("GET", "/register.php")
+        status, headers, _ = await client.request("POST", "/register.php", {
+            "name": "Load Test", "email": f"{username}@example.com", "username": username,
+            "password": VALID_PASSWORD, "repassword": VALID_PASSWORD, "submit": ""})
+    finally:
+        await client.close()
+    created = _is_redirect_to(status, headers, "index.php")
+    print(f"{'✅' if created else '⚠️'} User {username} dibuat melalui form register (status {status})")
+    return created
+
+async def virtual_user(index, base_url, scenarios, stats, ctx, deadline, iterations):
+    """Satu virtual user: menjalankan skenario bergiliran sampai waktu/iterasi habis"""
+    client = AsyncHttpClient(base_url)
+    try:
+        count = 0
+        while time.perf_counter() < deadline and (iterations is None or count < iterations):
+            name = scenarios[(index + count) % len(scenarios)]
+            try:
+                ok = await SCENARIOS[name](client, stats, ctx)
+                stats.scenarios[name]["ok" if ok else "unexpected"] += 1
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                stats.scenarios[name]["error"] += 1
+                await client.close()
+            count += 1
+    finally:
+        await client.close()
+
+async def run_load(base_url, users, duration, iterations=None, scenarios=None):
+    """Menjalankan load test dan mengembalikan (LoadStats, durasi sebenarnya)"""
+    scenarios = scenarios or list(SCENARIOS)
+    ctx = {"username": f"loaduser_{generate_random_string()}"}
+    await prepare_user(base_url, ctx["username"])
+
+    stats = LoadStats()
+    start = time.perf_counter()
+    deadline = start + duration if duration else float("inf")
+    await asyncio.gather(*(
+        virtual_user(i, base_url, scenarios, stats, ctx, deadline, iterations)
+        for i in range(users)
+    ))
+    return stats, time.perf_counter() - start
+
+def summarize(stats, elapsed):
+    """Ringkasan throughput dan latency (ms) per endpoint"""
+    endpoints = {}
+    for endpoint in sorted(set(stats.latencies) | set(stats.errors)):
+        values = sorted(stats.latencies.get(endpoint, []))
+        endpoints[endpoint] = {
+            "requests": len(values),
+            "errors": stats.errors.get(endpoint, 0),
+            "throughput": len(values) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+        }
+    return {"elapsed": elapsed, "endpoints": endpoints, "scenarios": dict(stats.scenarios)}
+
+def print_summary(summary, users):
+    """Mencetak hasil load test dalam bentuk tabel"""
+    print("\n" + "=" * 80)
+    print(f"HASIL LOAD TEST ({users} VIRTUAL USER, {summary['elapsed']:.1f} DETIK)")
+    print("=" * 80)
+    print(f"{'Endpoint':<22}{'Request':>9}{'Error':>7}{'Req/detik':>11}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for endpoint, row in summary["endpoints"].items():
+        print(f"{endpoint:<22}{row['requests']:>9}{row['errors']:>7}{row['throughput']:>11.1f}"
+              f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}")
+    print("\nSkenario:")
+    for name, counts in summary["scenarios"].items():
+        print(f"   {name:<20} sesuai: {counts['ok']}, tidak sesuai: {counts['unexpected']}, error: {counts['error']}")
+
+# --- Perbandingan pooling koneksi -------------------------------------------
+
+def total_throughput(summary):
+    """Total request per detik semua endpoint"""
+    requests = sum(row["requests"] for row in summary["endpoints"].values())
+    return requests / summary["elapsed"] if summary["elapsed"] else 0.0
+
+def compare_pooling(args):
+    """Load test yang sama terhadap php -S dengan koneksi persistent dimatikan lalu dinyalakan"""
+    base_url = f"http://127.0.0.1:{args.php_port}"
+    summaries = {}
+    for label, persistent in (("pooling off", "0"), ("pooling on", "1")):
+        print(f"\n🚀 {label}: php -S {base_url} (DB_PERSISTENT={persistent}, {args.php_workers} worker)")
+        server = php_server.PhpServer(args.php_port, {"DB_PERSISTENT": persistent,
+                                                      "LOGIN_THROTTLE_BACKEND": "off"}, args.php_workers)
+        with server:
+            stats, elapsed = asyncio.run(run_load(base_url, args.users, args.duration,
+                                                  args.iterations, args.scenario))
+        summaries[label] = summarize(stats, elapsed)
+        print_summary(summaries[label], args.users)
+
+    print("\n" + "=" * 80)
+    print("PERBANDINGAN POOLING KONEKSI")
+    print("=" * 80)
+    print(f"{'Mode':<14}{'Req/detik':>11}{'login p50 ms':>14}{'login p95 ms':>14}")
+    for label, summary in summaries.items():
+        login = summary["endpoints"].get("POST /login.php", {})
+        print(f"{label:<14}{total_throughput(summary):>11.1f}"
+              f"{login.get('p50_ms', 0.0):>14.1f}{login.get('p95_ms', 0.0):>14.1f}")
+    off = total_throughput(summaries["pooling off"])
+    if off:
+        print(f"\n📈 Pooling on: {total_throughput(summaries['pooling on']) / off:.2f}x throughput")
+    return summaries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test untuk login.php dan register.php")
+    parser.add_argument("--base-url", default=os.environ.get("BASE_URL", "http://localhost/quiz-pengupil"),
+                        help="URL aplikasi (default: environment variable BASE_URL)")
+    parser.add_argument("--users", type=int, default=20, help="Jumlah virtual user bersamaan")
+    parser.add_argument("--duration", type=float, default=30, help="Lama pengujian dalam detik")
+    parser.add_argument("--iterations", type=int, help="Batasi jumlah skenario per virtual user")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Skenario yang dijalankan (boleh diulang, default semua)")
+    parser.add_argument("--json", metavar="FILE", help="Simpan ringkasan hasil ke file JSON")
+    parser.add_argument("--compare-pooling", action="store_true",
+                        help="Jalankan php -S sendiri dan bandingkan koneksi persistent off/on")
+    parser.add_argument("--php-port", type=int, default=8010, help="Port php -S untuk --compare-pooling")
+    parser.add_argument("--php-workers", type=int, default=4,
+                        help="Jumlah proses php -S (PHP_CLI_SERVER_WORKERS) untuk --compare-pooling")
+    args = parser.parse_args(argv)
+
+    if args.compare_pooling:
+        summaries = compare_pooling(args)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(summaries, f, indent=2)
+            print(f"📝 Ringkasan disimpan ke {args.json}")
+        return 0
+
+    print(f"🚀 Load test {args.base_url} dengan {args.users} virtual user")
+    stats, elapsed = asyncio.run(run_load(args.base_url, args.users, args.duration,
+                                          args.iterations, args.scenario))
+    summary = summarize(stats, elapsed)
+    print_summary(summary, args.users)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"📝 Ringkasan disimpan ke {args.json}")
+
+    total_errors = sum(row["errors"] for row in summary["endpoints"].values())
+    return 1 if total_errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Resolver locator dengan cache strategi per halaman.
+
+Setiap strategi menghasilkan selector CSS untuk satu elemen form (selector
+utama page object, atribut name, id, ...). LocatorResolver mengingat strategi
+yang berhasil untuk pasangan (path halaman, nama elemen) sehingga lookup
+sekaligus di FormPage langsung memakai selector tersebut. Jika selector
+tersimpan tidak lagi menemukan elemen, entri cache dibuang dan strategi lain
+dicoba satu per satu tanpa implicitly_wait.
+"""
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+
+@contextmanager
+def implicit_wait_suspended(driver):
+    """Mematikan implicitly_wait sementara agar strategi yang gagal tidak menunggu"""
+    timeouts = getattr(driver, "timeouts", None)
+    previous = getattr(timeouts, "implicit_wait", 0) if timeouts is not None else 0
+    if previous:
+        driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        if previous:
+            driver.implicitly_wait(previous)
+
+def find_first(driver, selector):
+    """Elemen pertama untuk selector CSS, None jika tidak ada atau selector tidak didukung"""
+    try:
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+    except WebDriverException:
+        return None
+    return elements[0] if elements else None
+
+class LocatorResolver:
+    """Memilih selector per elemen dari daftar strategi dan menyimpan strategi yang berhasil"""
+
+    def __init__(self, strategies, verbose=False):
+        # strategies: list berisi (label, fungsi(nama, selector utama) -> selector CSS atau None)
+        self.strategies = list(strategies)
+        self.verbose = verbose
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def selector(self, label, name, selector):
+        """Selector CSS dari strategi dengan label tertentu"""
+        return dict(self.strategies)[label](name, selector)
+
+    def locators(self, path, locators):
+        """Selector untuk lookup sekaligus: strategi tersimpan, atau strategi pertama"""
+        default = self.strategies[0][0]
+        return {name: self.selector(self.cache.get((path, name), default), name, selector)
+                for name, selector in locators.items()}
+
+    def resolve(self, driver, path, locators, found):
+        """Melengkapi hasil lookup sekaligus dan memperbarui cache serta statistik hit/miss
+
+        found adalah hasil lookup dengan selector dari locators(); elemen yang
+        tidak ditemukan dicari dengan strategi lain. Mengembalikan dict nama ->
+        elemen atau None.
+        """
+        resolved = dict(found)
+        with implicit_wait_suspended(driver):
+            for name, selector in locators.items():
+                key = (path, name)
+                cached_label = self.cache.get(key)
+                if resolved.get(name) is not None and cached_label is not None:
+                    self.hits += 1
+                    continue
+                self.misses += 1
+                if resolved.get(name) is not None:
+                    self.cache[key] = self.strategies[0][0]
+                    continue
+                # Strategi tersimpan (atau selector utama) sudah tidak berlaku untuk halaman ini
+                self.cache.pop(key, None)
+                tried = {self.selector(cached_label or self.strategies[0][0], name, selector)}
+                for label, strategy in self.strategies:
+                    candidate = strategy(name, selector)
+                    if candidate is None or candidate in tried:
+                        continue
+                    tried.add(candidate)
+                    element = find_first(driver, candidate)
+                    if element is not None:
+                        self.cache[key] = label
+                        resolved[name] = element
+                        break
+                    if self.verbose:
+                        print(f"⚠️ Strategi '{label}' tidak menemukan '{name}' di {path}")
+        return resolved
+
+    def stats(self):
+        """Statistik cache: jumlah hit, miss, dan entri tersimpan"""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache)}
+
+    def report(self, name):
+        """Ringkasan statistik cache dalam satu baris"""
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        return f"📊 Cache locator {name}: {self.hits} hit, {self.misses} miss ({ratio:.0f}% hit)"
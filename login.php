@@ -1,7 +1,13 @@
 <?php
 
 require('koneksi.php');
-session_start();
+require('user_repository.php');
+require('password_policy.php');
+require('session.php');
+require('login_throttle.php');
+
+// Session hanya dibuka jika browser sudah membawa cookie session
+resume_session();
 
 $error = '';
 $validate = '';
@@ -10,27 +16,33 @@ if( isset($_SESSION['username']) ) header('Location: index.php');
 
 if( isset($_POST['submit']) ){
         
-        $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
-        $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
+        // Nilai dikirim lewat prepared statement, tidak perlu di-escape
+        $username = $_POST['username'];
+        $password = $_POST['password'];
        
         if(!empty(trim($username)) && !empty(trim($password))){
 
-            $query      = "SELECT * FROM users WHERE username = '$username'";
-            $result     = mysqli_query($con, $query);
-            $rows       = mysqli_num_rows($result);
+            // Tolak percobaan berlebih sebelum query database dan password_verify
+            $retry_after = throttle_login_attempt($username, $_SERVER['REMOTE_ADDR']);
+            if ($retry_after > 0) {
+                http_response_code(429);
+                header('Retry-After: ' . $retry_after);
+                $error = 'Terlalu banyak percobaan login, coba lagi dalam ' . $retry_after . ' detik';
+            } else {
+                $user = find_user_by_username($con, $username);
 
-            if ($rows != 0) {
-                $hash   = mysqli_fetch_assoc($result)['password'];
-                if(password_verify($password, $hash)){
-                    $_SESSION['username'] = $username;
+                if ($user !== null) {
+                    if(verify_password($con, $user, $password)){
+                        throttle_login_success($username, $_SERVER['REMOTE_ADDR']);
+                        begin_session();
+                        $_SESSION['username'] = $username;
                
-                    header('Location: index.php');
-                }
+                        header('Location: index.php');
+                    }
                             
-            } else {
-                $error =  'Register User Gagal !!';
+                } else {
+                    $error =  'Register User Gagal !!';
+                }
             }
             
         }else {
@@ -0,0 +1,222 @@
+<?php
+/**
+ * Pembatas percobaan login (token bucket) per username dan per IP client
+ *
+ * Dicek sebelum query database dan password_verify, sehingga percobaan
+ * berlebih ditolak tanpa biaya bcrypt. Semua nilai lewat environment variable:
+ * - LOGIN_THROTTLE_BACKEND : shm (APCu), sqlite, atau off. Default shm jika
+ *                            APCu tersedia, selain itu sqlite
+ * - LOGIN_THROTTLE_SQLITE_PATH : file SQLite untuk backend sqlite
+ * - LOGIN_THROTTLE_USER_LIMIT  : percobaan per username per window (default 5)
+ * - LOGIN_THROTTLE_IP_LIMIT    : percobaan gagal per IP per window (default 30)
+ * - LOGIN_THROTTLE_WINDOW      : detik untuk mengisi penuh bucket (default 60)
+ */
+
+class ApcuThrottleStore
+{
+    const PREFIX = 'quiz_pengupil_throttle:';
+    // Batas tunggu kunci bucket; kunci dilepas sendiri oleh TTL jika pemegangnya mati
+    const LOCK_TIMEOUT = 0.5;
+
+    /**
+     * Menjalankan $update atas beberapa bucket sebagai satu operasi atomik
+     * $update menerima array key => bucket|null dan mengembalikan array(hasil,
+     * array key => bucket baru, atau null untuk menghapus bucket)
+     */
+    public function update(array $keys, $window, $update)
+    {
+        // Urutan kunci tetap agar dua request tidak saling menunggu
+        sort($keys);
+        $locked = array();
+        try {
+            foreach ($keys as $key) {
+                $this->lock($key);
+                $locked[] = $key;
+            }
+            $buckets = array();
+            foreach ($keys as $key) {
+                $bucket = apcu_fetch(self::PREFIX . $key);
+                $buckets[$key] = $bucket === false ? null : $bucket;
+            }
+            list($result, $changes) = $update($buckets);
+            foreach ($changes as $key => $bucket) {
+                if ($bucket === null) {
+                    apcu_delete(self::PREFIX . $key);
+                } else {
+                    // Bucket kosong kembali penuh setelah satu window, TTL cukup sepanjang window
+                    apcu_store(self::PREFIX . $key, $bucket, $window);
+                }
+            }
+            return $result;
+        } finally {
+            foreach ($locked as $key) {
+                apcu_delete(self::PREFIX . 'lock:' . $key);
+            }
+        }
+    }
+
+    private function lock($key)
+    {
+        $deadline = microtime(true) + self::LOCK_TIMEOUT;
+        // apcu_add atomik: hanya satu request yang berhasil menambahkan kunci
+        while (!apcu_add(self::PREFIX . 'lock:' . $key, 1, 1)) {
+            if (microtime(true) >= $deadline) {
+                throw new RuntimeException("Kunci bucket throttle '$key' tidak didapat");
+            }
+            usleep(100);
+        }
+    }
+}
+
+class SqliteThrottleStore
+{
+    private $db;
+
+    public function __construct($path)
+    {
+        $this->db = new PDO('sqlite:' . $path);
+        $this->db->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+        $this->db->exec('PRAGMA journal_mode = WAL');
+        $this->db->exec('PRAGMA busy_timeout = 2000');
+        $this->db->exec('CREATE TABLE IF NOT EXISTS login_throttle (
+            bucket TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )');
+    }
+
+    /**
+     * Sama dengan ApcuThrottleStore::update, dalam satu transaksi SQLite
+     */
+    public function update(array $keys, $window, $update)
+    {
+        // IMMEDIATE: baca-ubah-tulis semua bucket tidak bertabrakan dengan request lain
+        $this->db->exec('BEGIN IMMEDIATE');
+        try {
+            $select = $this->db->prepare('SELECT tokens, updated_at FROM login_throttle WHERE bucket = ?');
+            $buckets = array();
+            foreach ($keys as $key) {
+                $select->execute(array($key));
+                $row = $select->fetch(PDO::FETCH_NUM);
+                $select->closeCursor();
+                $buckets[$key] = $row === false ? null : $row;
+            }
+            list($result, $changes) = $update($buckets);
+            foreach ($changes as $key => $bucket) {
+                if ($bucket === null) {
+                    $stmt = $this->db->prepare('DELETE FROM login_throttle WHERE bucket = ?');
+                    $stmt->execute(array($key));
+                } else {
+                    $stmt = $this->db->prepare('REPLACE INTO login_throttle (bucket, tokens, updated_at) VALUES (?, ?, ?)');
+                    $stmt->execute(array($key, $bucket[0], $bucket[1]));
+                }
+            }
+            $this->db->exec('COMMIT');
+        } catch (Exception $e) {
+            $this->db->exec('ROLLBACK');
+            throw $e;
+        }
+        return $result;
+    }
+}
+
+/**
+ * Mengisi ulang bucket array(tokens, updated_at) sesuai waktu yang berlalu
+ * Mengembalikan array(tokens, retry_after); retry_after 0 berarti boleh mencoba
+ */
+function throttle_refill($bucket, $limit, $window, $now)
+{
+    $rate = $limit / $window;
+    $tokens = $bucket === null ? $limit : min($limit, $bucket[0] + ($now - $bucket[1]) * $rate);
+    if ($tokens >= 1) {
+        return array($tokens, 0);
+    }
+    return array($tokens, (int) ceil((1 - $tokens) / $rate));
+}
+
+/**
+ * Store throttle sesuai LOGIN_THROTTLE_BACKEND, atau null jika dimatikan
+ */
+function throttle_store()
+{
+    static $store = false;
+    if ($store !== false) {
+        return $store;
+    }
+    $store = null;
+
+    $apcu = function_exists('apcu_enabled') && apcu_enabled();
+    $backend = getenv('LOGIN_THROTTLE_BACKEND') ?: ($apcu ? 'shm' : 'sqlite');
+    if ($backend === 'shm' && $apcu) {
+        $store = new ApcuThrottleStore();
+    } elseif ($backend === 'sqlite' && extension_loaded('pdo_sqlite')) {
+        $path = getenv('LOGIN_THROTTLE_SQLITE_PATH') ?: sys_get_temp_dir() . '/quiz_pengupil_throttle.sqlite';
+        $store = new SqliteThrottleStore($path);
+    } elseif ($backend !== 'off') {
+        error_log("LOGIN_THROTTLE_BACKEND '$backend' tidak tersedia, pembatas login nonaktif");
+    }
+    return $store;
+}
+
+function throttle_setting($name, $default)
+{
+    return getenv($name) !== false ? max(1, (int) getenv($name)) : $default;
+}
+
+/**
+ * Memakai satu token untuk username dan IP client jika keduanya masih punya token
+ * Mengembalikan 0 jika percobaan boleh diproses, atau detik sampai boleh mencoba lagi
+ */
+function throttle_login_attempt($username, $ip)
+{
+    $store = throttle_store();
+    if ($store === null) {
+        return 0;
+    }
+    $window = throttle_setting('LOGIN_THROTTLE_WINDOW', 60);
+    $now = microtime(true);
+    $limits = array(
+        'ip:' . $ip => throttle_setting('LOGIN_THROTTLE_IP_LIMIT', 30),
+        'user:' . strtolower($username) => throttle_setting('LOGIN_THROTTLE_USER_LIMIT', 5),
+    );
+
+    // Cek dan pemakaian token kedua bucket terjadi dalam satu operasi atomik. Token
+    // hanya dipakai jika semua bucket mengizinkan: percobaan yang ditolak IP tidak
+    // mengunci username, dan penolakan username tidak menghabiskan kuota IP.
+    return $store->update(array_keys($limits), $window, function ($buckets) use ($limits, $window, $now) {
+        $retry = 0;
+        $changes = array();
+        foreach ($limits as $key => $limit) {
+            list($tokens, $wait) = throttle_refill($buckets[$key], $limit, $window, $now);
+            $retry = max($retry, $wait);
+            $changes[$key] = array($tokens - 1, $now);
+        }
+        return array($retry, $retry === 0 ? $changes : array());
+    });
+}
+
+/**
+ * Setelah login berhasil: kosongkan hitungan username dan kembalikan token IP,
+ * sehingga login yang berhasil dari satu alamat (NAT/proxy) tidak memakai kuota IP
+ */
+function throttle_login_success($username, $ip)
+{
+    $store = throttle_store();
+    if ($store === null) {
+        return;
+    }
+    $window = throttle_setting('LOGIN_THROTTLE_WINDOW', 60);
+    $limit = throttle_setting('LOGIN_THROTTLE_IP_LIMIT', 30);
+    $now = microtime(true);
+    $ip_key = 'ip:' . $ip;
+    $user_key = 'user:' . strtolower($username);
+
+    $store->update(array($ip_key, $user_key), $window, function ($buckets) use ($ip_key, $user_key, $limit, $window, $now) {
+        $changes = array($user_key => null);
+        if ($buckets[$ip_key] !== null) {
+            list($tokens) = throttle_refill($buckets[$ip_key], $limit, $window, $now);
+            $changes[$ip_key] = array(min($limit, $tokens + 1), $now);
+        }
+        return array(null, $changes);
+    });
+}
@@ -1,9 +1,8 @@
 <?php
-// Memulai session (diperlukan untuk menghapus session)
-session_start();
+require('session.php');
 
-// Memeriksa apakah session ada sebelum menghapus
-if(isset($_SESSION)) {
+// Hanya buka session jika ada cookie session (tidak ada yang perlu dihapus jika tidak ada)
+if(resume_session()) {
     // Hapus semua variabel session
     $_SESSION = array();
 
@@ -18,4 +17,4 @@ if(isset($_SESSION)) {
 
 // Redirect ke halaman login
 header("Location: login.php");
-exit; 
\ No newline at end of file
+exit;
@@ -0,0 +1,81 @@
+<?php
+/**
+ * Menjalankan migrasi skema database secara berurutan
+ * Migrasi berada di folder db/migrations dengan nama NNN_deskripsi.php,
+ * setiap file mengembalikan function(mysqli $conn, array $options): bool.
+ * Versi yang sudah dijalankan dicatat di tabel schema_migrations.
+ *
+ * Penggunaan: php migrate.php [--status] [--dedupe]
+ */
+
+// Konfigurasi database bersama (lihat db_config.php)
+$db_config = require __DIR__ . '/db_config.php';
+
+$options = array_slice($argv, 1);
+$status_only = in_array('--status', $options);
+
+$conn = new mysqli($db_config['host'], $db_config['user'], $db_config['password'], $db_config['db']);
+if ($conn->connect_error) {
+    fwrite(STDERR, "Koneksi gagal: " . $conn->connect_error . "\n");
+    exit(1);
+}
+
+$created = $conn->query("CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT(11) NOT NULL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)");
+if (!$created) {
+    fwrite(STDERR, "Gagal membuat tabel schema_migrations: " . $conn->error . "\n");
+    exit(1);
+}
+
+$applied = array();
+$result = $conn->query("SELECT version FROM schema_migrations");
+while ($row = $result->fetch_assoc()) {
+    $applied[(int) $row['version']] = true;
+}
+
+$files = glob(__DIR__ . '/db/migrations/*.php');
+sort($files);
+
+$pending = 0;
+foreach ($files as $file) {
+    if (!preg_match('/^(\d+)_(.+)\.php$/', basename($file), $match)) {
+        continue;
+    }
+    $version = (int) $match[1];
+    $name = $match[2];
+
+    if (isset($applied[$version])) {
+        echo "[x] $version $name\n";
+        continue;
+    }
+    $pending++;
+    if ($status_only) {
+        echo "[ ] $version $name\n";
+        continue;
+    }
+
+    echo "Menjalankan migrasi $version $name...\n";
+    $migration = require $file;
+    if (!$migration($conn, $options)) {
+        fwrite(STDERR, "Migrasi $version gagal, migrasi berikutnya tidak dijalankan.\n");
+        exit(1);
+    }
+
+    $stmt = $conn->prepare("INSERT INTO schema_migrations (version, name) VALUES (?, ?)");
+    $stmt->bind_param("is", $version, $name);
+    $stmt->execute();
+    $stmt->close();
+    echo "Migrasi $version selesai.\n";
+}
+
+if ($status_only) {
+    echo "$pending migrasi belum dijalankan.\n";
+} elseif ($pending == 0) {
+    echo "Skema database sudah versi terbaru.\n";
+}
+
+$conn->close();
+?>
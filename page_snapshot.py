@@ -0,0 +1,113 @@
+"""
+Snapshot halaman dalam satu round trip WebDriver.
+
+Membaca atribut elemen satu per satu (get_attribute("id"), get_attribute("name"),
+.text, ...) memakan satu request HTTP ke driver per atribut per elemen.
+take() mengumpulkan URL, readyState, semua kontrol form, pesan error
+(alert-danger), pesan validasi (text-danger), dan link dengan satu
+execute_script lalu mengembalikannya sebagai PageSnapshot. Pada driver sinkron
+(HttpDriver) data yang sama dibaca dari dokumen yang sudah diparsing.
+"""
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+
+ALERT_SELECTOR = ".alert-danger"
+VALIDATION_SELECTOR = ".text-danger"
+CONTROL_SELECTOR = "input, button, select, textarea"
+
+_SNAPSHOT_SCRIPT = """
+const text = e => e.innerText.trim();
+const all = s => Array.from(document.querySelectorAll(s));
+return {
+    url: location.href,
+    title: document.title,
+    ready: document.readyState === "complete",
+    controls: all(arguments[0]).map(e => ({
+        tag: e.tagName.toLowerCase(),
+        id: e.id || null,
+        name: e.getAttribute("name"),
+        type: e.type || null,
+        placeholder: e.getAttribute("placeholder"),
+        value: e.value === undefined ? null : e.value,
+        text: text(e),
+    })),
+    alerts: all(arguments[1]).map(text),
+    validations: all(arguments[2]).map(text),
+    links: all("a[href]").map(a => ({text: text(a), href: a.getAttribute("href")})),
+};
+"""
+
+Control = namedtuple("Control", "tag id name type placeholder value text")
+Link = namedtuple("Link", "text href")
+
+class PageSnapshot(namedtuple("PageSnapshot", "url title ready controls alerts validations links")):
+    """Isi halaman pada satu saat: URL, kontrol form, pesan error/validasi, dan link"""
+
+    __slots__ = ()
+
+    @property
+    def alert(self):
+        """Teks alert-danger pertama, atau None jika tidak ada"""
+        return self.alerts[0] if self.alerts else None
+
+    @property
+    def validation(self):
+        """Teks text-danger pertama, atau None jika tidak ada"""
+        return self.validations[0] if self.validations else None
+
+    def logged_in(self, base_url):
+        """User dianggap login jika berada di index.php atau halaman punya link logout"""
+        if self.url in (f"{base_url}/index.php", f"{base_url}/") or self.url.endswith("/index.php"):
+            return True
+        return any("logout.php" in (link.href or "") or "Logout" in link.text for link in self.links)
+
+    def control(self, name):
+        """Kontrol form dengan atribut name tertentu, atau None"""
+        return next((c for c in self.controls if c.name == name), None)
+
+    def describe(self):
+        """Daftar kontrol form dalam format log yang mudah dibaca"""
+        inputs = [c for c in self.controls if c.tag != "button"]
+        buttons = [c for c in self.controls if c.tag == "button"]
+        lines = [f"🔍 Ditemukan {len(inputs)} field input pada {self.url}"]
+        for i, c in enumerate(inputs, 1):
+            lines.append(f"  {i}. ID: {c.id or 'no-id'}, Name: {c.name or 'no-name'}, "
+                         f"Type: {c.type or 'no-type'}, Placeholder: {c.placeholder or 'no-placeholder'}")
+        lines.append(f"🔍 Ditemukan {len(buttons)} button")
+        for i, c in enumerate(buttons, 1):
+            lines.append(f"  {i}. ID: {c.id or 'no-id'}, Name: {c.name or 'no-name'}, "
+                         f"Type: {c.type or 'no-type'}, Text: {c.text or 'no-text'}")
+        return "\n".join(lines)
+
+def _from_elements(driver):
+    """Snapshot dari find_elements biasa (driver sinkron atau tanpa JavaScript)"""
+    def texts(selector):
+        return [e.text.strip() for e in driver.find_elements(By.CSS_SELECTOR, selector)]
+
+    controls = []
+    for tag in ("input", "button", "select", "textarea"):
+        for e in driver.find_elements(By.TAG_NAME, tag):
+            controls.append(Control(tag, e.get_attribute("id"), e.get_attribute("name"),
+                                    e.get_attribute("type"), e.get_attribute("placeholder"),
+                                    e.get_attribute("value"), e.text.strip()))
+    links = [Link(a.text.strip(), a.get_attribute("href"))
+             for a in driver.find_elements(By.TAG_NAME, "a") if a.get_attribute("href") is not None]
+    return PageSnapshot(driver.current_url, driver.title, True, controls,
+                        texts(ALERT_SELECTOR), texts(VALIDATION_SELECTOR), links)
+
+def take(driver):
+    """Mengambil PageSnapshot halaman saat ini dengan satu execute_script"""
+    if getattr(driver, "synchronous", False):
+        return _from_elements(driver)
+    try:
+        data = driver.execute_script(_SNAPSHOT_SCRIPT, CONTROL_SELECTOR, ALERT_SELECTOR, VALIDATION_SELECTOR)
+    except WebDriverException:
+        return _from_elements(driver)
+    return PageSnapshot(
+        data["url"], data["title"], data["ready"],
+        [Control(**c) for c in data["controls"]],
+        data["alerts"], data["validations"],
+        [Link(**a) for a in data["links"]],
+    )
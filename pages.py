@@ -0,0 +1,179 @@
+"""
+Page object untuk form login.php dan register.php.
+
+Locator setiap halaman didefinisikan sekali sebagai selector CSS di kelas
+page-nya. Setelah halaman dimuat, semua elemen form dicari sekaligus dengan
+satu execute_script, dan hasil submit (URL, pesan error, pesan validasi)
+dibaca dari satu snapshot halaman (page_snapshot). Satu submit form karena
+itu memakan jumlah round trip WebDriver yang tetap: buka halaman, satu
+lookup, satu send_keys per field yang diisi, klik, tunggu hasil dengan
+execute_async_script (bukan polling), satu snapshot hasil. Driver sinkron
+(HttpDriver) tidak menjalankan JavaScript sehingga lookup dilakukan per
+selector di dokumen yang sudah diparsing.
+
+Selector yang dipakai lookup dipilih oleh LOCATOR_CACHE (locator_cache.py):
+elemen yang tidak ditemukan dengan selector utama dicari ulang lewat atribut
+name atau id, dan strategi yang berhasil dipakai langsung pada lookup
+berikutnya untuk halaman yang sama.
+"""
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+import page_snapshot
+import waits
+from locator_cache import LocatorResolver, implicit_wait_suspended
+
+# Cari semua selector dalam satu round trip; selector yang tidak ada bernilai null
+_FIND_ALL_SCRIPT = """
+const found = {};
+for (const [name, selector] of Object.entries(arguments[0])) {
+    found[name] = document.querySelector(selector);
+}
+return found;
+"""
+
+class FormResult(namedtuple("FormResult", "snapshot old_url")):
+    """Hasil submit form: snapshot halaman setelah submit dan URL sebelum submit"""
+
+    __slots__ = ()
+
+    @property
+    def url(self):
+        return self.snapshot.url
+
+    @property
+    def alert(self):
+        """Teks pesan error (alert-danger), atau None jika tidak ada"""
+        return self.snapshot.alert
+
+    @property
+    def validation(self):
+        """Teks pesan validasi (text-danger), atau None jika tidak ada"""
+        return self.snapshot.validation
+
+    @property
+    def outcome(self):
+        """Kategori hasil seperti waits.form_result: redirect, error, validation, url_changed, atau None"""
+        return waits.snapshot_outcome(self.snapshot, self.old_url)
+
+# Strategi selector per elemen, dicoba berurutan jika selector tersimpan tidak menemukan elemen
+LOCATOR_STRATEGIES = [
+    ("css", lambda name, selector: selector),
+    ("name", lambda name, selector: f"[name='{name}']"),
+    ("id", lambda name, selector: f"#{name}"),
+]
+
+# Cache strategi per (path halaman, nama elemen), dibagi semua page object
+LOCATOR_CACHE = LocatorResolver(LOCATOR_STRATEGIES)
+
+def find_all(driver, locators):
+    """Mencari semua selector sekaligus, mengembalikan dict nama -> elemen atau None"""
+    if not getattr(driver, "synchronous", False):
+        try:
+            return driver.execute_script(_FIND_ALL_SCRIPT, locators)
+        except WebDriverException:
+            pass
+    with implicit_wait_suspended(driver):
+        found = {}
+        for name, selector in locators.items():
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            found[name] = elements[0] if elements else None
+        return found
+
+class FormPage:
+    """Dasar page object form: buka halaman, isi field, submit, baca hasil"""
+
+    path = None
+    # Field input sesuai urutan di form, nama field -> selector CSS
+    FIELDS = {}
+    # Elemen lain pada halaman yang dicari bersamaan dengan field
+    CONTROLS = {"form": "form", "submit": "button[name='submit']"}
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url
+        self.elements = {}
+
+    @property
+    def url(self):
+        return f"{self.base_url}/{self.path}"
+
+    def open(self, query=""):
+        """Membuka halaman lalu mencari semua elemennya; True jika form tersedia"""
+        waits.open_page(self.driver, self.url + query)
+        return self.load()
+
+    def load(self):
+        """Mencari semua field dan kontrol halaman saat ini dalam satu lookup"""
+        locators = {**self.FIELDS, **self.CONTROLS}
+        found = find_all(self.driver, LOCATOR_CACHE.locators(self.path, locators))
+        self.elements = LOCATOR_CACHE.resolve(self.driver, self.path, locators, found)
+        return self.is_open()
+
+    def is_open(self):
+        """Cek apakah browser berada di halaman ini dan form-nya sudah ditemukan"""
+        return self.path in self.driver.current_url and self.elements.get("form") is not None
+
+    def element(self, name):
+        """Elemen hasil lookup terakhir, NoSuchElementException jika tidak ada"""
+        element = self.elements.get(name)
+        if element is None:
+            raise NoSuchElementException(f"Elemen '{name}' tidak ditemukan di {self.path}")
+        return element
+
+    def fill(self, **values):
+        """Mengisi field; field baru dimuat dari server sehingga tidak perlu clear()"""
+        for name, value in values.items():
+            if name not in self.FIELDS:
+                raise ValueError(f"Field '{name}' tidak dikenal di {self.path}")
+            self.element(name).send_keys(value)
+
+    def submit(self, timeout=waits.DEFAULT_TIMEOUT, **values):
+        """Mengisi field yang diberikan, klik submit, tunggu halaman baru, lalu baca hasilnya"""
+        self.fill(**values)
+        old_url = self.driver.current_url
+        # Form hasil lookup sekaligus menjadi penanda halaman lama
+        old_page = self.element("form")
+        self.element("submit").click()
+        waits.wait_for_form_result(self.driver, old_url, timeout, old_marker=old_page)
+        return self.result(old_url)
+
+    def result(self, old_url=None):
+        """Membaca hasil submit dari satu snapshot halaman saat ini"""
+        snapshot = page_snapshot.take(self.driver)
+        self.elements = {}
+        return FormResult(snapshot, snapshot.url if old_url is None else old_url)
+
+class LoginPage(FormPage):
+    """Form login.php"""
+
+    path = "login.php"
+    FIELDS = {
+        "username": "input[name='username']",
+        "password": "input[name='password']",
+    }
+    CONTROLS = {**FormPage.CONTROLS, "register_link": "a[href='register.php']"}
+
+    def login(self, username, password, timeout=waits.DEFAULT_TIMEOUT):
+        """Submit form login dengan username dan password"""
+        return self.submit(timeout, username=username, password=password)
+
+class RegisterPage(FormPage):
+    """Form register.php"""
+
+    path = "register.php"
+    FIELDS = {
+        "name": "input[name='name']",
+        "email": "input[name='email']",
+        "username": "input[name='username']",
+        "password": "input[name='password']",
+        "repassword": "input[name='repassword']",
+    }
+    CONTROLS = {**FormPage.CONTROLS, "login_link": "a[href='login.php']"}
+
+    def register(self, name, email, username, password, repassword=None, timeout=waits.DEFAULT_TIMEOUT):
+        """Submit form register; repassword default sama dengan password"""
+        return self.submit(timeout, name=name, email=email, username=username, password=password,
+                           repassword=password if repassword is None else repassword)
@@ -0,0 +1,64 @@
+<?php
+/**
+ * Kebijakan hashing password untuk register.php dan login.php
+ * Cost bcrypt diatur lewat environment variable PASSWORD_COST (default 10).
+ * Gunakan calibrate_password_cost.php untuk memilih cost yang sesuai dengan server.
+ */
+
+define('PASSWORD_COST_DEFAULT', 10);
+
+function password_options()
+{
+    $cost = getenv('PASSWORD_COST') !== false ? (int) getenv('PASSWORD_COST') : PASSWORD_COST_DEFAULT;
+    // Batas cost yang diterima bcrypt
+    return array('cost' => max(4, min(31, $cost)));
+}
+
+function hash_password($password)
+{
+    return password_hash($password, PASSWORD_DEFAULT, password_options());
+}
+
+/**
+ * Upgrade hash tersimpan jika algoritma/cost-nya tidak sesuai kebijakan saat ini
+ * Dipanggil setelah password_verify berhasil, saat password asli masih tersedia
+ */
+function upgrade_password_hash($con, array $user, $password)
+{
+    if (!password_needs_rehash($user['password'], PASSWORD_DEFAULT, password_options())) {
+        return false;
+    }
+    return update_user_password($con, $user['id'], hash_password($password));
+}
+
+/**
+ * Bentuk password yang di-hash sebelum query memakai prepared statement
+ * login.php dan register.php lama menjalankan stripslashes lalu
+ * mysqli_real_escape_string sebelum password_hash/password_verify
+ */
+function legacy_escaped_password($password)
+{
+    return strtr(stripslashes($password), array(
+        "\\" => "\\\\", "\0" => "\\0", "\n" => "\\n", "\r" => "\\r",
+        "'" => "\\'", '"' => '\\"', "\x1a" => "\\Z",
+    ));
+}
+
+/**
+ * Verifikasi password user dan upgrade hash tersimpan jika perlu
+ * Hash lama dari password yang di-escape (mengandung \\, ' atau ") masih diterima
+ * sekali, lalu langsung diganti hash dari password asli
+ */
+function verify_password($con, array $user, $password)
+{
+    if (password_verify($password, $user['password'])) {
+        upgrade_password_hash($con, $user, $password);
+        return true;
+    }
+    $legacy = legacy_escaped_password($password);
+    if ($legacy === $password || !password_verify($legacy, $user['password'])) {
+        return false;
+    }
+    update_user_password($con, $user['id'], hash_password($password));
+    return true;
+}
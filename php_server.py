@@ -0,0 +1,164 @@
+"""
+Fixture server PHP bawaan (php -S) untuk suite test dan load test.
+
+PhpServer menjalankan php -S di folder project pada port bebas, lalu
+mengirim request HTTP ke session_probe.php berulang kali sampai server
+menjawab, sehingga waktu tunggu hanya selama server benar-benar butuh (bukan
+sleep tetap). Environment proses suite (DB_*, CI, DB_NAMESPACES,
+LOGIN_THROTTLE_BACKEND, ...) ikut diteruskan ke server. stop() menghentikan
+server beserta proses worker-nya (PHP_CLI_SERVER_WORKERS).
+
+wait_until_ready() dipakai modul test untuk memastikan BASE_URL menjawab
+sebelum browser dibuka, termasuk untuk server yang tidak dijalankan fixture
+ini (XAMPP atau php -S manual).
+"""
+import os
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+
+import urllib3
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Endpoint ringan tanpa database dan tanpa session untuk cek kesiapan
+READY_PATH = "/session_probe.php"
+READY_TIMEOUT = 10
+POLL_INTERVAL = 0.05
+
+_POOL = urllib3.PoolManager(num_pools=4, maxsize=1, retries=False)
+
+def free_port(host="127.0.0.1"):
+    """Port TCP yang sedang tidak dipakai"""
+    with socket.socket() as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+def is_responding(base_url):
+    """True jika server menjawab request HTTP apa pun (status berapa pun)"""
+    try:
+        _POOL.request("GET", base_url.rstrip("/") + READY_PATH, timeout=0.5)
+    except urllib3.exceptions.HTTPError:
+        return False
+    return True
+
+def wait_until_ready(base_url, timeout=READY_TIMEOUT, process=None):
+    """Menunggu sampai server di base_url menjawab; False jika timeout atau proses berhenti"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        if process is not None and process.poll() is not None:
+            return False
+        if is_responding(base_url):
+            return True
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+class PhpServer:
+    """Satu proses php -S untuk folder project"""
+
+    def __init__(self, port=None, env=None, workers=1, host="127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.env = env or {}
+        self.workers = workers
+        self.process = None
+        self._log = None
+        self._started = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout=READY_TIMEOUT):
+        """Menjalankan php -S dan menunggu sampai menjawab request"""
+        self.launch()
+        return self.wait_ready(timeout)
+
+    def launch(self):
+        """Menjalankan proses php -S tanpa menunggu"""
+        if self.port is None:
+            self.port = free_port(self.host)
+        env = dict(os.environ, **self.env)
+        if self.workers > 1:
+            env["PHP_CLI_SERVER_WORKERS"] = str(self.workers)
+        # Log akses php -S ditulis ke file sementara, bukan pipe yang bisa penuh
+        self._log = tempfile.TemporaryFile()
+        self._started = time.perf_counter()
+        try:
+            self.process = subprocess.Popen(
+                ["php", "-S", f"{self.host}:{self.port}", "-t", PROJECT_DIR],
+                cwd=PROJECT_DIR, env=env, stdout=self._log, stderr=subprocess.STDOUT,
+                # Grup proses sendiri agar worker PHP ikut dihentikan oleh stop()
+                start_new_session=hasattr(os, "killpg"),
+            )
+        except OSError as e:
+            self._log.close()
+            self._log = None
+            raise RuntimeError(f"php -S tidak dapat dijalankan: {e}")
+        return self
+
+    def wait_ready(self, timeout=READY_TIMEOUT):
+        """Menunggu server hasil launch() menjawab; RuntimeError jika gagal"""
+        if not wait_until_ready(self.url, timeout, self.process):
+            output = self.output()
+            self.stop()
+            raise RuntimeError(f"php -S tidak merespons di {self.url} dalam {timeout} detik\n{output}")
+        print(f"✅ php -S siap di {self.url} ({(time.perf_counter() - self._started) * 1000:.0f} ms)")
+        return self
+
+    def output(self):
+        """Output php -S sejauh ini (log akses dan error)"""
+        if self._log is None:
+            return ""
+        self._log.seek(0)
+        return self._log.read().decode("utf-8", "replace")
+
+    def stop(self):
+        """Menghentikan server beserta worker-nya"""
+        if self.process is not None and self.process.poll() is None:
+            self._signal(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._signal(signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM)
+                self.process.wait()
+        self.process = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _signal(self, sig):
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self.process.pid, sig)
+                return
+            except ProcessLookupError:
+                return
+        self.process.send_signal(sig)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def start_servers(count, env=None):
+    """Menjalankan beberapa php -S di port bebas; semua dihentikan jika salah satu gagal"""
+    servers = []
+    try:
+        # Jalankan semua proses dulu agar waktu startup-nya tumpang tindih
+        for _ in range(count):
+            servers.append(PhpServer(env=env).launch())
+        for server in servers:
+            server.wait_ready()
+    except RuntimeError:
+        stop_servers(servers)
+        raise
+    return servers
+
+def stop_servers(servers):
+    for server in servers:
+        server.stop()
@@ -1,41 +1,34 @@
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
-<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/css/bootstrap.min.css" integrity="sha384-MCw98/SFnGE8fJT3GXwEOngsV7Zt27NXFoaoApmYm81iuXoPkFOJwJ8ERdknLPMO" crossorigin="anonymous">
-<link rel="stylesheet" href="style.css">
-</head>
- 
-<body>
 <?php
 require('koneksi.php');
-session_start();
+require('user_repository.php');
+require('password_policy.php');
+require('session.php');
+
+// Session hanya dibuka jika browser sudah membawa cookie session
+resume_session();
 
 $error = '';
 $validate = '';
 if( isset($_SESSION['user']) ) header('Location: index.php');
 if( isset($_POST['submit']) ){
         
-        $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
-        $name     = stripslashes($_POST['name']);
-        $name     = mysqli_real_escape_string($con, $name);
-        $email    = stripslashes($_POST['email']);
-        $email    = mysqli_real_escape_string($con, $email);
-        $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
-        $repass   = stripslashes($_POST['repassword']);
-        $repass   = mysqli_real_escape_string($con, $repass);
+        // Nilai dikirim lewat prepared statement, tidak perlu di-escape
+        $username = $_POST['username'];
+        $name     = $_POST['name'];
+        $email    = $_POST['email'];
+        $password = $_POST['password'];
+        $repass   = $_POST['repassword'];
         if(!empty(trim($name)) && !empty(trim($username)) && !empty(trim($email)) && !empty(trim($password)) && !empty(trim($repass))){
             if($password == $repass){
-                if( cek_nama($name,$con) == 0 ){
-                    $pass  = password_hash($password, PASSWORD_DEFAULT);
-                    $query = "INSERT INTO users (username,name,email, password ) VALUES ('$username','$nama','$email','$pass')";
-                    $result   = mysqli_query($con, $query);
-                    if ($result) {
+                if( !username_exists($con, $username) ){
+                    $pass  = hash_password($password);
+                    if (insert_user($con, $username, $name, $email, $pass)) {
+                        begin_session();
                         $_SESSION['username'] = $username;                       
                         header('Location: index.php');                    
+                    } elseif (username_exists($con, $username)) {
+                        // Username didaftarkan request lain di antara cek dan INSERT (UNIQUE key)
+                        $error =  'Username sudah terdaftar !!';
                     } else {
                         $error =  'Register User Gagal !!';
                     }
@@ -50,13 +43,17 @@ if( isset($_POST['submit']) ){
             $error =  'Data tidak boleh kosong !!';
         }
     } 
-
-    function cek_nama($username,$con){
-        $name = mysqli_real_escape_string($con, $username);
-        $query = "SELECT * FROM users WHERE username = '$name'";
-        if( $result = mysqli_query($con, $query) ) return mysqli_num_rows($result);
-    }
 ?>
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
+<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/css/bootstrap.min.css" integrity="sha384-MCw98/SFnGE8fJT3GXwEOngsV7Zt27NXFoaoApmYm81iuXoPkFOJwJ8ERdknLPMO" crossorigin="anonymous">
+<link rel="stylesheet" href="style.css">
+</head>
+ 
+<body>
         <section class="container-fluid mb-4">
             <section class="row justify-content-center">
             <section class="col-12 col-sm-6 col-md-4">
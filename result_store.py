@@ -0,0 +1,217 @@
+"""
+Penyimpanan hasil test yang ringkas dan reporter yang membaca darinya.
+
+Setiap test dicatat sekali sebagai TestRecord (id, status, durasi, pesan
+error, dan path artifact). Ringkasan console, JUnit XML, dan laporan HTML
+semuanya dibuat dari ResultStore yang sama sehingga suite cukup dijalankan
+satu kali untuk semua format laporan.
+"""
+import html
+import os
+import re
+import time
+import unittest
+import xml.etree.ElementTree as ET
+from collections import Counter, namedtuple
+
+TestRecord = namedtuple("TestRecord", "test_id status duration message artifacts")
+
+STATUSES = ("success", "failure", "error", "skipped")
+
+def module_of(test_id):
+    """Nama modul dari id test, termasuk error setUpClass seperti 'setUpClass (modul.Kelas)'"""
+    match = re.search(r"\(([\w.]+)\)$", test_id)
+    return (match.group(1) if match else test_id).split(".")[0]
+
+def class_of(test_id):
+    """Nama modul.Kelas dari id test"""
+    match = re.search(r"\(([\w.]+)\)$", test_id)
+    if match:
+        return match.group(1)
+    return test_id.rsplit(".", 1)[0]
+
+class ResultStore:
+    """Daftar TestRecord dari satu run"""
+
+    def __init__(self):
+        self.records = []
+        self.started = time.time()
+        self.finished = None
+
+    def add(self, record):
+        self.records.append(record)
+
+    def extend(self, records):
+        self.records.extend(TestRecord(*record) for record in records)
+
+    def counts(self, module_name=None):
+        """Jumlah test per status, untuk semua test atau satu modul"""
+        counter = Counter(record.status for record in self.records
+                          if module_name is None or module_of(record.test_id) == module_name)
+        result = {status: counter.get(status, 0) for status in STATUSES}
+        result["total"] = sum(counter.values())
+        return result
+
+    def failed(self):
+        """True jika ada test yang gagal atau error"""
+        counts = self.counts()
+        return counts["failure"] > 0 or counts["error"] > 0
+
+    def elapsed(self):
+        return (self.finished or time.time()) - self.started
+
+class StoreResult(unittest.TextTestResult):
+    """TextTestResult yang juga mencatat setiap hasil ke ResultStore"""
+
+    store = None
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._current = test
+        self._start = time.perf_counter()
+        self._outcome_status = ("success", "")
+
+    def _set(self, test, status, message):
+        if test is getattr(self, "_current", None):
+            # Dicatat di stopTest agar durasi dan artifact dari tearDown ikut tersimpan;
+            # status pertama yang bukan success yang dipakai
+            if self._outcome_status[0] == "success":
+                self._outcome_status = (status, message)
+        else:
+            # Error di luar test (setUpClass/tearDownClass)
+            self.store.add(TestRecord(test.id(), status, 0.0, message, ()))
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._set(test, "failure", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._set(test, "error", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._set(test, "skipped", reason)
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._set(test, "failure", "Unexpected success")
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        status, message = self._outcome_status
+        artifacts = tuple(getattr(test, "artifact_refs", None) or ())
+        self.store.add(TestRecord(test.id(), status, time.perf_counter() - self._start, message, artifacts))
+        self._current = None
+
+def result_class(store):
+    """Kelas result untuk TextTestRunner(resultclass=...) yang menulis ke store"""
+    return type("BoundStoreResult", (StoreResult,), {"store": store})
+
+# --- Reporter -----------------------------------------------------------------
+
+def print_module_summary(label, counts):
+    """Mencetak ringkasan jumlah test untuk satu modul"""
+    print(f"\nTotal test {label}: {counts['total']}")
+    print(f"Berhasil: {counts['success']}")
+    print(f"Gagal: {counts['failure']}")
+    print(f"Error: {counts['error']}")
+    if counts["skipped"]:
+        print(f"Dilewati: {counts['skipped']}")
+
+def print_summary(store):
+    """Mencetak ringkasan total seluruh run"""
+    counts = store.counts()
+    print("\n" + "=" * 40)
+    print("RINGKASAN HASIL")
+    print("=" * 40)
+    print(f"Total test: {counts['total']}")
+    print(f"Berhasil: {counts['success']}")
+    print(f"Gagal: {counts['failure']}")
+    print(f"Error: {counts['error']}")
+    if counts["skipped"]:
+        print(f"Dilewati: {counts['skipped']}")
+    print(f"Waktu total: {store.elapsed():.2f} detik")
+
+def _grouped_by_class(store):
+    groups = {}
+    for record in store.records:
+        groups.setdefault(class_of(record.test_id), []).append(record)
+    return groups
+
+def write_junit(store, path):
+    """Menulis hasil dalam format JUnit XML"""
+    root = ET.Element("testsuites")
+    for class_name, records in _grouped_by_class(store).items():
+        counts = Counter(record.status for record in records)
+        suite = ET.SubElement(root, "testsuite", {
+            "name": class_name,
+            "tests": str(len(records)),
+            "failures": str(counts["failure"]),
+            "errors": str(counts["error"]),
+            "skipped": str(counts["skipped"]),
+            "time": f"{sum(record.duration for record in records):.3f}",
+        })
+        for record in records:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": class_name,
+                "name": record.test_id.rsplit(".", 1)[-1] if record.test_id.startswith(class_name) else record.test_id,
+                "time": f"{record.duration:.3f}",
+            })
+            if record.status in ("failure", "error"):
+                lines = record.message.strip().splitlines()
+                detail = ET.SubElement(case, record.status, {"message": lines[-1] if lines else ""})
+                detail.text = record.message
+            elif record.status == "skipped":
+                ET.SubElement(case, "skipped", {"message": record.message})
+            if record.artifacts:
+                # Konvensi attachment JUnit yang dikenali banyak CI
+                ET.SubElement(case, "system-out").text = "\n".join(
+                    f"[[ATTACHMENT|{os.path.abspath(path)}]]" for path in record.artifacts)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+    print(f"📝 Laporan JUnit XML tersimpan di: {path}")
+    return path
+
+HTML_STYLE = """
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; vertical-align: top; }
+.success { background: #e6f4ea; } .failure { background: #fce8e6; }
+.error { background: #fdecc8; } .skipped { background: #eee; }
+pre { white-space: pre-wrap; margin: 0; font-size: 12px; }
+"""
+
+def write_html(store, path):
+    """Menulis laporan HTML mandiri (tanpa file CSS/JS eksternal)"""
+    counts = store.counts()
+    report_dir = os.path.dirname(os.path.abspath(path))
+    rows = []
+    for record in store.records:
+        links = "<br>".join(
+            f'<a href="{html.escape(os.path.relpath(os.path.abspath(ref), report_dir))}">'
+            f'{html.escape(os.path.basename(ref))}</a>'
+            for ref in record.artifacts)
+        message = f"<pre>{html.escape(record.message)}</pre>" if record.message else ""
+        rows.append(
+            f'<tr class="{record.status}"><td>{html.escape(record.test_id)}</td>'
+            f"<td>{record.status}</td><td>{record.duration:.2f}</td><td>{message}</td><td>{links}</td></tr>")
+    document = f"""<!DOCTYPE html>
+<html lang="id">
+<head><meta charset="utf-8"><title>Laporan Test Login dan Register</title><style>{HTML_STYLE}</style></head>
+<body>
+<h1>Laporan Test Login dan Register</h1>
+<p>Dijalankan: {time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(store.started))},
+durasi {store.elapsed():.2f} detik</p>
+<p>Total: {counts['total']}, berhasil: {counts['success']}, gagal: {counts['failure']},
+error: {counts['error']}, dilewati: {counts['skipped']}</p>
+<table>
+<tr><th>Test</th><th>Status</th><th>Durasi (detik)</th><th>Pesan</th><th>Artifact</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(document)
+    print(f"Laporan HTML tersimpan di: {path}")
+    return path
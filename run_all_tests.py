@@ -1,60 +1,109 @@
 import unittest
 import time
 import sys
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
-def run_all_tests():
-    """Menjalankan semua test untuk modul login dan register"""
+import duration_db
+import result_store
+
+# Urutan modul test: register dijalankan terlebih dahulu, lalu login
+TEST_MODULES = [
+    ("test_register_module", "TestRegisterModule", "register"),
+    ("test_login_module", "TestLoginModule", "login"),
+]
+
+def warm_browser_pool():
+    """Menjalankan satu browser lebih awal agar siap saat setUpClass pertama"""
+    from http_driver import use_http_backend
+    if not use_http_backend():
+        import browser_pool
+        browser_pool.get_pool().warm(1)
+
+def purge_server_sessions():
+    """Menghapus session sisa run sebelumnya di server sekali sebelum test dimulai"""
+    import session_hooks
+    if os.environ.get("TEST_SHARD_ID"):
+        # Shard lain bisa memakai server yang sama; jangan hapus session mereka
+        return
+    if session_hooks.purge_enabled():
+        session_hooks.purge_sessions(os.environ.get("BASE_URL", "http://localhost/quiz-pengupil"))
+
+def install_step_timing():
+    """Mengaktifkan instrumentasi waktu per langkah jika STEP_TIMING_FILE diisi (--timing)"""
+    if os.environ.get("STEP_TIMING_FILE"):
+        import step_timing
+        step_timing.install()
+
+def flush_step_timing():
+    """Menulis catatan waktu langkah proses ini ke file timing"""
+    if os.environ.get("STEP_TIMING_FILE"):
+        import step_timing
+        step_timing.flush()
+
+def report_step_timing():
+    """Mencetak langkah paling lambat per test dan porsi waktu idle"""
+    path = os.environ.get("STEP_TIMING_FILE")
+    if not path:
+        return
+    flush_step_timing()
+    if os.path.exists(path):
+        import step_timing
+        step_timing.print_report(path)
+
+def write_reports(store, html=False, junit=None):
+    """Membuat laporan HTML dan/atau JUnit XML dari hasil run yang sama"""
+    if html:
+        result_store.write_html(store, f"test_report_{int(store.started)}.html")
+    if junit:
+        result_store.write_junit(store, junit)
+
+def finish_run(store, html=False, junit=None):
+    """Ringkasan akhir, laporan, dan exit code dari satu run"""
+    store.finished = time.time()
+    result_store.print_summary(store)
+    duration_db.update(store.records)
+    report_step_timing()
+    write_reports(store, html, junit)
+    # Return non-zero exit code jika ada test yang gagal
+    return 1 if store.failed() else 0
+
+def run_all_tests(html=False, junit=None, shard=None):
+    """Menjalankan semua test (atau test milik satu shard) untuk modul login dan register"""
     print("=" * 80)
-    print("MEMULAI PENGUJIAN MODUL LOGIN DAN REGISTER")
+    print("MEMULAI PENGUJIAN MODUL LOGIN DAN REGISTER" + (f" (SHARD {shard[0]}/{shard[1]})" if shard else ""))
     print("=" * 80)
     
+    store = result_store.ResultStore()
     try:
-        # Import test modules
-        from test_login_module import TestLoginModule
-        from test_register_module import TestRegisterModule
+        selected = set(select_tests(shard)) if shard else None
+        # Mulai browser di background selagi modul test diimpor
+        warm_browser_pool()
+        install_step_timing()
+        purge_server_sessions()
         
-        # Jalankan test register terlebih dahulu
-        print("\n" + "=" * 40)
-        print("MODUL REGISTER")
-        print("=" * 40)
-        
-        register_suite = unittest.TestLoader().loadTestsFromTestCase(TestRegisterModule)
-        register_result = unittest.TextTestRunner(verbosity=2).run(register_suite)
-        
-        print(f"\nTotal test register: {register_result.testsRun}")
-        print(f"Berhasil: {register_result.testsRun - len(register_result.failures) - len(register_result.errors)}")
-        print(f"Gagal: {len(register_result.failures)}")
-        print(f"Error: {len(register_result.errors)}")
-        
-        # Jalankan test login
-        print("\n" + "=" * 40)
-        print("MODUL LOGIN")
-        print("=" * 40)
-        
-        login_suite = unittest.TestLoader().loadTestsFromTestCase(TestLoginModule)
-        login_result = unittest.TextTestRunner(verbosity=2).run(login_suite)
-        
-        print(f"\nTotal test login: {login_result.testsRun}")
-        print(f"Berhasil: {login_result.testsRun - len(login_result.failures) - len(login_result.errors)}")
-        print(f"Gagal: {len(login_result.failures)}")
-        print(f"Error: {len(login_result.errors)}")
-        
-        # Laporan summary
-        print("\n" + "=" * 40)
-        print("RINGKASAN HASIL")
-        print("=" * 40)
-        total_tests = register_result.testsRun + login_result.testsRun
-        total_fails = len(register_result.failures) + len(login_result.failures)
-        total_errors = len(register_result.errors) + len(login_result.errors)
-        total_success = total_tests - total_fails - total_errors
-        
-        print(f"Total test: {total_tests}")
-        print(f"Berhasil: {total_success}")
-        print(f"Gagal: {total_fails}")
-        print(f"Error: {total_errors}")
-        
-        # Return non-zero exit code jika ada test yang gagal
-        return 1 if (total_fails > 0 or total_errors > 0) else 0
+        # Jalankan test register terlebih dahulu, lalu login
+        for module_name, class_name, label in TEST_MODULES:
+            test_class = getattr(__import__(module_name), class_name)
+            loader = unittest.TestLoader()
+            if selected is None:
+                suite = loader.loadTestsFromTestCase(test_class)
+            else:
+                names = [f"{module_name}.{class_name}.{method_name}"
+                         for method_name in loader.getTestCaseNames(test_class)]
+                names = [name for name in names if name in selected]
+                if not names:
+                    continue
+                suite = loader.loadTestsFromNames(names)
+            
+            print("\n" + "=" * 40)
+            print(f"MODUL {label.upper()}")
+            print("=" * 40)
+            
+            unittest.TextTestRunner(verbosity=2, resultclass=result_store.result_class(store)).run(suite)
+            result_store.print_module_summary(label, store.counts(module_name))
         
     except ImportError as e:
         print(f"❌ Gagal mengimpor modul test: {e}")
@@ -62,34 +111,170 @@ def run_all_tests():
     except Exception as e:
         print(f"❌ Error tidak terduga: {e}")
         return 1
+    
+    return finish_run(store, html, junit)
+
+def collect_test_ids():
+    """Mengumpulkan id setiap method test (modul.Kelas.method) sesuai urutan modul"""
+    loader = unittest.TestLoader()
+    test_ids = []
+    for module_name, class_name, _ in TEST_MODULES:
+        module = __import__(module_name)
+        test_class = getattr(module, class_name)
+        for method_name in loader.getTestCaseNames(test_class):
+            test_ids.append(f"{module_name}.{class_name}.{method_name}")
+    return test_ids
+
+def partition_tests(test_ids, workers):
+    """Membagi daftar test ke sejumlah worker dengan total durasi historis yang seimbang"""
+    groups = duration_db.partition(test_ids, workers, duration_db.load())
+    return [group for group in groups if group]
+
+def select_tests(shard):
+    """Id test milik shard (index, total) berdasarkan durasi historis di duration_db"""
+    index, total = shard
+    test_ids = collect_test_ids()
+    durations = duration_db.load()
+    groups = duration_db.partition(test_ids, total, durations)
+    # Gabungan semua shard harus memuat setiap test tepat satu kali
+    assigned = [test_id for group in groups for test_id in group]
+    if sorted(assigned) != sorted(test_ids):
+        missing = set(test_ids) - set(assigned)
+        raise RuntimeError(f"Pembagian shard tidak mencakup semua test tepat satu kali "
+                           f"({len(missing)} hilang, {len(assigned) - len(set(assigned))} ganda)")
+    selected = groups[index - 1]
+    estimated = duration_db.estimate(selected, durations)
+    print(f"📋 Shard {index}/{total}: {len(selected)} dari {len(test_ids)} test, "
+          f"perkiraan {sum(estimated.values()):.1f} detik ({len(durations)} durasi tercatat)")
+    return selected
 
-def generate_html_report():
-    """Generate HTML report menggunakan pytest"""
+def parse_shard(value):
+    """Parser argumen --shard i/N"""
     try:
-        import pytest
-        timestamp = int(time.time())
-        report_file = f"test_report_{timestamp}.html"
-        
-        print(f"Membuat laporan HTML: {report_file}")
-        pytest.main([
-            "test_login_module.py", 
-            "test_register_module.py", 
-            f"--html={report_file}", 
-            "--self-contained-html"
-        ])
-        print(f"Laporan HTML tersimpan di: {report_file}")
-        return 0
-    except ImportError:
-        print("❌ pytest dan/atau pytest-html tidak terinstal.")
-        print("   Jalankan: pip install pytest pytest-html")
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"format shard harus i/N, bukan '{value}'")
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard {value} di luar rentang 1..{total}")
+    return index, total
+
+def _run_worker(worker_id, test_ids, base_url=None):
+    """Menjalankan sekelompok test di dalam proses worker
+
+    Setiap worker memiliki browser headless, cookie jar, dan user test sendiri
+    karena setUpClass dijalankan ulang di proses ini. TEST_WORKER_ID dipakai
+    modul test untuk membuat username yang unik per worker. base_url diisi
+    jika worker punya server php -S sendiri (--php-server).
+    """
+    os.environ["TEST_WORKER_ID"] = str(worker_id)
+    if base_url:
+        os.environ["BASE_URL"] = base_url
+    warm_browser_pool()
+    install_step_timing()
+    store = result_store.ResultStore()
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    unittest.TextTestRunner(verbosity=2, resultclass=result_store.result_class(store)).run(suite)
+    # atexit tidak dijalankan di proses worker, tulis catatan waktu sekarang
+    flush_step_timing()
+
+    # Objek TestCase tidak bisa dikirim antar proses, kirim record-nya saja
+    return [tuple(record) for record in store.records]
+
+def run_parallel_tests(workers, html=False, junit=None, shard=None, base_urls=None):
+    """Menjalankan semua test (atau test milik satu shard) secara paralel menggunakan beberapa proses worker"""
+    print("=" * 80)
+    print(f"MEMULAI PENGUJIAN MODUL LOGIN DAN REGISTER ({workers} WORKER"
+          + (f", SHARD {shard[0]}/{shard[1]})" if shard else ")"))
+    print("=" * 80)
+    
+    try:
+        test_ids = select_tests(shard) if shard else collect_test_ids()
+    except ImportError as e:
+        print(f"❌ Gagal mengimpor modul test: {e}")
         return 1
+    
+    # Purge sekali di proses utama; worker tidak boleh menghapus session worker lain
+    purge_server_sessions()
+    groups = partition_tests(test_ids, workers)
+    print(f"📋 {len(test_ids)} test dibagi ke {len(groups)} worker")
+    
+    store = result_store.ResultStore()
+    try:
+        # Gunakan spawn agar setiap worker memulai browser dari kondisi bersih
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(groups), mp_context=context) as executor:
+            futures = [
+                executor.submit(_run_worker, worker_id, group,
+                                base_urls[worker_id - 1] if base_urls else None)
+                for worker_id, group in enumerate(groups, start=1)
+            ]
+            for future in futures:
+                store.extend(future.result())
     except Exception as e:
-        print(f"❌ Error saat membuat laporan HTML: {e}")
+        print(f"❌ Error tidak terduga: {e}")
         return 1
+    
+    # Urutkan kembali hasil semua worker sesuai urutan test
+    order = {test_id: i for i, test_id in enumerate(test_ids)}
+    store.records.sort(key=lambda record: order.get(record.test_id, len(order)))
+    
+    for module_name, _, label in TEST_MODULES:
+        print("\n" + "=" * 40)
+        print(f"MODUL {label.upper()}")
+        print("=" * 40)
+        result_store.print_module_summary(label, store.counts(module_name))
+    
+    return finish_run(store, html, junit)
 
 if __name__ == "__main__":
     # Parse command-line arguments
-    if len(sys.argv) > 1 and sys.argv[1] == "--html":
-        sys.exit(generate_html_report())
-    else:
-        sys.exit(run_all_tests()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Menjalankan pengujian modul login dan register")
+    parser.add_argument("--html", action="store_true", help="Buat laporan HTML dari hasil run ini")
+    parser.add_argument("--junit", metavar="FILE", help="Simpan hasil run ini dalam format JUnit XML")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jumlah proses worker untuk menjalankan test secara paralel")
+    parser.add_argument("--backend", choices=["selenium", "http"],
+                        help="Backend driver: selenium (browser) atau http (tanpa browser)")
+    parser.add_argument("--timing", metavar="FILE",
+                        help="Catat durasi setiap langkah driver ke file JSON lines dan tampilkan langkah paling lambat")
+    parser.add_argument("--php-server", action="store_true",
+                        help="Jalankan php -S sendiri (satu per worker) di port bebas dan arahkan BASE_URL ke sana")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N",
+                        help="Jalankan hanya bagian ke-i dari N bagian suite, dibagi berdasarkan durasi historis")
+    args = parser.parse_args()
+    
+    # Backend dibaca modul test (dan worker) dari environment variable
+    if args.backend:
+        os.environ["TEST_BACKEND"] = args.backend
+    
+    # File timing juga dibaca worker; mulai dari file kosong setiap run
+    if args.timing:
+        os.environ["STEP_TIMING_FILE"] = os.path.abspath(args.timing)
+        if os.path.exists(args.timing):
+            os.remove(args.timing)
+    
+    # Shard dibaca modul test (dan worker) untuk membuat user yang unik per shard
+    if args.shard:
+        os.environ["TEST_SHARD_ID"] = str(args.shard[0])
+    
+    servers = []
+    if args.php_server:
+        import php_server
+        try:
+            servers = php_server.start_servers(max(1, args.workers))
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        # Proses utama (purge session, mode sekuensial) memakai server pertama
+        os.environ["BASE_URL"] = servers[0].url
+    
+    try:
+        if args.workers > 1:
+            exit_code = run_parallel_tests(args.workers, args.html, args.junit, args.shard,
+                                           [server.url for server in servers])
+        else:
+            exit_code = run_all_tests(args.html, args.junit, args.shard)
+    finally:
+        for server in servers:
+            server.stop()
+    sys.exit(exit_code) 
\ No newline at end of file
@@ -0,0 +1,238 @@
+<?php
+/**
+ * Penyimpanan session yang bisa diganti untuk login.php, register.php dan logout.php
+ *
+ * Backend dipilih dengan environment variable SESSION_HANDLER:
+ * - files  : handler bawaan PHP (default), file session disimpan di folder khusus
+ *            aplikasi ini (SESSION_SAVE_PATH, default <temp>/quiz_pengupil_sessions)
+ * - sqlite : satu file SQLite (SESSION_SQLITE_PATH), butuh ekstensi pdo_sqlite
+ * - shm    : shared memory lewat APCu, butuh ekstensi apcu
+ *
+ * Session dimulai secara lazy: resume_session() hanya membuka session jika
+ * browser sudah membawa cookie session, sehingga GET halaman login oleh
+ * pengunjung anonim tidak menyentuh penyimpanan session sama sekali.
+ * begin_session() dipakai saat session memang perlu ditulis (login/register).
+ */
+
+class SqliteSessionHandler implements SessionHandlerInterface
+{
+    private $path;
+    private $db;
+
+    public function __construct($path)
+    {
+        $this->path = $path;
+    }
+
+    private function db()
+    {
+        if ($this->db === null) {
+            $this->db = new PDO('sqlite:' . $this->path);
+            $this->db->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+            // Kurangi kunci antar request bersamaan
+            $this->db->exec('PRAGMA journal_mode = WAL');
+            $this->db->exec('PRAGMA busy_timeout = 2000');
+            $this->db->exec('CREATE TABLE IF NOT EXISTS sessions (
+                id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                updated_at INTEGER NOT NULL
+            )');
+        }
+        return $this->db;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function open($save_path, $name)
+    {
+        return true;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function close()
+    {
+        return true;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function read($id)
+    {
+        $stmt = $this->db()->prepare('SELECT data FROM sessions WHERE id = ?');
+        $stmt->execute(array($id));
+        $data = $stmt->fetchColumn();
+        return $data === false ? '' : $data;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function write($id, $data)
+    {
+        $stmt = $this->db()->prepare('REPLACE INTO sessions (id, data, updated_at) VALUES (?, ?, ?)');
+        return $stmt->execute(array($id, $data, time()));
+    }
+
+    #[\ReturnTypeWillChange]
+    public function destroy($id)
+    {
+        $stmt = $this->db()->prepare('DELETE FROM sessions WHERE id = ?');
+        return $stmt->execute(array($id));
+    }
+
+    #[\ReturnTypeWillChange]
+    public function gc($maxlifetime)
+    {
+        $stmt = $this->db()->prepare('DELETE FROM sessions WHERE updated_at < ?');
+        $stmt->execute(array(time() - $maxlifetime));
+        return $stmt->rowCount();
+    }
+
+    public function purge()
+    {
+        return $this->db()->exec('DELETE FROM sessions');
+    }
+}
+
+class ApcuSessionHandler implements SessionHandlerInterface
+{
+    const PREFIX = 'quiz_pengupil_session:';
+
+    #[\ReturnTypeWillChange]
+    public function open($save_path, $name)
+    {
+        return true;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function close()
+    {
+        return true;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function read($id)
+    {
+        $data = apcu_fetch(self::PREFIX . $id);
+        return $data === false ? '' : $data;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function write($id, $data)
+    {
+        // Session kedaluwarsa otomatis lewat TTL APCu
+        return apcu_store(self::PREFIX . $id, $data, (int) ini_get('session.gc_maxlifetime'));
+    }
+
+    #[\ReturnTypeWillChange]
+    public function destroy($id)
+    {
+        apcu_delete(self::PREFIX . $id);
+        return true;
+    }
+
+    #[\ReturnTypeWillChange]
+    public function gc($maxlifetime)
+    {
+        return 0;
+    }
+
+    public function purge()
+    {
+        $entries = new APCUIterator('/^' . preg_quote(self::PREFIX, '/') . '/', APC_ITER_KEY);
+        $count = $entries->getTotalCount();
+        apcu_delete($entries);
+        return $count;
+    }
+}
+
+/**
+ * Folder file session milik aplikasi ini untuk handler file bawaan PHP
+ */
+function session_files_path()
+{
+    return getenv('SESSION_SAVE_PATH') ?: sys_get_temp_dir() . '/quiz_pengupil_sessions';
+}
+
+/**
+ * Memasang handler session sesuai SESSION_HANDLER (sekali per request)
+ * Mengembalikan handler yang dipakai, atau null untuk handler file bawaan PHP
+ */
+function configure_session()
+{
+    static $handler = false;
+    if ($handler !== false) {
+        return $handler;
+    }
+    $handler = null;
+
+    $backend = getenv('SESSION_HANDLER') ?: 'files';
+    if ($backend === 'sqlite' && extension_loaded('pdo_sqlite')) {
+        $path = getenv('SESSION_SQLITE_PATH') ?: sys_get_temp_dir() . '/quiz_pengupil_sessions.sqlite';
+        $handler = new SqliteSessionHandler($path);
+    } elseif ($backend === 'shm' && function_exists('apcu_enabled') && apcu_enabled()) {
+        $handler = new ApcuSessionHandler();
+    } elseif ($backend !== 'files') {
+        error_log("SESSION_HANDLER '$backend' tidak tersedia, memakai session file bawaan PHP");
+    }
+
+    if ($handler !== null) {
+        session_set_save_handler($handler, true);
+    } else {
+        // Folder sendiri agar purge_sessions() tidak menyentuh session aplikasi lain
+        $directory = session_files_path();
+        if (!is_dir($directory)) {
+            @mkdir($directory, 0700, true);
+        }
+        session_save_path($directory);
+        // Cron pembersih session distro (mis. Debian) hanya membersihkan save_path global
+        if ((int) ini_get('session.gc_probability') === 0) {
+            ini_set('session.gc_probability', '1');
+        }
+    }
+    return $handler;
+}
+
+/**
+ * Membuka session hanya jika browser sudah membawa cookie session
+ */
+function resume_session()
+{
+    if (session_status() === PHP_SESSION_ACTIVE) {
+        return true;
+    }
+    if (empty($_COOKIE[session_name()])) {
+        return false;
+    }
+    configure_session();
+    return session_start();
+}
+
+/**
+ * Membuka session (membuat baru jika belum ada) untuk ditulis
+ */
+function begin_session()
+{
+    if (session_status() === PHP_SESSION_ACTIVE) {
+        return true;
+    }
+    configure_session();
+    return session_start();
+}
+
+/**
+ * Menghapus semua session di backend yang aktif, mengembalikan jumlah yang dihapus
+ */
+function purge_sessions()
+{
+    $handler = configure_session();
+    if ($handler !== null) {
+        return $handler->purge();
+    }
+
+    // Handler file bawaan PHP: hanya file sess_* di folder session aplikasi ini,
+    // bukan save_path global yang bisa dipakai aplikasi lain di server yang sama
+    $count = 0;
+    foreach (glob(rtrim(session_files_path(), '/') . '/sess_*') ?: array() as $file) {
+        if (@unlink($file)) {
+            $count++;
+        }
+    }
+    return $count;
+}
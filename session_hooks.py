@@ -0,0 +1,82 @@
+"""
+Hook session di server PHP untuk suite test.
+
+session_purge.php menghapus semua session sekaligus jika server dijalankan
+dengan environment variable SESSION_PURGE_TOKEN. Jalankan suite dengan token
+yang sama; tanpa token hook ini nonaktif dan suite memakai logout biasa.
+
+session_probe.php melaporkan apakah cookie pemanggil milik session yang
+sudah login. probe_session() memanggilnya lewat request HTTP terpisah dengan
+cookie browser, sehingga status login bisa diperiksa tanpa navigasi.
+Set SESSION_PROBE=0 untuk hanya memeriksa cookie session.
+"""
+import json
+import os
+
+import urllib3
+
+import waits
+
+_POOL = urllib3.PoolManager(num_pools=2, maxsize=2, retries=False)
+
+# base_url yang tidak punya session_probe.php, agar tidak dicoba berulang
+_PROBE_UNAVAILABLE = set()
+
+def purge_enabled():
+    """Cek apakah hook purge session dikonfigurasi (SESSION_PURGE_TOKEN)"""
+    return bool(os.environ.get("SESSION_PURGE_TOKEN"))
+
+def purge_sessions(base_url):
+    """Menghapus semua session di server, mengembalikan jumlahnya atau None jika gagal/nonaktif"""
+    token = os.environ.get("SESSION_PURGE_TOKEN")
+    if not token:
+        return None
+    try:
+        response = _POOL.request("POST", f"{base_url}/session_purge.php",
+                                 fields={"token": token}, encode_multipart=False, timeout=10)
+    except urllib3.exceptions.HTTPError as e:
+        print(f"⚠️ Gagal menghubungi session_purge.php: {e}")
+        return None
+    if response.status != 200:
+        print(f"⚠️ session_purge.php menolak request (status {response.status})")
+        return None
+    purged = json.loads(response.data.decode("utf-8"))["purged"]
+    print(f"🧹 {purged} session di server dihapus")
+    return purged
+
+def probe_enabled():
+    """Cek apakah pemeriksaan lewat session_probe.php diizinkan (SESSION_PROBE != 0)"""
+    return os.environ.get("SESSION_PROBE", "1") != "0"
+
+def probe_session(base_url, cookies):
+    """Menanyakan status login session milik cookies ke session_probe.php
+
+    Mengembalikan True/False, atau None jika probe nonaktif atau endpoint tidak tersedia.
+    """
+    if not probe_enabled() or base_url in _PROBE_UNAVAILABLE:
+        return None
+    header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+    try:
+        response = _POOL.request("GET", f"{base_url}/session_probe.php",
+                                 headers={"Cookie": header}, timeout=5)
+    except urllib3.exceptions.HTTPError as e:
+        print(f"⚠️ Gagal menghubungi session_probe.php, hanya memeriksa cookie: {e}")
+        _PROBE_UNAVAILABLE.add(base_url)
+        return None
+    try:
+        return bool(json.loads(response.data.decode("utf-8"))["logged_in"])
+    except (ValueError, KeyError, TypeError):
+        # Server lama tanpa session_probe.php (404 atau halaman HTML)
+        print(f"⚠️ session_probe.php tidak tersedia (status {response.status}), hanya memeriksa cookie")
+        _PROBE_UNAVAILABLE.add(base_url)
+        return None
+
+def has_session(driver, base_url):
+    """Cek status login tanpa navigasi: cookie session, lalu session_probe.php jika tersedia"""
+    cookies = driver.get_cookies()
+    if not any(c["name"] == waits.SESSION_COOKIE for c in cookies):
+        # Session dibuka lazy: tanpa cookie session pasti belum login
+        return False
+    logged_in = probe_session(base_url, cookies)
+    # Tanpa probe, cookie session dianggap cukup (hanya dibuat saat login/register berhasil)
+    return True if logged_in is None else logged_in
@@ -0,0 +1,18 @@
+<?php
+/**
+ * Endpoint ringan untuk memeriksa session pemanggil tanpa memuat halaman
+ * Mengembalikan JSON {"logged_in": bool, "username": string|null}.
+ * Request tanpa cookie session tidak menyentuh penyimpanan session sama sekali.
+ */
+require('session.php');
+
+$username = null;
+if (resume_session()) {
+    $username = isset($_SESSION['username']) ? $_SESSION['username'] : null;
+    // Hanya membaca, lepaskan kunci session secepatnya
+    session_write_close();
+}
+
+header('Content-Type: application/json');
+header('Cache-Control: no-store');
+echo json_encode(array('logged_in' => $username !== null, 'username' => $username));
@@ -0,0 +1,27 @@
+<?php
+/**
+ * Hook admin/test untuk menghapus semua session sekaligus
+ *
+ * CLI : php session_purge.php
+ * HTTP: POST session_purge.php dengan field token = SESSION_PURGE_TOKEN.
+ *       Endpoint HTTP nonaktif (404) jika SESSION_PURGE_TOKEN tidak diisi.
+ */
+require('session.php');
+
+if (PHP_SAPI === 'cli') {
+    echo purge_sessions() . " session dihapus.\n";
+    exit;
+}
+
+$token = getenv('SESSION_PURGE_TOKEN');
+if ($token === false || $token === '') {
+    http_response_code(404);
+    exit;
+}
+if ($_SERVER['REQUEST_METHOD'] !== 'POST' || !hash_equals($token, (string) ($_POST['token'] ?? ''))) {
+    http_response_code(403);
+    exit;
+}
+
+header('Content-Type: application/json');
+echo json_encode(array('purged' => purge_sessions()));
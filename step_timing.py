@@ -0,0 +1,235 @@
+"""
+Instrumentasi waktu per langkah untuk operasi driver yang dipakai test.
+
+install() membungkus method WebDriver/WebElement Selenium, HttpDriver/
+HttpElement, WebDriverWait, dan time.sleep sehingga setiap langkah dicatat
+beserta durasinya. Langkah dikelompokkan menjadi:
+- "navigation" : get/refresh/click/submit (menunggu server PHP)
+- "dom"        : find_element(s), send_keys, execute_script, page_source (browser)
+- "artifact"   : screenshot
+- "idle"       : sleep, wait, dan execute_async_script (waktu yang dihabiskan
+                 suite untuk menunggu hasil di browser)
+
+Langkah bersarang (misalnya find_elements di dalam wait) hanya dicatat sebagai
+langkah terluar. Hasil ditulis ke file JSON lines dan dapat diringkas dengan
+print_report().
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import unittest
+from collections import defaultdict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+import http_driver
+
+OUTSIDE_TEST = "(setUpClass/tearDownClass)"
+KINDS = ("navigation", "dom", "artifact", "idle")
+
+class StepRecorder:
+    """Menyimpan catatan langkah proses ini di memori sampai flush()"""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = []
+        self.current_test = None
+        self.depth = 0
+        self.thread = threading.current_thread()
+        self.worker = os.environ.get("TEST_WORKER_ID")
+
+    def add_step(self, step, kind, duration, detail=None):
+        self.records.append({
+            "type": "step",
+            "test": self.current_test or OUTSIDE_TEST,
+            "step": step,
+            "kind": kind,
+            "duration": round(duration, 6),
+            "detail": detail,
+            "worker": self.worker,
+        })
+
+    def add_test(self, test_id, duration):
+        self.records.append({
+            "type": "test",
+            "test": test_id,
+            "duration": round(duration, 6),
+            "worker": self.worker,
+        })
+
+    def flush(self):
+        """Menambahkan catatan ke file JSON lines dengan satu kali write"""
+        if not self.records:
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+        self.records = []
+
+_recorder = None
+
+def _timed(func, step, kind, detail=None):
+    """Membungkus func agar durasinya dicatat sebagai satu langkah"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = _recorder
+        # Hanya langkah terluar pada thread test yang dicatat
+        if recorder is None or recorder.depth or threading.current_thread() is not recorder.thread:
+            return func(*args, **kwargs)
+        recorder.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.depth -= 1
+            recorder.add_step(step, kind, time.perf_counter() - start, detail(*args) if detail else None)
+    return wrapper
+
+def _locator(self, by="id", value=None, *_):
+    return f"{by}={value}"[:120]
+
+def _url(self, url, *_):
+    return url
+
+def _seconds(seconds, *_):
+    return seconds
+
+def _timeout(self, *_):
+    return getattr(self, "_timeout", None)
+
+# (nama method, nama langkah, kelompok, fungsi detail)
+DRIVER_STEPS = [
+    ("get", "get", "navigation", _url),
+    ("refresh", "refresh", "navigation", None),
+    ("find_element", "find_element", "dom", _locator),
+    ("find_elements", "find_elements", "dom", _locator),
+    ("execute_script", "execute_script", "dom", None),
+    # Script async dipakai waits.wait_for_form_result untuk menunggu hasil submit
+    ("execute_async_script", "async_wait", "idle", None),
+    ("save_screenshot", "save_screenshot", "artifact", None),
+    ("get_screenshot_as_base64", "screenshot", "artifact", None),
+]
+ELEMENT_STEPS = [
+    ("send_keys", "send_keys", "dom", None),
+    ("clear", "clear", "dom", None),
+    ("click", "click", "navigation", None),
+    ("submit", "submit", "navigation", None),
+    ("find_element", "find_element", "dom", _locator),
+    ("find_elements", "find_elements", "dom", _locator),
+]
+
+def _patch(cls, steps):
+    for name, step, kind, detail in steps:
+        original = cls.__dict__.get(name)
+        if callable(original):
+            setattr(cls, name, _timed(original, step, kind, detail))
+
+def _patch_test_case():
+    original_run = unittest.TestCase.run
+
+    @functools.wraps(original_run)
+    def run(self, result=None):
+        recorder = _recorder
+        if recorder is None:
+            return original_run(self, result)
+        recorder.current_test = self.id()
+        start = time.perf_counter()
+        try:
+            return original_run(self, result)
+        finally:
+            recorder.add_test(self.id(), time.perf_counter() - start)
+            recorder.current_test = None
+
+    unittest.TestCase.run = run
+
+def install(path=None):
+    """Mengaktifkan instrumentasi di proses ini; path default dari STEP_TIMING_FILE"""
+    global _recorder
+    path = path or os.environ.get("STEP_TIMING_FILE")
+    if not path:
+        return None
+    if _recorder is not None:
+        return _recorder
+    _recorder = StepRecorder(path)
+
+    _patch(WebDriver, DRIVER_STEPS)
+    _patch(WebElement, ELEMENT_STEPS)
+    _patch(http_driver.HttpDriver, DRIVER_STEPS)
+    _patch(http_driver.HttpElement, ELEMENT_STEPS)
+    WebDriver.page_source = property(_timed(WebDriver.page_source.fget, "page_source", "dom"))
+    WebDriverWait.until = _timed(WebDriverWait.until, "wait", "idle", _timeout)
+    WebDriverWait.until_not = _timed(WebDriverWait.until_not, "wait", "idle", _timeout)
+    time.sleep = _timed(time.sleep, "sleep", "idle", _seconds)
+    _patch_test_case()
+
+    atexit.register(flush)
+    return _recorder
+
+def flush():
+    """Menulis catatan proses ini ke file timing"""
+    if _recorder is not None:
+        _recorder.flush()
+
+def load_records(path):
+    """Membaca semua catatan dari file JSON lines"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def summarize(records, top=3):
+    """Meringkas catatan: langkah paling lambat per test dan pembagian waktu per kelompok"""
+    tests = {}
+    steps_per_test = defaultdict(list)
+    per_kind = defaultdict(float)
+    for record in records:
+        if record["type"] == "test":
+            tests[record["test"]] = tests.get(record["test"], 0.0) + record["duration"]
+        else:
+            steps_per_test[record["test"]].append(record)
+            per_kind[record["kind"]] += record["duration"]
+
+    slowest = {
+        test: sorted(steps, key=lambda r: r["duration"], reverse=True)[:top]
+        for test, steps in steps_per_test.items()
+    }
+    step_total = sum(per_kind.values())
+    total = sum(tests.values()) + sum(r["duration"] for r in steps_per_test.get(OUTSIDE_TEST, []))
+    return {
+        "tests": tests,
+        "slowest": slowest,
+        "per_kind": dict(per_kind),
+        "total": total,
+        # Waktu yang tidak tercakup langkah mana pun adalah kode suite itu sendiri
+        "other": max(total - step_total, 0.0),
+        "idle_share": per_kind["idle"] / total if total else 0.0,
+    }
+
+def print_report(path, top=3):
+    """Mencetak laporan langkah paling lambat per test dan porsi waktu idle"""
+    summary = summarize(load_records(path), top)
+    print("\n" + "=" * 40)
+    print("LAPORAN WAKTU PER LANGKAH")
+    print("=" * 40)
+    for test, steps in summary["slowest"].items():
+        duration = summary["tests"].get(test)
+        header = f"{test} ({duration:.2f} detik)" if duration is not None else test
+        print(f"\n⏱️ {header}")
+        for record in steps:
+            detail = f" {record['detail']}" if record.get("detail") is not None else ""
+            print(f"   {record['duration']:.3f}s  {record['step']}{detail}")
+
+    total = summary["total"]
+    print(f"\nTotal waktu test: {total:.2f} detik")
+    for kind in KINDS:
+        seconds = summary["per_kind"].get(kind, 0.0)
+        share = seconds / total * 100 if total else 0.0
+        print(f"   {kind:<10} {seconds:8.2f} detik ({share:.0f}%)")
+    other_share = summary["other"] / total * 100 if total else 0.0
+    print(f"   {'lainnya':<10} {summary['other']:8.2f} detik ({other_share:.0f}%)")
+    print(f"💤 Porsi waktu idle (sleep/wait/async_wait): {summary['idle_share'] * 100:.0f}%")
+    print(f"📝 Detail langkah tersimpan di {path}")
+    return summary
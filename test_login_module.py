@@ -2,15 +2,22 @@ import time
 import unittest
 import os
 import re
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import random
 import string
+import urllib3
+import waits
+import artifacts
+import browser_pool
+import db_fixtures
+import session_hooks
+import page_snapshot
+import php_server
+from http_driver import HttpDriver, use_http_backend
+from pages import LOCATOR_CACHE, LoginPage, RegisterPage
 
 """
 CATATAN PENTING TENTANG PENGUJIAN LOGIN.PHP
@@ -33,13 +40,18 @@ Kemungkinan penyebab masalah:
 Solusi yang diterapkan:
 1. Menggunakan mode incognito untuk menghindari cache dan cookie
 2. Menghapus cookie sebelum dan setelah logout
-3. Mencoba akses dengan parameter tambahan (?noredirect=1, ?bypass=1)
-4. Jika tidak bisa mengakses login.php, masih mencoba menjalankan test pada halaman yang tersedia
+3. Mencoba akses dengan parameter tambahan (?noredirect=1, ?nocache=...)
+4. Jika form login tetap tidak bisa dibuka, test gagal dengan screenshot dan source HTML halaman
 
 Jika pengujian masih gagal, perlu dilakukan analisis lebih lanjut pada file login.php
 dan memeriksa mekanisme session di PHP.
 """
 
+def throttle_setting(name, default):
+    """Batas pembatas login dari environment variable yang sama dengan login_throttle.php"""
+    value = os.environ.get(name)
+    return max(1, int(value)) if value is not None else default
+
 def generate_random_string(length=8):
     """Menghasilkan string acak dengan panjang tertentu"""
     return ''.join(random.choice(string.ascii_letters) for _ in range(length))
@@ -53,19 +65,8 @@ class TestLoginModule(unittest.TestCase):
         print("MEMULAI PENGUJIAN MODUL LOGIN")
         print("=" * 60)
         
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Jalankan dalam mode headless
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")  # Atur ukuran window
-        chrome_options.add_argument("--incognito")  # Gunakan mode incognito untuk menghindari cache dan cookie
-        
-        # Gunakan chromedriver dari folder chromedriver-win64 jika ada
         script_dir = os.path.dirname(os.path.abspath(__file__))
         project_dir = script_dir  # Diasumsikan script berada di root project
-        chrome_driver_path = os.path.join(project_dir, "chromedriver-win64", "chromedriver.exe")
         
         # Buat folder untuk screenshot
         cls.screenshot_folder = os.path.join(project_dir, "ss_login")
@@ -73,21 +74,8 @@ class TestLoginModule(unittest.TestCase):
             os.makedirs(cls.screenshot_folder)
             print(f"✅ Folder screenshot dibuat di {cls.screenshot_folder}")
         
-        # Setup driver
-        if os.path.exists(chrome_driver_path):
-            # Gunakan chromedriver lokal
-            service = Service(executable_path=chrome_driver_path)
-            cls.driver = webdriver.Chrome(service=service, options=chrome_options)
-            print(f"✅ Menggunakan ChromeDriver lokal dari: {chrome_driver_path}")
-        else:
-            # Gunakan webdriver manager jika tersedia
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                cls.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-                print("✅ Menggunakan ChromeDriver dari WebDriver Manager")
-            except ImportError:
-                print("⚠️ WebDriver Manager tidak tersedia, menggunakan cara default")
-                cls.driver = webdriver.Chrome(options=chrome_options)
+        # Screenshot dan source HTML ditulis di background sesuai ARTIFACT_POLICY
+        cls.artifacts = artifacts.ArtifactCollector(cls.screenshot_folder)
         
         # Tentukan URL base yang akan diuji
         if 'BASE_URL' in os.environ:
@@ -98,28 +86,35 @@ class TestLoginModule(unittest.TestCase):
         
         print(f"✅ URL yang diuji: {cls.base_url}")
         
+        # Tunggu sampai server menjawab sebelum browser diambil dari pool
+        if not php_server.wait_until_ready(cls.base_url):
+            raise RuntimeError(f"❌ Server tidak merespons di {cls.base_url}")
+        print(f"✅ Server dapat diakses di {cls.base_url}")
+        
+        # Setup driver
+        if use_http_backend():
+            # Backend HTTP: jalankan skenario tanpa browser
+            cls.driver = HttpDriver()
+            print("✅ Menggunakan backend HTTP (tanpa browser)")
+        else:
+            # Ambil browser yang sudah berjalan dari pool proses ini
+            cls.driver = browser_pool.get_pool().acquire()
+        # Arahkan request driver ke namespace database proses ini (DB_NAMESPACES=1)
+        db_fixtures.attach_namespace(cls.driver)
+        
         # Hapus semua cookie dan cache
         cls.driver.delete_all_cookies()
         print("✅ Semua cookie dihapus")
         
-        # Periksa apakah server berjalan
+        # Pastikan logout terlebih dahulu untuk menghapus sesi yang mungkin ada
         try:
-            cls.driver.get(cls.base_url)
-            print(f"✅ Server dapat diakses di {cls.base_url}")
-            cls.save_screenshot(cls.driver, "server_check.png")
-            
-            # Pastikan logout terlebih dahulu untuk menghapus sesi yang mungkin ada
-            try:
-                cls.driver.get(f"{cls.base_url}/logout.php")
-                time.sleep(2)
-                # Hapus cookie lagi setelah logout
-                cls.driver.delete_all_cookies()
-                print("✅ Logout dilakukan untuk memastikan tidak ada sesi aktif")
-            except Exception as e:
-                print(f"⚠️ Error saat mencoba logout: {e}")
-            
+            cls.driver.get(f"{cls.base_url}/logout.php")
+            waits.wait_for_document_ready(cls.driver)
+            # Hapus cookie lagi setelah logout
+            cls.driver.delete_all_cookies()
+            print("✅ Logout dilakukan untuk memastikan tidak ada sesi aktif")
         except Exception as e:
-            print(f"⚠️ Masalah mengakses server: {e}")
+            print(f"⚠️ Error saat mencoba logout: {e}")
             cls.save_screenshot(cls.driver, "server_error.png")
         
         # Kredensial pengguna untuk pengujian
@@ -128,335 +123,88 @@ class TestLoginModule(unittest.TestCase):
         cls.test_name = "Test User"
         cls.test_email = f"testuser_{generate_random_string()}@example.com"
         
+        # Snapshot tabel users sebelum user test dibuat (DB_RESET/DB_NAMESPACES)
+        db_fixtures.take_snapshot()
+        
         # Buat user untuk pengujian
         cls.create_test_user()
     
     @classmethod
     def tearDownClass(cls):
         """Dijalankan sekali setelah semua test selesai"""
-        # Tutup browser
-        cls.driver.quit()
-        print("✅ Browser ditutup")
+        # Tunggu semua screenshot/source HTML selesai ditulis
+        cls.artifacts.flush()
+        print(f"📸 {cls.artifacts.written} artifact disimpan di {cls.screenshot_folder}")
+        print(LOCATOR_CACHE.report("form"))
+        
+        # Buang user test dan baris lain yang ditulis kelas ini
+        db_fixtures.restore_snapshot()
+        
+        # Kembalikan browser ke pool (state dibersihkan, browser tidak ditutup)
+        if isinstance(cls.driver, HttpDriver):
+            cls.driver.quit()
+        else:
+            browser_pool.get_pool().release(cls.driver)
+        print("✅ Browser dikembalikan ke pool")
+    
+    def tearDown(self):
+        """Simpan artifact kegagalan sesuai ARTIFACT_POLICY"""
+        self.artifact_refs = self.artifacts.finish_test(self.driver, self._testMethodName,
+                                                        artifacts.test_failed(self))
     
     @classmethod
     def save_screenshot(cls, driver, filename):
-        """Menyimpan screenshot dengan nama file yang ditentukan"""
-        try:
-            full_path = os.path.join(cls.screenshot_folder, filename)
-            driver.save_screenshot(full_path)
-            print(f"✅ Screenshot disimpan: {full_path}")
-            return full_path
-        except Exception as e:
-            print(f"❌ Gagal menyimpan screenshot: {e}")
-            return None
+        """Mencatat screenshot dengan nama file yang ditentukan (ditulis di background)"""
+        full_path = cls.artifacts.screenshot(driver, filename)
+        if full_path:
+            print(f"✅ Screenshot dicatat: {full_path}")
+        return full_path
+    
+    @classmethod
+    def save_page_source(cls, driver, filename):
+        """Mencatat source HTML halaman saat ini untuk diagnosis (ditulis di background)"""
+        full_path = cls.artifacts.page_source(driver, filename)
+        if full_path:
+            print(f"📝 Source HTML dicatat: {full_path}")
+        return full_path
     
     @classmethod
     def create_test_user(cls):
-        """Membuat user untuk pengujian melalui halaman register"""
+        """Membuat user untuk pengujian, langsung di database atau melalui halaman register"""
+        # Utamakan fixture database: cepat dan tidak bergantung pada register.php
+        if db_fixtures.get_fixtures().create_user(cls.test_username, cls.test_password, cls.test_name, cls.test_email):
+            print(f"✅ User test dibuat langsung di database: {cls.test_username}")
+            return True
+        print("⚠️ Fixture database tidak tersedia, membuat user test melalui halaman register")
+        
         driver = cls.driver
         try:
-            print(f"📋 Membuat user test untuk pengujian login")
-            
             # Bersihkan cookie dan cache
             driver.delete_all_cookies()
             
-            # Buka halaman register
-            register_url = f"{cls.base_url}/register.php?noredirect=1"
-            driver.get(register_url)
-            
-            # Tambahkan wait agar halaman dimuat sempurna
-            time.sleep(3)
-            print(f"📄 Halaman register: {driver.current_url}")
-            
-            # Periksa apakah redirect terjadi
-            if "register.php" not in driver.current_url:
-                print(f"⚠️ Halaman register tidak bisa diakses langsung, mencoba alternatif...")
-                driver.get(f"{cls.base_url}/register.php?bypass=1&t={int(time.time())}")
-                time.sleep(2)
-            
-            # Debug: dump source HTML halaman untuk melihat struktur
-            with open("register_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman register disimpan ke file register_page.html")
+            page = RegisterPage(driver, cls.base_url)
+            if not page.open("?noredirect=1"):
+                cls.save_page_source(driver, "register_page.html")
+                print(f"⚠️ Form register tidak ditemukan, halaman: {driver.current_url}")
+                print(page_snapshot.take(driver).describe())
+                return False
             
-            # Coba identifikasi semua field input
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            print(f"🔍 Ditemukan {len(inputs)} field input pada halaman register")
-            for i, input_elem in enumerate(inputs):
-                input_id = input_elem.get_attribute("id") or "no-id"
-                input_name = input_elem.get_attribute("name") or "no-name"
-                input_type = input_elem.get_attribute("type") or "no-type"
-                input_placeholder = input_elem.get_attribute("placeholder") or "no-placeholder"
-                print(f"  {i+1}. ID: {input_id}, Name: {input_name}, Type: {input_type}, Placeholder: {input_placeholder}")
+            result = page.register(cls.test_name, cls.test_email, cls.test_username, cls.test_password)
             
-            # Coba identifikasi semua button
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            print(f"🔍 Ditemukan {len(buttons)} button pada halaman register")
-            for i, button in enumerate(buttons):
-                button_id = button.get_attribute("id") or "no-id"
-                button_name = button.get_attribute("name") or "no-name"
-                button_type = button.get_attribute("type") or "no-type"
-                button_text = button.text or "no-text"
-                print(f"  {i+1}. ID: {button_id}, Name: {button_name}, Type: {button_type}, Text: {button_text}")
-            
-            # Isi form register dengan mencoba beberapa strategi alternatif
-            # Strategi 1: Coba isi berdasarkan urutan field
-            if len(inputs) >= 5:  # Asumsi minimal ada 5 field (nama, email, username, password, repassword)
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email", "password"]]
-                if len(text_inputs) >= 5:
-                    print("✅ Menggunakan strategi 1: Isi berdasarkan urutan field")
-                    # Asumsi urutan: nama, email, username, password, repassword
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(cls.test_name)
-                    text_inputs[1].clear()
-                    text_inputs[1].send_keys(cls.test_email)
-                    text_inputs[2].clear()
-                    text_inputs[2].send_keys(cls.test_username)
-                    text_inputs[3].clear()
-                    text_inputs[3].send_keys(cls.test_password)
-                    text_inputs[4].clear()
-                    text_inputs[4].send_keys(cls.test_password)
-                    
-                    # Klik tombol submit
-                    if buttons:
-                        buttons[0].click()
-                        print("✅ Tombol register diklik menggunakan strategi 1")
-                    else:
-                        print("⚠️ Tidak ada button ditemukan untuk strategi 1")
-                else:
-                    print("⚠️ Tidak cukup text input untuk strategi 1")
-            else:
-                print("⚠️ Tidak cukup input untuk strategi 1")
-            
-            # Tunggu sebentar dan ambil screenshot
-            time.sleep(3)
+            # Ambil screenshot hasil registrasi
             cls.save_screenshot(driver, "create_test_user.png")
             
-            print(f"✅ User test dibuat: {cls.test_username}")
+            print(f"✅ User test dibuat: {cls.test_username} (hasil: {result.outcome})")
             return True
         except Exception as e:
             print(f"❌ Gagal membuat user test: {e}")
             cls.save_screenshot(driver, "create_test_user_failed.png")
             return False
     
-    @staticmethod
-    def fill_input_field(driver, field_identifier, value):
-        """Mengisi field input berdasarkan id, name, atau placeholder"""
-        # Tambahkan logging untuk debugging
-        print(f"🔍 Mencoba mencari dan mengisi field '{field_identifier}' dengan nilai '{value}'")
-        
-        # Coba dengan id
-        try:
-            input_elem = driver.find_element(By.ID, field_identifier)
-            input_elem.clear()
-            input_elem.send_keys(value)
-            print(f"✅ Berhasil mengisi field dengan ID '{field_identifier}'")
-            return True
-        except NoSuchElementException:
-            print(f"⚠️ Field dengan ID '{field_identifier}' tidak ditemukan")
-        
-        # Coba dengan name
-        try:
-            input_elem = driver.find_element(By.NAME, field_identifier)
-            input_elem.clear()
-            input_elem.send_keys(value)
-            print(f"✅ Berhasil mengisi field dengan NAME '{field_identifier}'")
-            return True
-        except NoSuchElementException:
-            print(f"⚠️ Field dengan NAME '{field_identifier}' tidak ditemukan")
-        
-        # Coba cari berdasarkan placeholder yang mengandung field_identifier
-        try:
-            input_elem = driver.find_element(By.XPATH, f"//input[contains(@placeholder, '{field_identifier}')]")
-            input_elem.clear()
-            input_elem.send_keys(value)
-            print(f"✅ Berhasil mengisi field dengan placeholder yang berisi '{field_identifier}'")
-            return True
-        except NoSuchElementException:
-            print(f"⚠️ Field dengan placeholder yang berisi '{field_identifier}' tidak ditemukan")
-        
-        # Coba cari berdasarkan label
-        try:
-            # Cari label yang mengandung teks field_identifier
-            label = driver.find_element(By.XPATH, f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{field_identifier.lower()}')]")
-            # Dapatkan id dari for attribute
-            input_id = label.get_attribute("for")
-            if input_id:
-                input_elem = driver.find_element(By.ID, input_id)
-                input_elem.clear()
-                input_elem.send_keys(value)
-                print(f"✅ Berhasil mengisi field berdasarkan label untuk '{field_identifier}'")
-                return True
-        except NoSuchElementException:
-            print(f"⚠️ Label untuk '{field_identifier}' tidak ditemukan")
-        
-        # Coba cara lain: semua input dan cek label terdekat
-        try:
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            for input_elem in inputs:
-                input_type = input_elem.get_attribute("type")
-                if input_type in ["text", "password", "email"]:
-                    # Ambil elemen parent dan periksa teks apakah mengandung field_identifier
-                    parent = input_elem.find_element(By.XPATH, "./..")
-                    if field_identifier.lower() in parent.text.lower():
-                        input_elem.clear()
-                        input_elem.send_keys(value)
-                        print(f"✅ Berhasil mengisi field berdasarkan teks parent yang memuat '{field_identifier}'")
-                        return True
-        except Exception as e:
-            print(f"⚠️ Error mencoba cara alternatif: {e}")
-        
-        # Screenshot untuk debugging
-        timestamp = int(time.time())
-        TestLoginModule.save_screenshot(driver, f"debug_field_not_found_{field_identifier}_{timestamp}.png")
-        print(f"⚠️ Tidak dapat menemukan field '{field_identifier}', halaman: {driver.current_url}")
-        
-        # Tampilkan source halaman untuk debugging
-        page_source = driver.page_source
-        print(f"--- Potongan HTML halaman ---\n{page_source[:500]}...\n---------------------------")
-        
-        return False
-    
-    @staticmethod
-    def find_and_click_button(driver):
-        """Menemukan dan mengklik tombol submit/login/register"""
-        print("🔍 Mencoba menemukan dan mengklik tombol submit/login")
-        
-        # Tunggu sebentar agar halaman dimuat sempurna
-        time.sleep(2)
-        
-        # Coba cari dengan name=submit
-        try:
-            button = driver.find_element(By.NAME, "submit")
-            print("✅ Tombol dengan NAME 'submit' ditemukan")
-            button.click()
-            return True
-        except NoSuchElementException:
-            print("⚠️ Tombol dengan NAME 'submit' tidak ditemukan")
-        except Exception as e:
-            print(f"⚠️ Error mengklik button name=submit: {e}")
-        
-        # Coba cari button dengan teks
-        button_texts = ["Sign In", "Login", "Masuk", "Submit", "Sign Up", "Register"]
-        for text in button_texts:
-            try:
-                button = driver.find_element(By.XPATH, f"//button[contains(text(), '{text}')]")
-                print(f"✅ Tombol dengan teks '{text}' ditemukan")
-                button.click()
-                return True
-            except NoSuchElementException:
-                print(f"⚠️ Tombol dengan teks '{text}' tidak ditemukan")
-            except Exception as e:
-                print(f"⚠️ Error mengklik button dengan teks '{text}': {e}")
-        
-        # Coba cari input[type=submit]
-        try:
-            button = driver.find_element(By.XPATH, "//input[@type='submit']")
-            print("✅ Input submit ditemukan")
-            button.click()
-            return True
-        except NoSuchElementException:
-            print("⚠️ Input submit tidak ditemukan")
-        except Exception as e:
-            print(f"⚠️ Error mengklik input submit: {e}")
-        
-        # Coba cari button tanpa teks tertentu (jika hanya ada 1 button)
-        try:
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            if len(buttons) == 1:
-                print("✅ Satu-satunya button pada halaman ditemukan")
-                buttons[0].click()
-                return True
-            elif len(buttons) > 1:
-                print(f"⚠️ Ditemukan {len(buttons)} button, tidak dapat menentukan yang mana untuk diklik")
-                # Klik button pertama yang ditemukan jika tidak ada pilihan lain
-                print("✅ Mengklik button pertama yang ditemukan")
-                buttons[0].click()
-                return True
-        except NoSuchElementException:
-            print("⚠️ Tidak ada button ditemukan pada halaman")
-        except Exception as e:
-            print(f"⚠️ Error saat mengklik satu-satunya button: {e}")
-        
-        # Coba metode terakhir: mencari elemen dengan tipe button atau submit
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, "[type='button'], [type='submit'], button, input[type='submit']")
-            if elements:
-                print("✅ Menemukan elemen dengan tipe button/submit")
-                elements[0].click()
-                return True
-        except Exception as e:
-            print(f"⚠️ Error saat mencoba metode terakhir: {e}")
-        
-        # Screenshot untuk debugging
-        timestamp = int(time.time())
-        TestLoginModule.save_screenshot(driver, f"debug_button_not_found_{timestamp}.png")
-        print(f"⚠️ Tidak dapat menemukan tombol login/submit, halaman: {driver.current_url}")
-        
-        # Tampilkan source halaman untuk debugging
-        page_source = driver.page_source
-        print(f"--- Potongan HTML halaman ---\n{page_source[:500]}...\n---------------------------")
-        
-        return False
-    
-    @staticmethod
-    def element_exists(driver, by, value):
-        """Memeriksa apakah elemen ada di halaman"""
-        try:
-            driver.find_element(by, value)
-            return True
-        except NoSuchElementException:
-            return False
-    
     @staticmethod
     def is_logged_in(driver, base_url):
-        """Memeriksa apakah user sudah login berdasarkan redirect ke index.php atau elemen tertentu"""
-        try:
-            # Cek apakah URL adalah index.php
-            current_url = driver.current_url
-            if current_url == f"{base_url}/index.php" or current_url == f"{base_url}/" or current_url.endswith("/index.php"):
-                return True
-            
-            # Coba cari elemen yang hanya muncul saat login, seperti tombol logout
-            logout_link = driver.find_element(By.XPATH, "//a[contains(text(), 'Logout') or contains(@href, 'logout.php')]")
-            if logout_link:
-                return True
-                
-            return False
-        except NoSuchElementException:
-            return False
-    
-    def wait_for_result(self, driver, timeout=5):
-        """Menunggu hasil dari proses login"""
-        wait = WebDriverWait(driver, timeout)
-        current_url = driver.current_url
-        
-        # Catat waktu mulai
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            # Cek apakah login berhasil (redirect ke index.php)
-            if TestLoginModule.is_logged_in(driver, self.base_url):
-                return "success"
-            
-            # Cek apakah ada pesan error
-            if self.element_exists(driver, By.CLASS_NAME, "alert-danger"):
-                return "error"
-                
-            # Cek pesan validasi
-            if self.element_exists(driver, By.CLASS_NAME, "text-danger"):
-                return "validation"
-                
-            # Cek URL berubah
-            if driver.current_url != current_url:
-                return "url_changed"
-                
-            # Tunggu sebentar
-            time.sleep(0.5)
-            
-        # Waktu habis, ambil screenshot
-        TestLoginModule.save_screenshot(driver, f"timeout_waiting_for_result_{int(time.time())}.png")
-        return "timeout"
+        """Memeriksa apakah user sudah login (URL index.php atau link logout) dari satu snapshot halaman"""
+        return page_snapshot.take(driver).logged_in(base_url)
     
     def clear_session_and_cookies(self):
         """Metode bantuan untuk membersihkan semua session dan cookie"""
@@ -465,20 +213,53 @@ class TestLoginModule(unittest.TestCase):
         # Hapus semua cookie
         driver.delete_all_cookies()
         
+        # Server dengan session lazy + hook purge: tanpa cookie, request berikutnya
+        # pasti anonim sehingga tidak perlu logout (session lama di-purge oleh runner)
+        if session_hooks.purge_enabled():
+            print("✅ Cookie dihapus (session server dikelola hook purge)")
+            return True
+        
         # Coba logout
         try:
             driver.get(f"{self.base_url}/logout.php")
-            time.sleep(2)
+            waits.wait_for_document_ready(driver)
         except Exception as e:
             print(f"⚠️ Error saat mencoba logout: {e}")
         
-        # Hapus cache dengan membuka halaman kosong
-        driver.get("about:blank")
-        time.sleep(1)
+        # Hapus cookie dan storage lalu buka halaman kosong
+        if isinstance(driver, HttpDriver):
+            driver.get("about:blank")
+        else:
+            browser_pool.reset_driver(driver)
         
         print("✅ Session dan cookie dibersihkan")
         return True
     
+    def open_login_page(self, tc):
+        """Bersihkan session lalu buka form login, dengan satu percobaan ulang jika masih dialihkan"""
+        driver = self.driver
+        self.clear_session_and_cookies()
+        
+        page = LoginPage(driver, self.base_url)
+        if page.open("?noredirect=1"):
+            print(f"📄 Halaman login dibuka: {driver.current_url}")
+            return page
+        
+        print(f"⚠️ Form login tidak tersedia, URL: {driver.current_url}")
+        if "index.php" in driver.current_url:
+            print("⚠️ Masih dialihkan ke index.php. Mencoba hapus semua cookie dan session...")
+            self.clear_session_and_cookies()
+            # Parameter waktu untuk menghindari cache
+            if page.open(f"?nocache={int(time.time())}"):
+                print(f"📄 Halaman login dibuka setelah percobaan ulang: {driver.current_url}")
+                return page
+        
+        # Ambil screenshot, daftar field, dan source code untuk diagnosis
+        self.save_screenshot(driver, "login_issue.png")
+        print(page_snapshot.take(driver).describe())
+        self.save_page_source(driver, "current_page.html")
+        self.fail(f"❌ {tc}: Tidak dapat membuka form login, URL: {driver.current_url}")
+    
     def test_01_valid_login(self):
         """Test Case 1: Login dengan username dan password yang valid"""
         print("\n" + "-" * 50)
@@ -487,168 +268,30 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
+            page = self.open_login_page("TC1")
             
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            print(f"🔍 Ditemukan {len(inputs)} field input pada halaman login")
-            for i, input_elem in enumerate(inputs):
-                input_id = input_elem.get_attribute("id") or "no-id"
-                input_name = input_elem.get_attribute("name") or "no-name"
-                input_type = input_elem.get_attribute("type") or "no-type"
-                input_placeholder = input_elem.get_attribute("placeholder") or "no-placeholder"
-                print(f"  {i+1}. ID: {input_id}, Name: {input_name}, Type: {input_type}, Placeholder: {input_placeholder}")
-            
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            print(f"🔍 Ditemukan {len(buttons)} button pada halaman login")
-            for i, button in enumerate(buttons):
-                button_id = button.get_attribute("id") or "no-id"
-                button_name = button.get_attribute("name") or "no-name"
-                button_type = button.get_attribute("type") or "no-type"
-                button_text = button.text or "no-text"
-                print(f"  {i+1}. ID: {button_id}, Name: {button_name}, Type: {button_type}, Text: {button_text}")
+            # Daftar field dan tombol form login (satu snapshot)
+            print(page_snapshot.take(driver).describe())
             
             # Tangkap screenshot form login
             self.save_screenshot(driver, "tc1_login_form.png")
             
-            # Strategi 1: Coba isi berdasarkan atribut name
-            username_filled = False
-            password_filled = False
-            
-            # Coba cari input dengan name="username"
-            try:
-                username_input = driver.find_element(By.NAME, "username")
-                username_input.clear()
-                username_input.send_keys(self.test_username)
-                username_filled = True
-                print(f"✅ Field username berhasil diisi dengan '{self.test_username}'")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='username'")
-            
-            # Coba cari input dengan name="password"
-            try:
-                password_input = driver.find_element(By.NAME, "password")
-                password_input.clear()
-                password_input.send_keys(self.test_password)
-                password_filled = True
-                print(f"✅ Field password berhasil diisi")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='password'")
-            
-            if not username_filled or not password_filled:
-                # Strategi 2: Coba berdasarkan urutan field
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email"]]
-                password_inputs = [inp for inp in inputs if inp.get_attribute("type") == "password"]
-                
-                if text_inputs and not username_filled:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(self.test_username)
-                    username_filled = True
-                    print(f"✅ Field username berhasil diisi menggunakan strategi 2")
-                    
-                if password_inputs and not password_filled:
-                    password_inputs[0].clear()
-                    password_inputs[0].send_keys(self.test_password)
-                    password_filled = True
-                    print(f"✅ Field password berhasil diisi menggunakan strategi 2")
-            
-            if not username_filled:
-                self.fail("❌ TC1: Gagal mengisi field username")
-            
-            if not password_filled:
-                self.fail("❌ TC1: Gagal mengisi field password")
-            
-            # Klik tombol login
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC1: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah login: {driver.current_url}")
+            print(f"🔧 Data test: username='{self.test_username}'")
+            result = page.login(self.test_username, self.test_password)
+            print(f"📄 URL setelah login: {result.url}")
             
             # Tangkap screenshot hasil login
             self.save_screenshot(driver, "tc1_login_result.png")
             
             # Verifikasi hasil
-            if TestLoginModule.is_logged_in(driver, self.base_url):
+            if result.snapshot.logged_in(self.base_url):
                 print("✅ TC1: Login berhasil dengan kredensial valid")
             else:
-                page_source = driver.page_source
-                print(f"--- Potongan HTML halaman setelah login ---\n{page_source[:500]}...\n---------------------------")
-                self.fail(f"❌ TC1: Login gagal dengan kredensial valid, URL setelah login: {driver.current_url}")
+                self.save_page_source(driver, "tc1_login_failed.html")
+                self.fail(f"❌ TC1: Login gagal dengan kredensial valid, URL setelah login: {result.url}, pesan: {result.alert}")
         
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc1_error_{int(time.time())}.png")
             self.fail(f"❌ TC1: Error tidak terduga: {e}")
@@ -661,157 +304,28 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
-            
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
+            page = self.open_login_page("TC2")
             
             # Siapkan data test
             invalid_username = f"invalid_user_{generate_random_string()}"
             print(f"🔧 Data test: username='{invalid_username}', password='{self.test_password}'")
             
-            # Strategi 1: Coba isi berdasarkan atribut name
-            username_filled = False
-            password_filled = False
-            
-            # Coba cari input dengan name="username"
-            try:
-                username_input = driver.find_element(By.NAME, "username")
-                username_input.clear()
-                username_input.send_keys(invalid_username)
-                username_filled = True
-                print(f"✅ Field username berhasil diisi dengan '{invalid_username}'")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='username'")
-            
-            # Coba cari input dengan name="password"
-            try:
-                password_input = driver.find_element(By.NAME, "password")
-                password_input.clear()
-                password_input.send_keys(self.test_password)
-                password_filled = True
-                print(f"✅ Field password berhasil diisi")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='password'")
-            
-            if not username_filled or not password_filled:
-                # Strategi 2: Coba berdasarkan urutan field
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email"]]
-                password_inputs = [inp for inp in inputs if inp.get_attribute("type") == "password"]
-                
-                if text_inputs and not username_filled:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(invalid_username)
-                    username_filled = True
-                    print(f"✅ Field username berhasil diisi menggunakan strategi 2")
-                    
-                if password_inputs and not password_filled:
-                    password_inputs[0].clear()
-                    password_inputs[0].send_keys(self.test_password)
-                    password_filled = True
-                    print(f"✅ Field password berhasil diisi menggunakan strategi 2")
-            
-            if not username_filled:
-                self.fail("❌ TC2: Gagal mengisi field username")
-            
-            if not password_filled:
-                self.fail("❌ TC2: Gagal mengisi field password")
-            
-            # Klik tombol login
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC2: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah login: {driver.current_url}")
+            result = page.login(invalid_username, self.test_password)
+            print(f"📄 URL setelah login: {result.url}")
             
             # Tangkap screenshot hasil login
             self.save_screenshot(driver, "tc2_invalid_username.png")
             
             # Verifikasi hasil: login seharusnya gagal
-            if not TestLoginModule.is_logged_in(driver, self.base_url):
-                # Cek pesan error
-                try:
-                    error_message = driver.find_element(By.CLASS_NAME, "alert-danger").text
-                    print(f"✅ TC2: Login gagal dengan username tidak valid, pesan: {error_message}")
-                except NoSuchElementException:
-                    print("⚠️ TC2: Tidak ada pesan error yang ditampilkan, tapi login gagal")
-            else:
+            if result.snapshot.logged_in(self.base_url):
                 self.fail(f"❌ TC2: Login berhasil dengan username tidak valid!")
+            if result.alert:
+                print(f"✅ TC2: Login gagal dengan username tidak valid, pesan: {result.alert}")
+            else:
+                print("⚠️ TC2: Tidak ada pesan error yang ditampilkan, tapi login gagal")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc2_error_{int(time.time())}.png")
             self.fail(f"❌ TC2: Error tidak terduga: {e}")
@@ -824,157 +338,28 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
+            page = self.open_login_page("TC3")
             
             # Siapkan data test
             invalid_password = f"WrongPassword{generate_random_string()}"
             print(f"🔧 Data test: username='{self.test_username}', password='{invalid_password}'")
             
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            
-            # Strategi 1: Coba isi berdasarkan atribut name
-            username_filled = False
-            password_filled = False
-            
-            # Coba cari input dengan name="username"
-            try:
-                username_input = driver.find_element(By.NAME, "username")
-                username_input.clear()
-                username_input.send_keys(self.test_username)
-                username_filled = True
-                print(f"✅ Field username berhasil diisi dengan '{self.test_username}'")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='username'")
-            
-            # Coba cari input dengan name="password"
-            try:
-                password_input = driver.find_element(By.NAME, "password")
-                password_input.clear()
-                password_input.send_keys(invalid_password)
-                password_filled = True
-                print(f"✅ Field password berhasil diisi")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='password'")
-            
-            if not username_filled or not password_filled:
-                # Strategi 2: Coba berdasarkan urutan field
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email"]]
-                password_inputs = [inp for inp in inputs if inp.get_attribute("type") == "password"]
-                
-                if text_inputs and not username_filled:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(self.test_username)
-                    username_filled = True
-                    print(f"✅ Field username berhasil diisi menggunakan strategi 2")
-                    
-                if password_inputs and not password_filled:
-                    password_inputs[0].clear()
-                    password_inputs[0].send_keys(invalid_password)
-                    password_filled = True
-                    print(f"✅ Field password berhasil diisi menggunakan strategi 2")
-            
-            if not username_filled:
-                self.fail("❌ TC3: Gagal mengisi field username")
-            
-            if not password_filled:
-                self.fail("❌ TC3: Gagal mengisi field password")
-            
-            # Klik tombol login
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC3: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah login: {driver.current_url}")
+            result = page.login(self.test_username, invalid_password)
+            print(f"📄 URL setelah login: {result.url}")
             
             # Tangkap screenshot hasil login
             self.save_screenshot(driver, "tc3_invalid_password.png")
             
             # Verifikasi hasil: login seharusnya gagal
-            if not TestLoginModule.is_logged_in(driver, self.base_url):
-                # Cek pesan error
-                try:
-                    error_message = driver.find_element(By.CLASS_NAME, "alert-danger").text
-                    print(f"✅ TC3: Login gagal dengan password tidak valid, pesan: {error_message}")
-                except NoSuchElementException:
-                    print("⚠️ TC3: Tidak ada pesan error yang ditampilkan, tapi login gagal")
-            else:
+            if result.snapshot.logged_in(self.base_url):
                 self.fail(f"❌ TC3: Login berhasil dengan password tidak valid!")
+            if result.alert:
+                print(f"✅ TC3: Login gagal dengan password tidak valid, pesan: {result.alert}")
+            else:
+                print("⚠️ TC3: Tidak ada pesan error yang ditampilkan, tapi login gagal")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc3_error_{int(time.time())}.png")
             self.fail(f"❌ TC3: Error tidak terduga: {e}")
@@ -987,106 +372,25 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
-            
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
+            page = self.open_login_page("TC4")
             
             # Klik tombol login tanpa mengisi apapun
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC4: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah klik login: {driver.current_url}")
+            result = page.submit()
+            print(f"📄 URL setelah klik login: {result.url}")
             
             # Tangkap screenshot hasil login
             self.save_screenshot(driver, "tc4_empty_fields.png")
             
             # Verifikasi hasil: login seharusnya gagal
-            if not TestLoginModule.is_logged_in(driver, self.base_url):
-                # Cek pesan error
-                try:
-                    error_message = driver.find_element(By.CLASS_NAME, "alert-danger").text
-                    print(f"✅ TC4: Login gagal dengan field kosong, pesan: {error_message}")
-                except NoSuchElementException:
-                    print("⚠️ TC4: Tidak ada pesan error yang ditampilkan, tapi login gagal")
-            else:
+            if result.snapshot.logged_in(self.base_url):
                 self.fail(f"❌ TC4: Login berhasil tanpa mengisi apapun!")
+            if result.alert:
+                print(f"✅ TC4: Login gagal dengan field kosong, pesan: {result.alert}")
+            else:
+                print("⚠️ TC4: Tidak ada pesan error yang ditampilkan, tapi login gagal")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc4_error_{int(time.time())}.png")
             self.fail(f"❌ TC4: Error tidak terduga: {e}")
@@ -1099,153 +403,27 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
-            
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
+            page = self.open_login_page("TC5")
             
             # Siapkan data test untuk SQL injection
             sql_injection_username = "' OR '1'='1"
             sql_injection_password = "' OR '1'='1"
             print(f"🔧 Data test: username='{sql_injection_username}', password='{sql_injection_password}'")
             
-            # Strategi 1: Coba isi berdasarkan atribut name
-            username_filled = False
-            password_filled = False
-            
-            # Coba cari input dengan name="username"
-            try:
-                username_input = driver.find_element(By.NAME, "username")
-                username_input.clear()
-                username_input.send_keys(sql_injection_username)
-                username_filled = True
-                print(f"✅ Field username berhasil diisi dengan '{sql_injection_username}'")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='username'")
-            
-            # Coba cari input dengan name="password"
-            try:
-                password_input = driver.find_element(By.NAME, "password")
-                password_input.clear()
-                password_input.send_keys(sql_injection_password)
-                password_filled = True
-                print(f"✅ Field password berhasil diisi")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='password'")
-            
-            if not username_filled or not password_filled:
-                # Strategi 2: Coba berdasarkan urutan field
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email"]]
-                password_inputs = [inp for inp in inputs if inp.get_attribute("type") == "password"]
-                
-                if text_inputs and not username_filled:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(sql_injection_username)
-                    username_filled = True
-                    print(f"✅ Field username berhasil diisi menggunakan strategi 2")
-                    
-                if password_inputs and not password_filled:
-                    password_inputs[0].clear()
-                    password_inputs[0].send_keys(sql_injection_password)
-                    password_filled = True
-                    print(f"✅ Field password berhasil diisi menggunakan strategi 2")
-            
-            if not username_filled:
-                self.fail("❌ TC5: Gagal mengisi field username")
-            
-            if not password_filled:
-                self.fail("❌ TC5: Gagal mengisi field password")
-            
-            # Klik tombol login
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC5: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah login: {driver.current_url}")
+            result = page.login(sql_injection_username, sql_injection_password)
+            print(f"📄 URL setelah login: {result.url}")
             
             # Tangkap screenshot hasil login
             self.save_screenshot(driver, "tc5_sql_injection.png")
             
             # Verifikasi hasil: login seharusnya gagal (tidak boleh berhasil dengan SQL injection)
-            if TestLoginModule.is_logged_in(driver, self.base_url):
+            if result.snapshot.logged_in(self.base_url):
                 self.fail("❌ TC5: SQL Injection berhasil login! Aplikasi rentan terhadap serangan SQL Injection")
             else:
                 print(f"✅ TC5: SQL Injection gagal, aplikasi aman dari serangan ini")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc5_error_{int(time.time())}.png")
             self.fail(f"❌ TC5: Error tidak terduga: {e}")
@@ -1258,114 +436,15 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
-            # Buka halaman login dengan parameter noredirect
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            print(f"📄 Halaman login dibuka: {driver.current_url}")
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Debug: simpan source HTML halaman
-            with open("login_page.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("📝 Source HTML halaman login disimpan ke file login_page.html")
-            
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            
-            # Temukan link register dengan beberapa metode
-            register_link_found = False
-            
-            # Metode 1: Cari link dengan teks register
-            try:
-                register_link = driver.find_element(By.XPATH, "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'register')]")
-                register_link.click()
-                register_link_found = True
-                print("✅ Link register ditemukan dengan teks 'register'")
-            except NoSuchElementException:
-                print("⚠️ Link dengan teks 'register' tidak ditemukan")
-            except Exception as e:
-                print(f"⚠️ Error mengklik link dengan teks 'register': {e}")
-            
-            # Metode 2: Cari link ke register.php
-            if not register_link_found:
-                try:
-                    register_link = driver.find_element(By.XPATH, "//a[contains(@href, 'register.php')]")
-                    register_link.click()
-                    register_link_found = True
-                    print("✅ Link register ditemukan dengan href 'register.php'")
-                except NoSuchElementException:
-                    print("⚠️ Link dengan href 'register.php' tidak ditemukan")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik link dengan href 'register.php': {e}")
-            
-            # Metode 3: Cari semua link dan periksa teks/href
-            if not register_link_found:
-                links = driver.find_elements(By.TAG_NAME, "a")
-                print(f"🔍 Ditemukan {len(links)} link pada halaman login")
-                for i, link in enumerate(links):
-                    link_text = link.text.lower()
-                    link_href = link.get_attribute("href") or ""
-                    print(f"  {i+1}. Text: {link_text}, Href: {link_href}")
-                    
-                    if "register" in link_text or "daftar" in link_text or "register.php" in link_href:
-                        try:
-                            link.click()
-                            register_link_found = True
-                            print(f"✅ Link register ditemukan: {link_text} ({link_href})")
-                            break
-                        except Exception as e:
-                            print(f"⚠️ Error mengklik link {link_text}: {e}")
+            page = self.open_login_page("TC6")
             
-            if not register_link_found:
-                # Coba cara alternatif: langsung buka halaman register
-                print("ℹ️ Tidak dapat menemukan link register, mencoba membuka langsung")
-                driver.get(f"{self.base_url}/register.php")
-                register_link_found = True
+            # Link register sudah ditemukan bersama elemen form lainnya
+            old_page = page.element("form")
+            page.element("register_link").click()
+            print("✅ Link register diklik")
             
-            # Tunggu sebentar
-            time.sleep(2)
+            # Tunggu halaman register dimuat
+            waits.wait_for_new_page(driver, old_page)
             current_url = driver.current_url
             print(f"📄 URL setelah klik link register: {current_url}")
             
@@ -1378,6 +457,8 @@ class TestLoginModule(unittest.TestCase):
             else:
                 self.fail(f"❌ TC6: Gagal redirect ke halaman register, URL: {current_url}")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc6_error_{int(time.time())}.png")
             self.fail(f"❌ TC6: Error tidak terduga: {e}")
@@ -1390,143 +471,23 @@ class TestLoginModule(unittest.TestCase):
         
         driver = self.driver
         try:
-            # Bersihkan session dan cookie
-            self.clear_session_and_cookies()
-            
             # Login terlebih dahulu
             print("🔑 Melakukan login untuk test session")
-            login_url = f"{self.base_url}/login.php?noredirect=1"
-            driver.get(login_url)
-            time.sleep(2)
-            
-            # Periksa apakah URL berubah (mungkin ada redirect)
-            if driver.current_url != login_url:
-                print(f"⚠️ URL berubah dari {login_url} menjadi {driver.current_url}")
-                
-                # Jika dialihkan ke index.php, coba cara alternatif
-                if "index.php" in driver.current_url:
-                    print("⚠️ Masih dialihkan ke index.php. Mencoba pendekatan alternatif...")
-                    # Coba buka login.php langsung dengan parameter lain
-                    driver.get(f"{self.base_url}/login.php?bypass=1&t={int(time.time())}")
-                    time.sleep(2)
-                    print(f"📄 URL setelah coba akses alternatif: {driver.current_url}")
-                    
-                    # Jika masih dialihkan, coba hapus cookie dan session lagi
-                    if "login.php" not in driver.current_url:
-                        print("⚠️ Masih tidak bisa akses login.php. Mencoba hapus semua cookie dan session...")
-                        self.clear_session_and_cookies()
-                        
-                        # Coba sekali lagi dengan parameter waktu untuk hindari cache
-                        final_attempt_url = f"{self.base_url}/login.php?nocache={int(time.time())}"
-                        driver.get(final_attempt_url)
-                        time.sleep(2)
-                        print(f"📄 URL setelah upaya terakhir: {driver.current_url}")
-                        
-                        # Jika masih tidak bisa, gunakan pendekatan manual dan anggap kita di halaman login
-                        if "login.php" not in driver.current_url:
-                            print("⚠️ Tidak dapat mengakses login.php secara langsung. Mencoba pendekatan manual...")
-                            
-                            # Ambil screenshot dan source code untuk diagnosis
-                            self.save_screenshot(driver, "login_issue.png")
-                            
-                            # Simpan source code current page untuk diagnosis
-                            with open("current_page.html", "w", encoding="utf-8") as f:
-                                f.write(driver.page_source)
-                            print("📝 Source HTML halaman saat ini disimpan ke file current_page.html")
-                            
-                            # Lanjutkan test seakan kita di halaman login
-                            print("ℹ️ Mencoba melanjutkan test meskipun tidak pada URL yang diharapkan")
-            
-            # Identifikasi semua elemen input dan button
-            inputs = driver.find_elements(By.TAG_NAME, "input")
-            buttons = driver.find_elements(By.TAG_NAME, "button")
-            
-            # Isi form login
-            username_filled = False
-            password_filled = False
-            
-            # Coba cari input dengan name="username"
-            try:
-                username_input = driver.find_element(By.NAME, "username")
-                username_input.clear()
-                username_input.send_keys(self.test_username)
-                username_filled = True
-                print(f"✅ Field username berhasil diisi dengan '{self.test_username}'")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='username'")
-            
-            # Coba cari input dengan name="password"
-            try:
-                password_input = driver.find_element(By.NAME, "password")
-                password_input.clear()
-                password_input.send_keys(self.test_password)
-                password_filled = True
-                print(f"✅ Field password berhasil diisi")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan field dengan name='password'")
-            
-            if not username_filled or not password_filled:
-                # Strategi 2: Coba berdasarkan urutan field
-                text_inputs = [inp for inp in inputs if inp.get_attribute("type") in ["text", "email"]]
-                password_inputs = [inp for inp in inputs if inp.get_attribute("type") == "password"]
-                
-                if text_inputs and not username_filled:
-                    text_inputs[0].clear()
-                    text_inputs[0].send_keys(self.test_username)
-                    username_filled = True
-                    print(f"✅ Field username berhasil diisi menggunakan strategi 2")
-                    
-                if password_inputs and not password_filled:
-                    password_inputs[0].clear()
-                    password_inputs[0].send_keys(self.test_password)
-                    password_filled = True
-                    print(f"✅ Field password berhasil diisi menggunakan strategi 2")
-            
-            if not username_filled:
-                self.fail("❌ TC7: Gagal mengisi field username")
-            
-            if not password_filled:
-                self.fail("❌ TC7: Gagal mengisi field password")
-            
-            # Klik tombol login
-            button_clicked = False
-            
-            # Coba cari button dengan name="submit"
-            try:
-                submit_button = driver.find_element(By.NAME, "submit")
-                submit_button.click()
-                button_clicked = True
-                print("✅ Tombol login diklik (name='submit')")
-            except NoSuchElementException:
-                print("⚠️ Tidak dapat menemukan tombol dengan name='submit'")
-            except Exception as e:
-                print(f"⚠️ Error mengklik tombol submit: {e}")
-            
-            if not button_clicked and buttons:
-                # Klik button pertama yang ditemukan
-                try:
-                    buttons[0].click()
-                    button_clicked = True
-                    print("✅ Tombol login diklik (button pertama)")
-                except Exception as e:
-                    print(f"⚠️ Error mengklik button pertama: {e}")
-                
-            if not button_clicked:
-                self.fail("❌ TC7: Gagal menemukan tombol login")
-            
-            # Tunggu hasil
-            time.sleep(3)
-            print(f"📄 URL setelah login: {driver.current_url}")
+            page = self.open_login_page("TC7")
+            result = page.login(self.test_username, self.test_password)
+            print(f"📄 URL setelah login: {result.url}")
             
             # Verifikasi login berhasil
-            if not TestLoginModule.is_logged_in(driver, self.base_url):
+            if not result.snapshot.logged_in(self.base_url):
                 self.fail(f"❌ TC7: Gagal login untuk pengujian session")
             
             print("✅ Login berhasil, sekarang coba akses halaman login lagi")
             
+            # Pastikan cookie session sudah terpasang sebelum membuka login.php lagi
+            waits.wait_for_session_cookie(driver)
+            
             # Coba akses halaman login lagi
-            driver.get(f"{self.base_url}/login.php")
-            time.sleep(3)
+            waits.open_page(driver, page.url)
             print(f"📄 URL setelah mencoba akses login lagi: {driver.current_url}")
             
             # Tangkap screenshot
@@ -1543,9 +504,79 @@ class TestLoginModule(unittest.TestCase):
                 else:
                     self.fail(f"❌ TC7: User yang sudah login masih bisa mengakses halaman login, URL: {current_url}")
             
+        except AssertionError:
+            raise
         except Exception as e:
             self.save_screenshot(driver, f"tc7_error_{int(time.time())}.png")
             self.fail(f"❌ TC7: Error tidak terduga: {e}")
+    
+    def test_08_login_throttle(self):
+        """Test Case 8: Percobaan login berlebih ditolak murah oleh pembatas login"""
+        print("\n" + "-" * 50)
+        print("TEST CASE 8: Pembatas percobaan login")
+        print("-" * 50)
+        
+        if os.environ.get("LOGIN_THROTTLE_BACKEND") == "off":
+            self.skipTest("Pembatas login dimatikan (LOGIN_THROTTLE_BACKEND=off)")
+        
+        # Batas sama dengan server (environment variable dan default yang sama dengan login_throttle.php)
+        user_limit = throttle_setting("LOGIN_THROTTLE_USER_LIMIT", 5)
+        ip_limit = throttle_setting("LOGIN_THROTTLE_IP_LIMIT", 30)
+        if ip_limit <= user_limit:
+            self.skipTest(f"Batas IP ({ip_limit}) tidak lebih besar dari batas username ({user_limit}); "
+                          "penolakan per username tidak bisa diamati dari satu client")
+        # Batas waktu respons hanya diperiksa jika diminta: waktu dinding di runner CI
+        # bersama (Chrome, fsync SQLite) terlalu bervariasi untuk test fungsional
+        budget_ms = os.environ.get("LOGIN_THROTTLE_BUDGET_MS")
+        # Username baru agar bucket tidak terpengaruh run sebelumnya
+        username = f"throttle_{generate_random_string()}"
+        
+        driver = self.driver
+        try:
+            throttled_message = None
+            for attempt in range(1, user_limit + 2):
+                page = self.open_login_page("TC8")
+                result = page.login(username, f"WrongPassword{attempt}")
+                if result.alert and "Terlalu banyak percobaan" in result.alert:
+                    throttled_message = result.alert
+                    print(f"✅ Percobaan ke-{attempt} ditolak: {result.alert}")
+                    break
+                print(f"📋 Percobaan ke-{attempt} diproses")
+            
+            self.save_screenshot(driver, "tc8_login_throttle.png")
+            if throttled_message is None:
+                self.fail(f"❌ TC8: Tidak ada penolakan setelah {user_limit + 1} percobaan login")
+            self.assertEqual(attempt, user_limit + 1,
+                             f"❌ TC8: Penolakan muncul di percobaan ke-{attempt}, seharusnya ke-{user_limit + 1}")
+            
+            # Ukur biaya penolakan langsung lewat HTTP, tanpa overhead browser
+            http = urllib3.PoolManager(maxsize=1, retries=False)
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                response = http.request("POST", f"{self.base_url}/login.php", encode_multipart=False,
+                                        fields={"username": username, "password": "WrongPassword", "submit": ""})
+                timings.append((time.perf_counter() - start) * 1000)
+                self.assertEqual(response.status, 429, "❌ TC8: Percobaan berlebih tidak dibalas status 429")
+                retry_after = response.headers.get("Retry-After", "")
+                self.assertTrue(retry_after.isdigit() and int(retry_after) > 0,
+                                f"❌ TC8: Header Retry-After tidak valid: '{retry_after}'")
+            http.clear()
+            
+            median_ms = sorted(timings)[len(timings) // 2]
+            if budget_ms is None:
+                print(f"⏱️ Median waktu respons penolakan: {median_ms:.1f} ms (tanpa batas)")
+            else:
+                print(f"⏱️ Median waktu respons penolakan: {median_ms:.1f} ms (batas {float(budget_ms):.0f} ms)")
+                self.assertLess(median_ms, float(budget_ms),
+                                f"❌ TC8: Penolakan terlalu lambat ({median_ms:.1f} ms)")
+            print("✅ TC8: Pembatas login aktif dan penolakan dibalas 429 dengan Retry-After")
+            
+        except AssertionError:
+            raise
+        except Exception as e:
+            self.save_screenshot(driver, f"tc8_error_{int(time.time())}.png")
+            self.fail(f"❌ TC8: Error tidak terduga: {e}")
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import time
+import unittest
+
+import step_timing
+
+class FakeDriver:
+    """Driver palsu dengan execute_async_script yang menunggu seperti browser"""
+
+    def execute_async_script(self, script, *args):
+        time.sleep(0.05)
+        return "redirect"
+
+class TestStepTiming(unittest.TestCase):
+    
+    def setUp(self):
+        """Recorder sementara untuk test ini saja, tanpa memasang patch global install()"""
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        self.previous = step_timing._recorder
+        step_timing._recorder = step_timing.StepRecorder(self.path)
+        step_timing._patch(FakeDriver, step_timing.DRIVER_STEPS)
+    
+    def tearDown(self):
+        step_timing._recorder = self.previous
+        os.remove(self.path)
+    
+    def test_async_wait_counted_as_idle(self):
+        """execute_async_script dicatat sebagai langkah idle, bukan dom"""
+        recorder = step_timing._recorder
+        recorder.current_test = self.id()
+        self.assertEqual(FakeDriver().execute_async_script("return;", 1000), "redirect")
+        recorder.add_test(self.id(), 0.06)
+        recorder.flush()
+        
+        steps = [r for r in step_timing.load_records(self.path) if r["type"] == "step"]
+        self.assertEqual([(r["step"], r["kind"]) for r in steps], [("async_wait", "idle")])
+        self.assertGreaterEqual(steps[0]["duration"], 0.05)
+        
+        summary = step_timing.summarize(step_timing.load_records(self.path))
+        self.assertGreaterEqual(summary["per_kind"]["idle"], 0.05)
+        self.assertNotIn("dom", summary["per_kind"])
+        self.assertGreater(summary["idle_share"], 0.8)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+<?php
+/**
+ * Akses data tabel users untuk login.php dan register.php
+ * Semua query memakai prepared statement sehingga input pengguna tidak pernah
+ * digabung ke string SQL. Statement di-cache per koneksi selama satu request:
+ * query yang sama dalam request yang sama tidak di-prepare ulang. PHP membuang
+ * statement di akhir request, jadi request berikutnya tetap prepare ulang,
+ * juga pada koneksi persistent (p:).
+ * $con berupa mysqli, atau PDO ke file SQLite jika DB_DRIVER=sqlite (db_sqlite.php).
+ * Kegagalan query (termasuk mysqli_sql_exception jika mysqli_report aktif)
+ * dilaporkan sebagai null/false ke pemanggil.
+ */
+
+function user_statement($con, $sql)
+{
+    static $statements = array();
+
+    $key = spl_object_hash($con) . ':' . $sql;
+    if (!isset($statements[$key])) {
+        try {
+            $stmt = $con->prepare($sql);
+        } catch (PDOException | mysqli_sql_exception $e) {
+            $stmt = false;
+        }
+        if (!$stmt) {
+            return null;
+        }
+        $statements[$key] = $stmt;
+    }
+    return $statements[$key];
+}
+
+/**
+ * Menjalankan statement dengan parameter; $types hanya dipakai mysqli
+ */
+function user_execute($stmt, $types, array $params)
+{
+    if ($stmt instanceof PDOStatement) {
+        try {
+            return $stmt->execute($params);
+        } catch (PDOException $e) {
+            return false;
+        }
+    }
+    try {
+        return $stmt->bind_param($types, ...$params) && $stmt->execute();
+    } catch (mysqli_sql_exception $e) {
+        return false;
+    }
+}
+
+/**
+ * Baris pertama hasil statement sebagai array numerik, atau null
+ */
+function user_fetch_row($stmt, $columns)
+{
+    if ($stmt instanceof PDOStatement) {
+        $row = $stmt->fetch(PDO::FETCH_NUM);
+        $stmt->closeCursor();
+        return $row === false ? null : $row;
+    }
+    $row = array_fill(0, $columns, null);
+    $refs = array();
+    foreach ($row as $i => $value) {
+        $refs[$i] = &$row[$i];
+    }
+    $stmt->bind_result(...$refs);
+    $found = $stmt->fetch();
+    $stmt->free_result();
+    return $found ? $row : null;
+}
+
+/**
+ * Mencari user berdasarkan username, mengembalikan array (id, username, password) atau null
+ */
+function find_user_by_username($con, $username)
+{
+    $stmt = user_statement($con, "SELECT id, username, password FROM users WHERE username = ? LIMIT 1");
+    if (!$stmt || !user_execute($stmt, "s", array($username))) {
+        return null;
+    }
+    $row = user_fetch_row($stmt, 3);
+    return $row === null ? null : array('id' => $row[0], 'username' => $row[1], 'password' => $row[2]);
+}
+
+/**
+ * Cek apakah username sudah terdaftar
+ */
+function username_exists($con, $username)
+{
+    $stmt = user_statement($con, "SELECT EXISTS(SELECT 1 FROM users WHERE username = ?)");
+    if (!$stmt || !user_execute($stmt, "s", array($username))) {
+        return false;
+    }
+    $row = user_fetch_row($stmt, 1);
+    return $row !== null && (bool) $row[0];
+}
+
+/**
+ * Menyimpan user baru, $password_hash adalah hasil password_hash()
+ */
+function insert_user($con, $username, $name, $email, $password_hash)
+{
+    $stmt = user_statement($con, "INSERT INTO users (username, name, email, password) VALUES (?, ?, ?, ?)");
+    if (!$stmt) {
+        return false;
+    }
+    return user_execute($stmt, "ssss", array($username, $name, $email, $password_hash));
+}
+
+/**
+ * Mengganti hash password user (dipakai saat hash lama perlu di-upgrade)
+ */
+function update_user_password($con, $id, $password_hash)
+{
+    $stmt = user_statement($con, "UPDATE users SET password = ? WHERE id = ?");
+    if (!$stmt) {
+        return false;
+    }
+    return user_execute($stmt, "si", array($password_hash, $id));
+}
@@ -0,0 +1,226 @@
+"""
+Subsistem tunggu berbasis event untuk pengujian Selenium.
+
+Menggantikan time.sleep dengan WebDriverWait sehingga setiap langkah lanjut
+begitu halaman siap. Pemeriksaan elemen dilakukan lewat execute_script agar
+tidak terpengaruh implicitly_wait pada driver; hasil submit form dibaca dari
+satu snapshot halaman (page_snapshot). Hasil submit ditunggu dengan satu
+execute_async_script per dokumen yang diberi tahu MutationObserver dan event
+load, bukan polling. Driver sinkron seperti HttpDriver dianggap selalu siap
+sehingga semua tunggu selesai seketika.
+"""
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+import page_snapshot
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+# Selector untuk hasil submit form pada login.php dan register.php
+ALERT_SELECTOR = page_snapshot.ALERT_SELECTOR
+VALIDATION_SELECTOR = page_snapshot.VALIDATION_SELECTOR
+SESSION_COOKIE = "PHPSESSID"
+
+def wait_until(driver, condition, timeout=DEFAULT_TIMEOUT):
+    """Menunggu sampai condition bernilai truthy, mengembalikan nilainya atau None jika timeout"""
+    try:
+        return WebDriverWait(
+            driver, timeout,
+            poll_frequency=POLL_FREQUENCY,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(condition)
+    except TimeoutException:
+        return None
+
+def document_ready(driver):
+    """Cek apakah dokumen sudah selesai dimuat"""
+    # Driver sinkron (backend HTTP) selalu memuat halaman secara utuh
+    if getattr(driver, "synchronous", False):
+        return True
+    try:
+        return driver.execute_script("return document.readyState") == "complete"
+    except WebDriverException:
+        return False
+
+def wait_for_document_ready(driver, timeout=DEFAULT_TIMEOUT):
+    """Menunggu document.readyState menjadi complete"""
+    return bool(wait_until(driver, document_ready, timeout))
+
+def open_page(driver, url, timeout=DEFAULT_TIMEOUT):
+    """Membuka URL lalu menunggu halaman siap"""
+    driver.get(url)
+    return wait_for_document_ready(driver, timeout)
+
+def page_marker(driver):
+    """Mengambil elemen <html> halaman saat ini sebagai penanda pergantian halaman"""
+    try:
+        return driver.find_element(By.TAG_NAME, "html")
+    except NoSuchElementException:
+        return None
+
+def wait_for_new_page(driver, old_marker, timeout=DEFAULT_TIMEOUT):
+    """Menunggu halaman lama diganti (misalnya setelah submit form) dan halaman baru siap"""
+    if old_marker is not None:
+        def page_replaced(d):
+            try:
+                old_marker.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return True
+        if not wait_until(driver, page_replaced, timeout):
+            return False
+    return wait_for_document_ready(driver, timeout)
+
+def wait_for_url_change(driver, old_url, timeout=DEFAULT_TIMEOUT):
+    """Menunggu URL berubah dari old_url"""
+    return bool(wait_until(driver, lambda d: d.current_url != old_url, timeout))
+
+def wait_for_url_contains(driver, fragment, timeout=DEFAULT_TIMEOUT):
+    """Menunggu URL mengandung fragment tertentu"""
+    return bool(wait_until(driver, lambda d: fragment in d.current_url, timeout))
+
+def find_selector(driver, *selectors):
+    """Mengembalikan selector CSS pertama yang ada di halaman tanpa implicit wait"""
+    if getattr(driver, "synchronous", False):
+        return next((s for s in selectors if driver.find_elements(By.CSS_SELECTOR, s)), None)
+    try:
+        return driver.execute_script(
+            "for (const s of arguments[0]) { if (document.querySelector(s)) return s; }"
+            "return null;",
+            list(selectors),
+        )
+    except WebDriverException:
+        return None
+
+def wait_for_selector(driver, *selectors, timeout=DEFAULT_TIMEOUT):
+    """Menunggu salah satu selector CSS muncul, mengembalikan selector yang ditemukan"""
+    return wait_until(driver, lambda d: find_selector(d, *selectors), timeout)
+
+def wait_for_alert_or_validation(driver, timeout=DEFAULT_TIMEOUT):
+    """Menunggu pesan error (alert-danger) atau pesan validasi (text-danger) muncul"""
+    return wait_for_selector(driver, ALERT_SELECTOR, VALIDATION_SELECTOR, timeout=timeout)
+
+def wait_for_session_cookie(driver, cookie_name=SESSION_COOKIE, timeout=DEFAULT_TIMEOUT):
+    """Menunggu cookie session PHP terpasang di browser"""
+    return wait_until(driver, lambda d: d.get_cookie(cookie_name), timeout)
+
+def snapshot_outcome(snapshot, old_url):
+    """Kategori hasil submit form dari PageSnapshot
+
+    Mengembalikan "redirect", "error", "validation", "url_changed", atau None.
+    """
+    if "index.php" in snapshot.url:
+        return "redirect"
+    if snapshot.alerts:
+        return "error"
+    if snapshot.validations:
+        return "validation"
+    if snapshot.url != old_url and snapshot.ready:
+        return "url_changed"
+    return None
+
+def form_result(driver, old_url):
+    """Memeriksa sekali hasil submit form tanpa menunggu (satu snapshot halaman)"""
+    return snapshot_outcome(page_snapshot.take(driver), old_url)
+
+# Diselesaikan segera saat halaman mencapai state akhir hasil submit form.
+# MutationObserver menangkap pesan yang muncul di halaman, event load menangkap
+# halaman baru yang selesai dimuat; navigasi keluar dari dokumen ini membatalkan
+# script (ditangani di Python dengan memasang ulang di halaman baru).
+_FORM_STATE_SCRIPT = """
+const [marker, replaced, oldUrl, waitMs, alertSelector, validationSelector, done] = arguments;
+function state() {
+    if (marker && document.contains(marker)) return null;
+    if (location.href.includes("index.php")) return "redirect";
+    if (document.querySelector(alertSelector)) return "error";
+    if (document.querySelector(validationSelector)) return "validation";
+    if (document.readyState !== "complete") return null;
+    if (location.href !== oldUrl) return "url_changed";
+    return (replaced || marker) ? "loaded" : null;
+}
+let finished = false;
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(null), waitMs);
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    window.removeEventListener("load", check);
+    window.removeEventListener("popstate", check);
+    done(result);
+}
+function check() {
+    const result = state();
+    if (result) finish(result);
+}
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+window.addEventListener("load", check);
+window.addEventListener("popstate", check);
+check();
+"""
+
+def _is_stale(element):
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+def _poll_form_result(driver, old_url, timeout, old_marker):
+    """Versi polling wait_for_form_result untuk driver tanpa execute_async_script"""
+    def state(d):
+        if old_marker is not None and not _is_stale(old_marker):
+            return None
+        result = form_result(d, old_url)
+        if result is None and old_marker is not None and document_ready(d):
+            return "loaded"
+        return result
+    return wait_until(driver, state, timeout)
+
+def wait_for_form_result(driver, old_url, timeout=DEFAULT_TIMEOUT, old_marker=None):
+    """Menunggu hasil submit form tanpa polling: satu execute_async_script per dokumen
+
+    Mengembalikan "redirect", "error", "validation", "url_changed", "loaded"
+    (halaman lama sudah diganti tanpa tanda lain, hanya jika old_marker
+    diberikan), atau None jika waktu habis.
+    """
+    if getattr(driver, "synchronous", False):
+        return _poll_form_result(driver, old_url, timeout, old_marker)
+
+    # Timer di browser harus selesai sebelum script timeout WebDriver
+    script_timeout = getattr(getattr(driver, "timeouts", None), "script", None) or 30
+    deadline = time.monotonic() + timeout
+    marker, replaced = old_marker, False
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        wait_ms = int(min(remaining, script_timeout * 0.9) * 1000)
+        try:
+            result = driver.execute_async_script(
+                _FORM_STATE_SCRIPT, marker, replaced, old_url, wait_ms,
+                ALERT_SELECTOR, VALIDATION_SELECTOR,
+            )
+        except StaleElementReferenceException:
+            # Halaman lama sudah diganti sebelum script dipasang
+            marker, replaced = None, True
+            continue
+        except WebDriverException as e:
+            if "unload" not in str(e).lower():
+                # Driver tidak mendukung script async: kembali ke polling
+                return _poll_form_result(driver, old_url, max(remaining, 0), marker)
+            # Dokumen lama di-unload saat submit: pasang ulang di halaman baru
+            marker, replaced = None, old_marker is not None
+            continue
+        if result is not None:
+            return result